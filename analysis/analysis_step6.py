@@ -10,10 +10,63 @@ Performs comprehensive analysis of the closed-loop system:
 All matrices and parameters from verified implementation.
 """
 
+import sys
+
 import numpy as np
-import matplotlib.pyplot as plt
+# Figures are built directly (no pyplot state machine, no GUI backend) and
+# written as pages of a single PDF report.
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_pdf import PdfPages
+from functools import lru_cache
 from scipy import signal
-from numpy.linalg import eig
+from scipy.linalg import eigvals
+
+# ============================================================
+# FREQUENCY RESPONSE HELPER
+# ============================================================
+@lru_cache(maxsize=8)
+def _jw_powers(n, order):
+    """
+    Powers (jw)^k, k = order..0, on the fixed 0.01-1000 rad/s log grid.
+    
+    Computed once per grid and reused by every _bode call, so evaluating a
+    polynomial on the grid is a single matrix-vector product.
+    
+    Returns:
+        w, powers (n x (order+1), highest power first)
+    """
+    w = np.logspace(-2, 3, n)
+    powers = (1j * w)[:, None] ** np.arange(order, -1, -1)
+    return w, powers
+
+
+@lru_cache(maxsize=256)
+def _bode(num_bytes, den_bytes, n):
+    """
+    Bode response of num/den on a fixed log grid, memoised for gain sweeps.
+    
+    Polynomials are passed as float64 bytes (numOL.tobytes()) so they are
+    hashable; repeated calls with identical coefficients reuse the result.
+    The fixed 0.01-1000 rad/s grid (instead of scipy's pole-based adaptive
+    one) keeps runs reproducible. Returned arrays are shared between cache
+    hits and must not be modified in place.
+    
+    Args:
+        num_bytes: Numerator coefficients as float64 bytes
+        den_bytes: Denominator coefficients as float64 bytes
+        n: Number of frequency points
+    
+    Returns:
+        w, mag_db, phase_deg (same conventions as scipy.signal.bode)
+    """
+    num = np.frombuffer(num_bytes)
+    den = np.frombuffer(den_bytes)
+    w, powers = _jw_powers(n, max(len(num), len(den)) - 1)
+    H = (powers[:, -len(num):] @ num) / (powers[:, -len(den):] @ den)
+    mag = 20.0 * np.log10(np.abs(H))
+    phase = np.rad2deg(np.unwrap(np.angle(H)))
+    return w, mag, phase
+
 
 # ============================================================
 # PLANT MATRICES (From Verified Model)
@@ -51,14 +104,18 @@ K_state = -(Kp*C + Kd*C@A) / den
 K_int = Ki / den
 K_ref = Kp / den
 
+# B has a single nonzero entry (the voltage input drives di/dt only), so
+# B @ K_state only modifies row 0: write that row directly instead of
+# forming the 4x4 outer product.
+b0 = B[0, 0]
 A_cl = np.zeros((5,5))
-A_cl[0:4,0:4] = A + B @ K_state
-A_cl[0:4,4]   = (B * K_int).flatten()
-A_cl[4,0:4]   = -C
-A_cl[4,4]     = 0.0
+A_cl[0:4,0:4] = A
+A_cl[0,0:4]  += b0 * K_state[0]
+A_cl[0,4]     = b0 * K_int
+A_cl[4,0:4]   = -C[0]
 
 B_ref = np.zeros((5,1))
-B_ref[0:4,0] = (B * K_ref).flatten()
+B_ref[0,0] = b0 * K_ref
 B_ref[4,0] = 1.0
 
 C_cl = np.array([[0,0,0,0.01,0]])
@@ -74,19 +131,22 @@ print("\n" + "=" * 80)
 print("1. CLOSED-LOOP EIGENVALUES")
 print("=" * 80)
 
-eigvals = eig(A_cl)[0]
-eigvals_sorted = sorted(eigvals, key=lambda x: x.real)
+# Eigenvalues only (LAPACK geev without eigenvectors); work on a copy so
+# A_cl stays intact for the step response below.
+eigvals_arr = eigvals(A_cl.copy(), overwrite_a=True, check_finite=False)
+eigvals_sorted = eigvals_arr[np.argsort(eigvals_arr.real)]
 
 print("\nClosed-loop Poles:")
-for i, val in enumerate(eigvals_sorted, 1):
-    if abs(val.imag) < 1e-10:
-        print(f"  s{i} = {val.real:.6f}")
-    else:
-        sign = '+' if val.imag >= 0 else ''
-        print(f"  s{i} = {val.real:.6f} {sign}{val.imag:.6f}j")
+# Format every pole first, then emit them with a single write
+pole_lines = [
+    f"  s{i} = {val.real:.6f}" if abs(val.imag) < 1e-10
+    else f"  s{i} = {val.real:.6f} {'+' if val.imag >= 0 else ''}{val.imag:.6f}j"
+    for i, val in enumerate(eigvals_sorted, 1)
+]
+sys.stdout.write("\n".join(pole_lines) + "\n")
 
 # Check stability
-all_stable = all(pole.real < 0 for pole in eigvals)
+all_stable = all(pole.real < 0 for pole in eigvals_arr)
 print(f"\nSystem Stable: {all_stable}")
 if all_stable:
     print("✓ All poles in left half-plane")
@@ -100,27 +160,50 @@ print("\n" + "=" * 80)
 print("2. STEP RESPONSE ANALYSIS")
 print("=" * 80)
 
-sys_cl = signal.StateSpace(A_cl, B_ref, C_cl, 0)
+# A_cl is constant and diagonalisable, so the unit-step response has the
+# closed form x(t) = V diag((exp(lam*t) - 1)/lam) V^-1 B_ref (x(0) = 0);
+# evaluate it over the whole time grid at once instead of integrating.
 t = np.linspace(0, 15, 2000)
-t, y = signal.step(sys_cl, T=t)
+lam, V = np.linalg.eig(A_cl)
+modal_in = np.linalg.solve(V, B_ref[:, 0])          # V^-1 B_ref
+modal_out = (C_cl @ V)[0]                            # C_cl V
+y = np.real((modal_out * modal_in / lam) @ np.expm1(np.outer(lam, t)))
 
 # Compute metrics
 final_value = y[-1]
 peak_value = np.max(y)
 overshoot = (peak_value - final_value) / final_value * 100
 
-# Settling time (2% band)
-within_band = np.where(np.abs(y - final_value) <= 0.02*final_value)[0]
-settling_time = t[within_band[0]] if len(within_band) > 0 else None
+# Threshold crossings are linearly interpolated between the two samples
+# that straddle them, so the metrics are not quantised to the time grid.
+def _crossing_time(t, f, i):
+    """Time where f crosses zero between samples i-1 and i (linear)."""
+    return t[i-1] + f[i-1] / (f[i-1] - f[i]) * (t[i] - t[i-1])
+
+# Settling time (2% band): last exit from the band
+band_excess = np.abs(y - final_value) - 0.02*final_value
+outside = band_excess > 0
+last_out = len(y) - 1 - np.argmax(outside[::-1])
+if not outside[last_out]:
+    settling_time = t[0]
+elif last_out + 1 < len(t):
+    settling_time = _crossing_time(t, band_excess, last_out + 1)
+else:
+    settling_time = None
 
-# Rise time (10% to 90%)
+# Rise time (10% to 90%); argmax stops at the first True without
+# materialising an index array
 val_10 = 0.1 * final_value
 val_90 = 0.9 * final_value
-idx_10 = np.where(y >= val_10)[0]
-idx_90 = np.where(y >= val_90)[0]
+above_10 = y >= val_10
+above_90 = y >= val_90
 rise_time = None
-if len(idx_10) > 0 and len(idx_90) > 0:
-    rise_time = t[idx_90[0]] - t[idx_10[0]]
+if above_10.any() and above_90.any():
+    i10 = np.argmax(above_10)
+    i90 = np.argmax(above_90)
+    t10 = _crossing_time(t, y - val_10, i10) if i10 > 0 else t[0]
+    t90 = _crossing_time(t, y - val_90, i90) if i90 > 0 else t[0]
+    rise_time = t90 - t10
 
 print("\nStep Response Metrics:")
 print(f"  Final Value: {final_value:.6f}")
@@ -130,69 +213,73 @@ print(f"  Settling Time (2%): {settling_time:.3f} s" if settling_time else "  Se
 print(f"  Rise Time (10%-90%): {rise_time:.3f} s" if rise_time else "  Rise Time: N/A")
 
 # Plot step response
-plt.figure(figsize=(10, 6))
-plt.plot(t, y, 'b-', linewidth=2, label='Pressure Response')
-plt.axhline(y=final_value, color='r', linestyle='--', alpha=0.5, label='Final Value')
-plt.axhline(y=final_value*1.02, color='g', linestyle=':', alpha=0.3, label='±2% Band')
-plt.axhline(y=final_value*0.98, color='g', linestyle=':', alpha=0.3)
-plt.title("Closed-Loop Step Response", fontsize=14, fontweight='bold')
-plt.xlabel("Time (s)", fontsize=12)
-plt.ylabel("Pressure Output (bar)", fontsize=12)
-plt.grid(True, alpha=0.3)
-plt.legend()
-plt.tight_layout()
-plt.savefig('step_response.png', dpi=150)
-print("\n✓ Step response plot saved as 'step_response.png'")
-
-# ============================================================
-# 3️⃣ Open-Loop Transfer Function for Bode
-# ============================================================
-print("\n" + "=" * 80)
-print("3. BODE PLOT ANALYSIS")
-print("=" * 80)
-
-# Open-loop: G(s)*PID(s)
-plant = signal.StateSpace(A, B, C, 0)
-G = signal.ss2tf(A, B, C, 0)
-numG = G[0][0]
-denG = G[1]
-
-# PID Transfer Function
-numPID = [Kd, Kp, Ki]
-denPID = [1, 0]
-
-# Convolution for open-loop
-numOL = np.convolve(numPID, numG)
-denOL = np.convolve(denPID, denG)
-sys_ol = signal.TransferFunction(numOL, denOL)
-
-w, mag, phase = signal.bode(sys_ol)
-
-# Plot Bode magnitude
-plt.figure(figsize=(10, 5))
-plt.semilogx(w, mag, 'b-', linewidth=2)
-plt.axhline(y=0, color='r', linestyle='--', alpha=0.5, label='0 dB')
-plt.title("Open-Loop Bode Magnitude", fontsize=14, fontweight='bold')
-plt.xlabel("Frequency (rad/s)", fontsize=12)
-plt.ylabel("Magnitude (dB)", fontsize=12)
-plt.grid(True, which='both', alpha=0.3)
-plt.legend()
-plt.tight_layout()
-plt.savefig('bode_magnitude.png', dpi=150)
-print("\n✓ Bode magnitude plot saved as 'bode_magnitude.png'")
-
-# Plot Bode phase
-plt.figure(figsize=(10, 5))
-plt.semilogx(w, phase, 'b-', linewidth=2)
-plt.axhline(y=-180, color='r', linestyle='--', alpha=0.5, label='-180°')
-plt.title("Open-Loop Bode Phase", fontsize=14, fontweight='bold')
-plt.xlabel("Frequency (rad/s)", fontsize=12)
-plt.ylabel("Phase (degrees)", fontsize=12)
-plt.grid(True, which='both', alpha=0.3)
-plt.legend()
-plt.tight_layout()
-plt.savefig('bode_phase.png', dpi=150)
-print("✓ Bode phase plot saved as 'bode_phase.png'")
+# All plots go into one multi-page PDF: one file, one font subset, one
+# compression stream instead of a PNG encode per figure.
+with PdfPages('analysis_report.pdf') as report:
+    fig = Figure(figsize=(10, 6))
+    ax = fig.subplots()
+    ax.plot(t, y, 'b-', linewidth=2, label='Pressure Response')
+    ax.axhline(y=final_value, color='r', linestyle='--', alpha=0.5, label='Final Value')
+    ax.axhline(y=final_value*1.02, color='g', linestyle=':', alpha=0.3, label='±2% Band')
+    ax.axhline(y=final_value*0.98, color='g', linestyle=':', alpha=0.3)
+    ax.set_title("Closed-Loop Step Response", fontsize=14, fontweight='bold')
+    ax.set_xlabel("Time (s)", fontsize=12)
+    ax.set_ylabel("Pressure Output (bar)", fontsize=12)
+    ax.grid(True, alpha=0.3)
+    ax.legend()
+    fig.tight_layout()
+    report.savefig(fig)
+    del fig
+    print("\n✓ Step response plot added to 'analysis_report.pdf'")
+
+    # ============================================================
+    # 3️⃣ Open-Loop Transfer Function for Bode
+    # ============================================================
+    print("\n" + "=" * 80)
+    print("3. BODE PLOT ANALYSIS")
+    print("=" * 80)
+
+    # Open-loop: G(s)*PID(s)
+    # The plant is a chain: V -> i -> omega -> theta -> P -> sensor, so its
+    # transfer function follows directly from the matrix entries without the
+    # general ss2tf algorithm:
+    #   G(s) = C3*A32*A21*A10*B0 / ( s (s - A33) (s^2 - A00 s - A01 A10) )
+    numG = np.array([C[0,3] * A[3,2] * A[2,1] * A[1,0] * B[0,0]])
+    denG = np.polymul(np.polymul([1.0, 0.0], [1.0, -A[3,3]]),
+                      [1.0, -A[0,0], -A[0,1] * A[1,0]])
+
+    # PID Transfer Function
+    numPID = [Kd, Kp, Ki]
+    denPID = [1, 0]
+
+    # Convolution for open-loop (direct method is optimal at this order)
+    numOL = signal.convolve(numPID, numG, method='direct')
+    denOL = signal.convolve(denPID, denG, method='direct')
+
+    w, mag, phase = _bode(numOL.tobytes(), denOL.tobytes(), 2000)
+
+    # Plot Bode magnitude and phase on one shared-frequency figure
+    fig = Figure(figsize=(10, 8))
+    ax_mag, ax_phase = fig.subplots(2, 1, sharex=True)
+    ax_mag.semilogx(w, mag, 'b-', linewidth=2)
+    ax_mag.axhline(y=0, color='r', linestyle='--', alpha=0.5, label='0 dB')
+    ax_mag.set_title("Open-Loop Bode Magnitude", fontsize=14, fontweight='bold')
+    ax_mag.set_ylabel("Magnitude (dB)", fontsize=12)
+    ax_mag.grid(True, which='both', alpha=0.3)
+    ax_mag.legend()
+
+    ax_phase.semilogx(w, phase, 'b-', linewidth=2)
+    ax_phase.axhline(y=-180, color='r', linestyle='--', alpha=0.5, label='-180°')
+    ax_phase.set_title("Open-Loop Bode Phase", fontsize=14, fontweight='bold')
+    ax_phase.set_xlabel("Frequency (rad/s)", fontsize=12)
+    ax_phase.set_ylabel("Phase (degrees)", fontsize=12)
+    ax_phase.grid(True, which='both', alpha=0.3)
+    ax_phase.legend()
+
+    fig.tight_layout()
+    report.savefig(fig)
+    del fig
+print("\n✓ Bode plot added to 'analysis_report.pdf'")
 
 # ============================================================
 # 4️⃣ Gain & Phase Margins
@@ -202,8 +289,11 @@ print("4. STABILITY MARGINS")
 print("=" * 80)
 
 # Compute margins manually from Bode data
+# Sign changes are detected on 1-byte signbit masks (XOR of neighbours)
+# rather than float sign arrays and np.diff.
 # Gain crossover: where |G(jw)| = 1 (0 dB)
-idx_gc = np.where(np.diff(np.sign(mag)))[0]
+sb_mag = np.signbit(mag)
+idx_gc = np.flatnonzero(sb_mag[1:] ^ sb_mag[:-1])
 if len(idx_gc) > 0:
     wg = w[idx_gc[0]]
     phase_at_gc = phase[idx_gc[0]]
@@ -213,7 +303,8 @@ else:
     pm = None
 
 # Phase crossover: where phase = -180°
-idx_pc = np.where(np.diff(np.sign(phase + 180)))[0]
+sb_phase = np.signbit(phase + 180.0)
+idx_pc = np.flatnonzero(sb_phase[1:] ^ sb_phase[:-1])
 if len(idx_pc) > 0:
     wp = w[idx_pc[0]]
     mag_at_pc = mag[idx_pc[0]]
@@ -265,6 +356,3 @@ else:
 print("\n" + "=" * 80)
 print("ANALYSIS COMPLETE")
 print("=" * 80)
-
-# Show all plots
-plt.show()
@@ -44,15 +44,48 @@ class BodeAnalysis:
         """
         Compute Bode plot data.
         
+        The system is diagonalised once, A = V diag(λ) V^-1, so that
+        H(jw) = C V diag(1/(jw - λ)) V^-1 B + D is a broadcast reciprocal per
+        frequency instead of one linear solve per frequency. If A is (close
+        to) defective, e.g. the repeated integrator poles at s = 0 of a PID
+        open loop, V is ill-conditioned and the resolvent is solved directly.
+        
         Args:
-            w_range: Frequency range for Bode plot (rad/s)
+            w_range: Frequencies for the Bode plot (rad/s): None for the
+                default 0.01-1000 rad/s log grid, a (w_min, w_max) tuple
+                for 1000 log-spaced points over that range, or an explicit
+                frequency array/list (used as given, whatever its length)
         
         Returns:
             frequencies: Frequency array (rad/s)
             magnitude: Magnitude array (dB)
             phase: Phase array (deg)
         """
-        pass
+        if w_range is None:
+            w = np.logspace(-2, 3, 1000)
+        elif isinstance(w_range, tuple):
+            w = np.logspace(np.log10(w_range[0]), np.log10(w_range[1]), 1000)
+        else:
+            w = np.asarray(w_range, dtype=float)
+        
+        ss = self.sys_ol.to_ss()
+        A, B, C, D = ss.A, ss.B[:, 0], ss.C[0], ss.D[0, 0]
+        jw = 1j * w
+        
+        lam, V = np.linalg.eig(A)
+        if np.linalg.cond(V) < 1e8:
+            Vi_B = np.linalg.solve(V, B)
+            CV = C @ V
+            resolvent = 1.0 / (jw[:, None] - lam[None, :])  # (Nw, n)
+            H = resolvent @ (CV * Vi_B) + D
+        else:
+            n = A.shape[0]
+            H = np.linalg.solve(jw[:, None, None] * np.eye(n) - A, B) @ C + D
+        
+        self.frequencies = w
+        self.magnitude = 20.0 * np.log10(np.abs(H))
+        self.phase = np.rad2deg(np.unwrap(np.angle(H)))
+        return self.frequencies, self.magnitude, self.phase
     
     def compute_stability_margins(self):
         """
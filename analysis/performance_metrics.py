@@ -13,6 +13,53 @@ Expected performance from final_verified_results_section.md:
 import numpy as np
 
 
+# ===================================================================
+# NUMERIC CORES
+# Pure array functions shared by the PerformanceMetrics methods. They
+# operate along the last axis, so a whole Monte-Carlo batch of responses
+# (shape (n_trials, n_samples)) is scanned in one call instead of one
+# Python-level call per trial.
+# ===================================================================
+
+def _as_result(value):
+    """Return a Python float for scalar results, the array otherwise."""
+    value = np.asarray(value)
+    return float(value) if value.ndim == 0 else value
+
+
+def _first_true(mask):
+    """
+    Index of the first True along the last axis and whether one exists.
+    
+    np.argmax stops at the first True, so no index array is materialised.
+    """
+    return np.argmax(mask, axis=-1), mask.any(axis=-1)
+
+
+def _settling_time_core(t, y, setpoint, tol):
+    """Time after the last sample outside the +/- tol*setpoint band (NaN if none)."""
+    outside = np.abs(y - setpoint) > tol * abs(setpoint)
+    n = outside.shape[-1]
+    last_out = n - 1 - np.argmax(outside[..., ::-1], axis=-1)
+    ever_out = outside.any(axis=-1)
+    settled_idx = np.where(ever_out, last_out + 1, 0)
+    settled = settled_idx < n
+    return np.where(settled, t[np.minimum(settled_idx, n - 1)], np.nan)
+
+
+def _overshoot_core(y, setpoint):
+    """Percent overshoot of the peak above setpoint (0 if never exceeded)."""
+    peak = np.max(y, axis=-1)
+    return np.maximum((peak - setpoint) / setpoint * 100.0, 0.0)
+
+
+def _rise_time_core(t, y, setpoint, lower, upper):
+    """Time between the first lower and upper threshold crossings (NaN if not reached)."""
+    i_lo, hit_lo = _first_true(y >= lower * setpoint)
+    i_hi, hit_hi = _first_true(y >= upper * setpoint)
+    return np.where(hit_lo & hit_hi, t[i_hi] - t[i_lo], np.nan)
+
+
 class PerformanceMetrics:
     """
     Time-domain performance metric computation.
@@ -39,9 +86,12 @@ class PerformanceMetrics:
             tolerance: Settling tolerance (fraction of setpoint)
         
         Returns:
-            settling_time: Settling time (s)
+            settling_time: Settling time (s), NaN if the response never
+                settles. Batched y (trials along leading axes) returns an array.
         """
-        pass
+        t = np.asarray(t, dtype=float)
+        y = np.asarray(y, dtype=float)
+        return _as_result(_settling_time_core(t, y, setpoint, tolerance))
     
     def compute_overshoot(self, y, setpoint):
         """
@@ -54,7 +104,8 @@ class PerformanceMetrics:
         Returns:
             overshoot_percent: Percent overshoot (%)
         """
-        pass
+        y = np.asarray(y, dtype=float)
+        return _as_result(_overshoot_core(y, setpoint))
     
     def compute_steady_state_error(self, y, setpoint, t_start=None):
         """
@@ -83,9 +134,11 @@ class PerformanceMetrics:
             upper: Upper threshold (fraction of setpoint)
         
         Returns:
-            rise_time: Rise time (s)
+            rise_time: Rise time (s), NaN if the upper threshold is never reached
         """
-        pass
+        t = np.asarray(t, dtype=float)
+        y = np.asarray(y, dtype=float)
+        return _as_result(_rise_time_core(t, y, setpoint, lower, upper))
     
     def validate_performance(self, metrics):
         """
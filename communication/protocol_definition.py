@@ -19,6 +19,25 @@ import json
 from dataclasses import dataclass, asdict
 from typing import Optional
 
+try:
+    import orjson  # Optional fast path; falls back to the stdlib json module
+except ImportError:
+    orjson = None
+
+
+def _dumps(obj):
+    """Serialize obj to a compact JSON string (orjson when available)."""
+    if orjson is not None:
+        return orjson.dumps(obj).decode()
+    return json.dumps(obj, separators=(',', ':'))
+
+
+def _loads(json_string):
+    """Parse a JSON string or bytes (orjson when available)."""
+    if orjson is not None:
+        return orjson.loads(json_string)
+    return json.loads(json_string)
+
 
 @dataclass
 class SystemState:
@@ -28,6 +47,11 @@ class SystemState:
     References:
     - numerical_state_space_and_simulation_specification.md: Section 8
     """
+    # Declared by hand: dataclass(slots=True) needs Python 3.10. Fields
+    # have no defaults, so they do not clash with the slot descriptors.
+    __slots__ = ('timestamp', 'pressure', 'valve_angle', 'motor_current',
+                 'motor_velocity', 'control_voltage', 'setpoint')
+    
     timestamp: float  # Simulation time (s)
     pressure: float  # Current pressure (bar)
     valve_angle: float  # Valve angle (rad)
@@ -40,10 +64,17 @@ class SystemState:
         """
         Serialize to JSON string.
         
+        The state is sent as a positional array in field declaration order
+        (timestamp, pressure, valve_angle, motor_current, motor_velocity,
+        control_voltage, setpoint) rather than an object: no asdict() copy
+        and no repeated key names on the hot GUI update path.
+        
         Returns:
             json_string: JSON representation
         """
-        pass
+        return _dumps((self.timestamp, self.pressure, self.valve_angle,
+                       self.motor_current, self.motor_velocity,
+                       self.control_voltage, self.setpoint))
     
     @classmethod
     def from_json(cls, json_string):
@@ -51,12 +82,12 @@ class SystemState:
         Deserialize from JSON string.
         
         Args:
-            json_string: JSON representation
+            json_string: JSON representation (str or bytes)
         
         Returns:
             SystemState instance
         """
-        pass
+        return cls(*_loads(json_string))
 
 
 @dataclass
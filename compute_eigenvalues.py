@@ -3,6 +3,7 @@ Compute eigenvalues of closed-loop A matrix.
 """
 
 import numpy as np
+from scipy.linalg import eigvals
 import sys
 import os
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
@@ -15,11 +16,11 @@ cl_system = ClosedLoopSystem()
 # Get closed-loop A matrix
 A_cl = cl_system.A_cl
 
-# Compute eigenvalues
-eigenvalues = np.linalg.eigvals(A_cl)
+# Compute eigenvalues (copy: overwrite_a must not clobber cl_system.A_cl)
+eigenvalues = eigvals(A_cl.copy(), overwrite_a=True, check_finite=False)
 
 # Sort by real part (most negative first)
-eigenvalues = sorted(eigenvalues, key=lambda x: x.real)
+eigenvalues = eigenvalues[np.argsort(eigenvalues.real)]
 
 print("=" * 70)
 print("CLOSED-LOOP EIGENVALUES (POLES)")
@@ -31,10 +32,12 @@ print(f"  Kd = {cl_system.Kd}")
 print(f"  Ks = {cl_system.Ks}")
 
 print("\nClosed-Loop Poles:")
-for i, pole in enumerate(eigenvalues, 1):
-    if abs(pole.imag) < 1e-10:
-        print(f"  s{i} = {pole.real:.6f}")
-    else:
-        print(f"  s{i} = {pole.real:.6f} {'+' if pole.imag >= 0 else ''}{pole.imag:.6f}j")
+# Format every pole first, then emit them with a single write
+pole_lines = [
+    f"  s{i} = {pole.real:.6f}" if abs(pole.imag) < 1e-10
+    else f"  s{i} = {pole.real:.6f} {'+' if pole.imag >= 0 else ''}{pole.imag:.6f}j"
+    for i, pole in enumerate(eigenvalues, 1)
+]
+sys.stdout.write("\n".join(pole_lines) + "\n")
 
 print("\n" + "=" * 70)
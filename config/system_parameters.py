@@ -15,6 +15,27 @@ References are provided inline for each parameter.
 import numpy as np
 
 
+# ===================================================================
+# DERIVED CONSTANTS (computed once at import)
+# All inputs are documented literals, so the derived quantities never
+# change between instances. Formulas and references are repeated in
+# SystemParameters.__init__ where the values are assigned.
+# ===================================================================
+_M_VALVE = 100.0
+_R_VALVE = 0.35
+_TAU_FRICTION = 120.0
+_G = 9.81
+_N = 40
+_ETA = 0.85
+_J_M = 0.02
+
+_J_VALVE = 0.5 * _M_VALVE * _R_VALVE**2
+_TAU_GRAVITY = _M_VALVE * _G * _R_VALVE
+_TAU_LOAD_TOTAL = _TAU_GRAVITY + _TAU_FRICTION
+_J_REF = _J_VALVE / (_ETA * _N**2)
+_J_TOTAL = _J_M + _J_REF
+
+
 class SystemParameters:
     """
     Centralized repository for all system parameters.
@@ -23,6 +44,19 @@ class SystemParameters:
     Derived quantities are computed using documented formulas.
     """
     
+    # Fixed attribute set: no per-instance __dict__, and slot descriptors
+    # for the params.X reads done inside simulation loops.
+    __slots__ = (
+        'm_valve', 'r_valve', 'tau_friction', 'g',
+        'J_valve', 'tau_gravity', 'tau_load_total',
+        'N', 'eta',
+        'R', 'L', 'Kt', 'Ke', 'V_supply',
+        'J_m', 'J_ref', 'J_total',
+        'P_min', 'P_max', 'P_setpoint', 'Kp_pressure', 'tau_p',
+        'Ks',
+        'Kp', 'Ki', 'Kd',
+    )
+    
     def __init__(self):
         """
         Initialize all system parameters from documentation.
@@ -32,31 +66,31 @@ class SystemParameters:
         # Reference: industrial_pressure_control_system_design.md Section 1.1
         # Reference: numerical_state_space_and_simulation_specification.md Section 1.1
         # ===================================================================
-        self.m_valve = 100.0  # Valve mass (kg)
-        self.r_valve = 0.35  # Valve radius (m)
-        self.tau_friction = 120.0  # Static friction torque (Nm)
-        self.g = 9.81  # Gravitational acceleration (m/s²)
+        self.m_valve = _M_VALVE  # Valve mass (kg)
+        self.r_valve = _R_VALVE  # Valve radius (m)
+        self.tau_friction = _TAU_FRICTION  # Static friction torque (Nm)
+        self.g = _G  # Gravitational acceleration (m/s²)
         
         # Computed valve parameters
         # Formula: J_valve = (1/2) * m * r^2
         # Reference: industrial_pressure_control_system_design.md Section 1.1
-        self.J_valve = 0.5 * self.m_valve * self.r_valve**2  # Expected: 6.125 kg·m²
+        self.J_valve = _J_VALVE  # Expected: 6.125 kg·m²
         
         # Formula: τ_g = m * g * r
         # Reference: industrial_pressure_control_system_design.md Section 1.2
-        self.tau_gravity = self.m_valve * self.g * self.r_valve  # Expected: 343.35 Nm
+        self.tau_gravity = _TAU_GRAVITY  # Expected: 343.35 Nm
         
         # Formula: τ_load = τ_g + τ_f
         # Reference: industrial_pressure_control_system_design.md Section 1.2
-        self.tau_load_total = self.tau_gravity + self.tau_friction  # Expected: 463.35 Nm
+        self.tau_load_total = _TAU_LOAD_TOTAL  # Expected: 463.35 Nm
         
         # ===================================================================
         # GEARBOX PARAMETERS
         # Reference: industrial_pressure_control_system_design.md Section 1.3
         # Reference: numerical_state_space_and_simulation_specification.md Section 1.1
         # ===================================================================
-        self.N = 40  # Gear ratio
-        self.eta = 0.85  # Gear efficiency
+        self.N = _N  # Gear ratio
+        self.eta = _ETA  # Gear efficiency
         
         # ===================================================================
         # MOTOR ELECTRICAL PARAMETERS
@@ -72,16 +106,16 @@ class SystemParameters:
         # MOTOR MECHANICAL PARAMETERS
         # Reference: numerical_state_space_and_simulation_specification.md Section 1.1
         # ===================================================================
-        self.J_m = 0.02  # Motor inertia (kg·m²)
+        self.J_m = _J_M  # Motor inertia (kg·m²)
         
         # Computed inertia parameters
         # Formula: J_ref = J_valve / (η * N^2)
         # Reference: numerical_state_space_and_simulation_specification.md Section 1.1
-        self.J_ref = self.J_valve / (self.eta * self.N**2)
+        self.J_ref = _J_REF
         
         # Formula: J_total = J_m + J_ref
         # Reference: numerical_state_space_and_simulation_specification.md Section 1.1
-        self.J_total = self.J_m + self.J_ref
+        self.J_total = _J_TOTAL
         
         # ===================================================================
         # PRESSURE SYSTEM PARAMETERS
@@ -46,15 +46,73 @@ D = 0
 """
 
 import numpy as np
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from functools import cache, lru_cache
+
+if __name__ == "__main__":
+    # Run as a script (python models/full_state_space_model.py): put the package root on
+    # sys.path so the absolute imports below resolve
+    import sys
+    import os
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from config.system_parameters import params
 from models.motor_model import MotorModel
 from models.pressure_model import PressureModel
 
 
+@lru_cache(maxsize=8)
+def _build_plant_matrices(R, L, Ke, Kt, J_total, Kp_pressure, N, tau_p, Ks):
+    """
+    Build the plant A, B, C, D matrices (memoised on the parameter values).
+    
+    The parameters are FROZEN, so every FullStateSpaceModel shares one cached
+    result. The returned arrays are read-only, callers copy them.
+    
+    Returns:
+        A, B, C, D (read-only)
+    """
+    A = np.array([
+        [-R / L,  -Ke / L,  0.0,  0.0],
+        [Kt / J_total,  0.0,  0.0,  0.0],
+        [0.0,  1.0,  0.0,  0.0],
+        [0.0,  0.0,  Kp_pressure / (N * tau_p),  -1.0 / tau_p]
+    ])
+    B = np.array([[1.0 / L], [0.0], [0.0], [0.0]])
+    C = np.array([[0.0, 0.0, 0.0, Ks]])
+    D = np.array([[0.0]])
+    
+    for M in (A, B, C, D):
+        M.setflags(write=False)
+    return A, B, C, D
+
+
+def _plant_rhs(A, B, x, U):
+    """
+    Hand-unrolled dX/dt = A X + B U on Python floats.
+    
+    A, B and x are nested lists (ndarray.tolist()), so the arithmetic runs
+    without NumPy scalar boxing or matmul dispatch. All 16 entries of A are
+    used, so an edited matrix (including its structural zeros) is honoured.
+    
+    Args:
+        A: Plant matrix rows, 4 lists of 4 floats
+        B: Input matrix rows, 4 lists of 1 float
+        x: State [i, ω, θm, P] as 4 floats
+        U: Input voltage (V)
+    
+    Returns:
+        Tuple of the four state derivatives
+    """
+    x0, x1, x2, x3 = x
+    (a00, a01, a02, a03), (a10, a11, a12, a13), \
+        (a20, a21, a22, a23), (a30, a31, a32, a33) = A
+    (b0,), (b1,), (b2,), (b3,) = B
+    return (a00*x0 + a01*x1 + a02*x2 + a03*x3 + b0*U,
+            a10*x0 + a11*x1 + a12*x2 + a13*x3 + b1*U,
+            a20*x0 + a21*x1 + a22*x2 + a23*x3 + b2*U,
+            a30*x0 + a31*x1 + a32*x2 + a33*x3 + b3*U)
+
+
 class FullStateSpaceModel:
     """
     Complete 4-state system model.
@@ -63,10 +121,18 @@ class FullStateSpaceModel:
     - numerical_state_space_and_simulation_specification.md: Section 3, 4
     """
     
-    def __init__(self):
+    def __init__(self, dtype=np.float64):
         """
         Initialize full state-space model from centralized parameters.
+        
+        Args:
+            dtype: Floating dtype of the stored A, B, C, D matrices. float32
+                halves the footprint of large batches (e.g. gain sweeps); the
+                eigenvalue error this introduces is reported by
+                validate_matrices.
         """
+        self.dtype = np.dtype(dtype)
+        
         # Load parameters
         self.R = params.R
         self.L = params.L
@@ -125,27 +191,16 @@ class FullStateSpaceModel:
         Returns:
             A, B, C, D: State-space matrices
         """
-        # Build A matrix (4x4)
-        self.A = np.array([
-            [-self.R / self.L,  -self.Ke / self.L,  0.0,  0.0],
-            [self.Kt / self.J_total,  0.0,  0.0,  0.0],
-            [0.0,  1.0,  0.0,  0.0],
-            [0.0,  0.0,  self.Kp_pressure / (self.N * self.tau_p),  -1.0 / self.tau_p]
-        ])
-        
-        # Build B matrix (4x1)
-        self.B = np.array([
-            [1.0 / self.L],
-            [0.0],
-            [0.0],
-            [0.0]
-        ])
-        
-        # Build C matrix (1x4)
-        self.C = np.array([[0.0, 0.0, 0.0, self.Ks]])
-        
-        # Build D scalar
-        self.D = np.array([[0.0]])
+        # Matrices are built once per parameter set (see _build_plant_matrices)
+        # in float64; each instance gets writable copies in its own dtype
+        A, B, C, D = _build_plant_matrices(
+            self.R, self.L, self.Ke, self.Kt, self.J_total,
+            self.Kp_pressure, self.N, self.tau_p, self.Ks)
+        
+        self.A = A.astype(self.dtype)
+        self.B = B.astype(self.dtype)
+        self.C = C.astype(self.dtype)
+        self.D = D.astype(self.dtype)
         
         return self.A, self.B, self.C, self.D
     
@@ -161,26 +216,24 @@ class FullStateSpaceModel:
         Returns:
             dX_dt: State derivative vector
         """
-        X = np.array(X).reshape(-1, 1)  # Ensure column vector
-        U_vec = np.array([[U]])  # Scalar to array
-        
-        dX_dt = self.A @ X + self.B @ U_vec
-        
-        return dX_dt.flatten()  # Return as 1D array for ODE solver
+        # The current A and B are read on every call, so in-place edits to
+        # the model's matrices take effect immediately
+        return np.array(_plant_rhs(self.A.tolist(), self.B.tolist(),
+                                   np.asarray(X).tolist(), U))
     
-    def output(self, X):
+    def output(self, X, U=0.0):
         """
         Compute output Y = C*X + D*U
         
         Args:
             X: State vector [i, ω, θm, P]
+            U: Input voltage (V), only needed for a nonzero D
         
         Returns:
             Y: Sensor output voltage (V)
         """
-        X = np.array(X).reshape(-1, 1)  # Ensure column vector
-        Y = self.C @ X + self.D
-        return Y[0, 0]  # Return scalar
+        # 1-D dot with the current C row: no column reshape or copy of X
+        return self.C[0] @ np.asarray(X) + self.D[0, 0] * U
     
     def validate_matrices(self):
         """
@@ -232,9 +285,38 @@ class FullStateSpaceModel:
         print(f"J_ref = {self.J_ref:.9f} kg·m²")
         print(f"J_total = {self.J_total:.9f} kg·m²")
         
+        # Eigenvalue error of single-precision storage (must stay < 1e-4)
+        print("\n--- Precision ---")
+        A64 = self.A.astype(np.float64)
+        eig64 = np.sort_complex(np.linalg.eigvals(A64))
+        eig32 = np.sort_complex(np.linalg.eigvals(A64.astype(np.float32)))
+        eig_err = np.max(np.abs(eig64 - eig32))
+        print(f"dtype = {self.dtype}")
+        print(f"max |eig_fp64 - eig_fp32| = {eig_err:.3e} (limit: 1e-4)")
+        
         print("=" * 70)
 
 
+@cache
+def get_default_plant(dtype=np.float64):
+    """
+    Shared plant model built from the FROZEN parameters (one per dtype).
+    
+    The returned model's A, B, C, D are read-only because every caller shares
+    them. Construct a FullStateSpaceModel explicitly to get a mutable plant.
+    
+    Args:
+        dtype: Floating dtype of the plant matrices
+    
+    Returns:
+        plant: Shared FullStateSpaceModel instance
+    """
+    plant = FullStateSpaceModel(dtype=dtype)
+    for M in (plant.A, plant.B, plant.C, plant.D):
+        M.flags.writeable = False
+    return plant
+
+
 if __name__ == "__main__":
     model = FullStateSpaceModel()
     model.validate_matrices()
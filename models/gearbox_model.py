@@ -16,16 +16,92 @@ Equations:
 - Angle relation: θv = θm / N
 """
 
+if __name__ == "__main__":
+    # Run as a script (python models/gearbox_model.py): put the package root on
+    # sys.path so the absolute imports below resolve
+    import sys
+    import os
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config.system_parameters import params
+
+
+# ===================================================================
+# GEARBOX CONSTANTS (FROZEN, read once at import)
+# Reciprocals are precomputed so every reflection is a single multiply.
+# ===================================================================
+N = params.N
+eta = params.eta
+
+_ONE_OVER_N = 1.0 / N
+_ONE_OVER_ETA_N = 1.0 / (eta * N)
+_ONE_OVER_ETA_N2 = 1.0 / (eta * N * N)
+
+
+def reflect_torque(valve_torque):
+    """
+    Reflect valve-side torque to motor shaft.
+    
+    Equation: τm = τv / (η * N)
+    Reference: Section 1.3 of industrial_pressure_control_system_design.md
+    
+    Args:
+        valve_torque: Torque at valve side (Nm), scalar or array
+    
+    Returns:
+        motor_torque: Reflected torque at motor shaft (Nm)
+    """
+    return valve_torque * _ONE_OVER_ETA_N
+
+
+def reflect_inertia(valve_inertia):
+    """
+    Reflect valve inertia to motor shaft.
+    
+    Equation: J_ref = J_valve / (η * N²)
+    Reference: Section 1.1 of numerical_state_space_and_simulation_specification.md
+    
+    Args:
+        valve_inertia: Valve moment of inertia (kg·m²), scalar or array
+    
+    Returns:
+        reflected_inertia: Inertia reflected to motor shaft (kg·m²)
+    """
+    return valve_inertia * _ONE_OVER_ETA_N2
+
+
+def motor_to_valve_angle(theta_motor):
+    """
+    Convert motor angle to valve angle.
+    
+    Equation: θv = θm / N
+    
+    Args:
+        theta_motor: Motor angular position (rad), scalar or array
+    
+    Returns:
+        theta_valve: Valve angular position (rad)
+    """
+    return theta_motor * _ONE_OVER_N
+
 
 class GearboxModel:
     """
     Gearbox torque and inertia reflection model.
     
+    Thin wrapper around the module-level reflection functions, which use
+    precomputed reciprocals of the FROZEN gear parameters and can be
+    called directly from simulation loops without attribute lookups.
+    
     References:
     - industrial_pressure_control_system_design.md: Section 1.3
     - numerical_state_space_and_simulation_specification.md: Section 1.1
     """
     
+    reflect_torque_to_motor = staticmethod(reflect_torque)
+    reflect_inertia_to_motor = staticmethod(reflect_inertia)
+    motor_angle_to_valve_angle = staticmethod(motor_to_valve_angle)
+    
     def __init__(self):
         """
         Initialize gearbox parameters from documentation.
@@ -33,61 +109,36 @@ class GearboxModel:
         """
         self.N = None  # Gear ratio
         self.eta = None  # Gear efficiency
+        
+        self.load_parameters()
     
     def load_parameters(self):
         """
         Load numerical parameters from documentation.
         Must match Section 1.1 of numerical_state_space_and_simulation_specification.md
         """
-        pass
-    
-    def reflect_torque_to_motor(self, valve_torque):
-        """
-        Reflect valve-side torque to motor shaft.
-        
-        Equation: τm = τv / (η * N)
-        Reference: Section 1.3 of industrial_pressure_control_system_design.md
-        
-        Args:
-            valve_torque: Torque at valve side (Nm)
-        
-        Returns:
-            motor_torque: Reflected torque at motor shaft (Nm)
-        """
-        pass
-    
-    def reflect_inertia_to_motor(self, valve_inertia):
-        """
-        Reflect valve inertia to motor shaft.
-        
-        Equation: J_ref = J_valve / (η * N²)
-        Reference: Section 1.1 of numerical_state_space_and_simulation_specification.md
-        
-        Args:
-            valve_inertia: Valve moment of inertia (kg·m²)
-        
-        Returns:
-            reflected_inertia: Inertia reflected to motor shaft (kg·m²)
-        """
-        pass
-    
-    def motor_angle_to_valve_angle(self, theta_motor):
-        """
-        Convert motor angle to valve angle.
-        
-        Equation: θv = θm / N
-        
-        Args:
-            theta_motor: Motor angular position (rad)
-        
-        Returns:
-            theta_valve: Valve angular position (rad)
-        """
-        pass
+        self.N = N
+        self.eta = eta
     
     def validate_parameters(self):
         """
         Validate that loaded parameters match documentation values.
         Cross-reference with numerical_state_space_and_simulation_specification.md
         """
-        pass
+        print("\n--- Gearbox Model Parameter Validation ---")
+        print(f"N = {self.N} (expected: 40)")
+        print(f"η = {self.eta} (expected: 0.85)")
+        print(f"J_ref = {self.reflect_inertia_to_motor(params.J_valve):.9f} kg·m² "
+              f"(expected: {params.J_ref:.9f})")
+        
+        assert self.N == 40, "Gear ratio mismatch"
+        assert abs(self.eta - 0.85) < 1e-6, "Gear efficiency mismatch"
+        assert abs(self.reflect_inertia_to_motor(params.J_valve) - params.J_ref) < 1e-12, \
+            "Reflected inertia mismatch"
+        
+        print("✓ All gearbox model parameters validated")
+
+
+if __name__ == "__main__":
+    gearbox = GearboxModel()
+    gearbox.validate_parameters()
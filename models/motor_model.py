@@ -25,9 +25,12 @@ Equations:
 - Position: dθm/dt = ω
 """
 
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+if __name__ == "__main__":
+    # Run as a script (python models/motor_model.py): put the package root on
+    # sys.path so the absolute imports below resolve
+    import sys
+    import os
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from config.system_parameters import params
 
@@ -8,15 +8,22 @@ Proper formulation:
 - Control: u = Kp*e + Ki*x_int - Kd*C*x_dot
 
 Do NOT substitute plant equations into derivative term.
+
+Usage: python rebuild_closed_loop.py [--no-poles]
+  --no-poles  Report stability (Routh-Hurwitz) without computing the poles.
 """
 
 import numpy as np
+from scipy.linalg import eigvals as la_eigvals
 import sys
 import os
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
 
 from models.full_state_space_model import FullStateSpaceModel
 from config.system_parameters import params
+from analysis.pole_analysis import characteristic_polynomial, hurwitz_stable
+
+SHOW_POLES = '--no-poles' not in sys.argv[1:]
 
 print("=" * 80)
 print("PROPER PID AUGMENTATION - CLOSED-LOOP CONSTRUCTION")
@@ -151,22 +158,24 @@ C_cl[0, 4] = 0.0  # Integral doesn't affect output
 print("\n--- C_cl Matrix (1x5) ---")
 print(C_cl)
 
-print("\n" + "=" * 80)
-print("EIGENVALUES (CLOSED-LOOP POLES)")
-print("=" * 80)
-
-eigenvalues = np.linalg.eigvals(A_cl)
-eigenvalues = sorted(eigenvalues, key=lambda x: x.real)
-
-for i, pole in enumerate(eigenvalues, 1):
-    if abs(pole.imag) < 1e-10:
-        print(f"  s{i} = {pole.real:.6f}")
-    else:
-        sign = '+' if pole.imag >= 0 else ''
-        print(f"  s{i} = {pole.real:.6f} {sign}{pole.imag:.6f}j")
-
-# Check stability
-all_stable = all(pole.real < 0 for pole in eigenvalues)
+if SHOW_POLES:
+    print("\n" + "=" * 80)
+    print("EIGENVALUES (CLOSED-LOOP POLES)")
+    print("=" * 80)
+    
+    eigenvalues = la_eigvals(A_cl)
+    eigenvalues = eigenvalues[np.argsort(eigenvalues.real)]
+    
+    # Real/complex decided for all poles at once, one print for the block
+    is_real = np.abs(eigenvalues.imag) < 1e-10
+    print("\n".join(
+        f"  s{i} = {re:.6f}" if real else f"  s{i} = {re:.6f} {im:+.6f}j"
+        for i, (re, im, real) in enumerate(
+            zip(eigenvalues.real.tolist(), eigenvalues.imag.tolist(), is_real.tolist()), 1)))
+
+# Check stability: Routh-Hurwitz on the characteristic polynomial needs
+# only its coefficients (Faddeev-LeVerrier), not the poles
+all_stable = hurwitz_stable(characteristic_polynomial(A_cl))
 print(f"\nSystem stable: {all_stable}")
 
 if not all_stable:
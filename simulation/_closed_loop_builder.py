@@ -0,0 +1,142 @@
+"""
+Shared Closed-Loop Builder
+
+Builds the discretised PID closed loop used by SimulationRunner,
+ClosedLoopSimulation and DisturbanceSimulation, memoised on the plant,
+the gains and the sample period.
+
+PID law (derivative on measurement, integral state appended):
+u = Kp*(r - C x) + Ki*x_int - Kd*C*x_dot
+Solving for u with x_dot = A x + B u gives
+u = K_state x + K_int x_int + K_ref r,  denom = 1 + Kd*C*B
+K_state = -(Kp*C + Kd*C*A)/denom,  K_int = Ki/denom,  K_ref = Kp/denom
+
+Augmented state X = [x; x_int], reference r in the units of C x.
+"""
+
+from functools import lru_cache
+from typing import NamedTuple
+
+import numpy as np
+
+from config.system_parameters import params
+
+
+class ClosedLoopDiscrete(NamedTuple):
+    """
+    Continuous and zero-order-hold discrete closed loop (read-only arrays).
+
+    X[k+1] = Ad X[k] + Bd r,  y = Cd X,  u = Ku X + Du r
+    """
+    A_cl: np.ndarray  # (n+1, n+1) continuous closed-loop matrix
+    B_ref: np.ndarray  # (n+1,) continuous reference input
+    Ad: np.ndarray  # (n+1, n+1) exp(A_cl*dt)
+    Bd: np.ndarray  # (n+1,) reference input over one step
+    Cd: np.ndarray  # (n+1,) plant output row [C, 0]
+    Ku: np.ndarray  # (n+1,) control voltage row [K_state, K_int]
+    Du: float  # control voltage feedthrough K_ref
+    x_ss_per_setpoint: np.ndarray  # (n+1,) equilibrium for r = 1 (None if singular)
+
+
+def _expm(M):
+    """
+    Matrix exponential, by eigendecomposition when M is diagonalisable.
+    
+    exp(M) = V diag(exp(lam)) V^-1 avoids importing scipy.linalg (most of
+    the runner's start-up time). Defective or ill-conditioned cases (e.g.
+    a repeated zero pole when Ki = 0) fall back to scipy's Pade expm.
+    """
+    lam, V = np.linalg.eig(M)
+    if np.linalg.cond(V) < 1e8:
+        return ((V * np.exp(lam)) @ np.linalg.inv(V)).real
+    
+    from scipy.linalg import expm
+    return expm(M)
+
+
+@lru_cache(maxsize=32)
+def _build(A_bytes, B_bytes, C_bytes, n, Kp, Ki, Kd, dt):
+    """Memoised body of build_closed_loop (plant passed as float64 bytes)."""
+    A = np.frombuffer(A_bytes).reshape(n, n)
+    b = np.frombuffer(B_bytes)
+    c = np.frombuffer(C_bytes)
+
+    inv_denom = 1.0 / (1.0 + Kd * (c @ b))
+    K_state = -(Kp * c + Kd * (c @ A)) * inv_denom
+    K_int = Ki * inv_denom
+    K_ref = Kp * inv_denom
+
+    A_cl = np.zeros((n + 1, n + 1))
+    A_cl[:n, :n] = A + np.outer(b, K_state)
+    A_cl[:n, n] = b * K_int
+    A_cl[n, :n] = -c
+    B_ref = np.zeros(n + 1)
+    B_ref[:n] = b * K_ref
+    B_ref[n] = 1.0
+
+    # Van Loan: one expm of [[A_cl, B_ref], [0, 0]] gives Ad and Bd without
+    # requiring A_cl to be invertible
+    M = np.zeros((n + 2, n + 2))
+    M[:n + 1, :n + 1] = A_cl
+    M[:n + 1, n + 1] = B_ref
+    E = _expm(M * dt)
+    Ad = np.ascontiguousarray(E[:n + 1, :n + 1])
+    Bd = np.ascontiguousarray(E[:n + 1, n + 1])
+
+    Cd = np.zeros(n + 1)
+    Cd[:n] = c
+    Ku = np.zeros(n + 1)
+    Ku[:n] = K_state
+    Ku[n] = K_int
+
+    # Equilibrium per unit reference: 0 = A_cl x_ss + B_ref
+    try:
+        x_ss = -np.linalg.solve(A_cl, B_ref)
+    except np.linalg.LinAlgError:
+        x_ss = None  # No unique equilibrium (e.g. Ki = 0)
+
+    for M in (A_cl, B_ref, Ad, Bd, Cd, Ku, x_ss):
+        if M is not None:
+            M.setflags(write=False)
+    return ClosedLoopDiscrete(A_cl, B_ref, Ad, Bd, Cd, Ku, float(K_ref), x_ss)
+
+
+def controller_gains(controller):
+    """
+    PID gains (Kp, Ki, Kd) of a controller for build_closed_loop.
+    
+    Falls back to the FROZEN parameters when there is no controller or its
+    gains are unset, so every simulation resolves gains the same way.
+    
+    Args:
+        controller: PIDController instance or None
+    
+    Returns:
+        Kp, Ki, Kd
+    """
+    if controller is None or controller.Kp is None:
+        return params.Kp, params.Ki, params.Kd
+    return controller.Kp, controller.Ki, controller.Kd
+
+
+def build_closed_loop(A, B, C, Kp, Ki, Kd, dt):
+    """
+    Closed loop of plant (A, B, C) with a PID controller, discretised for dt.
+
+    Results are cached on (plant, gains, dt), so every caller evaluating
+    the same gains shares one construction, expm included. The returned
+    arrays are shared and read-only.
+
+    Args:
+        A, B, C: Plant matrices (n x n, n x 1, 1 x n)
+        Kp, Ki, Kd: PID gains
+        dt: Sample period (s)
+
+    Returns:
+        ClosedLoopDiscrete
+    """
+    A = np.asarray(A, dtype=np.float64)
+    return _build(A.tobytes(),
+                  np.asarray(B, dtype=np.float64).tobytes(),
+                  np.asarray(C, dtype=np.float64).tobytes(),
+                  A.shape[0], float(Kp), float(Ki), float(Kd), float(dt))
@@ -8,7 +8,15 @@ Test: Apply 10% pressure disturbance and verify recovery within 3 s.
 """
 
 import numpy as np
-from scipy.integrate import solve_ivp
+
+if __name__ == "__main__":
+    # Run as a script (python simulation/disturbance_simulation.py): put the package root on
+    # sys.path so the absolute imports below resolve
+    import sys
+    import os
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from simulation._closed_loop_builder import build_closed_loop, controller_gains
 
 
 class DisturbanceSimulation:
@@ -32,23 +40,64 @@ class DisturbanceSimulation:
         self.results = None
     
     def run_disturbance_test(self, P_setpoint, disturbance_magnitude, 
-                            disturbance_time, t_final, initial_state=None):
+                            disturbance_time, t_final, initial_state=None, dt=1e-3):
         """
         Simulate disturbance rejection.
         
+        The disturbance is a sudden pressure drop of
+        disturbance_magnitude * P_setpoint at disturbance_time. The closed
+        loop is stepped with the exact discretisation from the shared
+        build_closed_loop (same construction as ClosedLoopSimulation).
+        
         Args:
             P_setpoint: Pressure setpoint (bar)
             disturbance_magnitude: Disturbance as fraction of setpoint (e.g., 0.1 for 10%)
             disturbance_time: Time at which disturbance is applied (s)
             t_final: Simulation duration (s)
             initial_state: Initial state vector [i, ω, θm, P]
+            dt: Sample period (s)
         
         Returns:
             t: Time array
             X: State trajectory
             U: Control voltage trajectory
+        
+        Raises:
+            ValueError: If disturbance_time falls outside [0, t_final]
         """
-        pass
+        A, B, C = self.model.A, self.model.B, self.model.C
+        n = A.shape[0]
+        cl = build_closed_loop(A, B, C, *controller_gains(self.controller), dt)
+        
+        # The loop compares r with the sensor output y = C x (volts)
+        r = self.model.Ks * P_setpoint
+        N = int(round(t_final / dt)) + 1
+        k_dist = int(round(disturbance_time / dt))
+        if not 0 <= k_dist < N:
+            raise ValueError(f"disturbance_time {disturbance_time} s is outside "
+                             f"the simulated interval [0, {t_final}] s")
+        pressure_drop = disturbance_magnitude * P_setpoint
+        
+        # One column per sample (column-major, so each column is contiguous)
+        X_aug = np.empty((n + 1, N), order='F')
+        X_aug[:, 0] = 0.0
+        if initial_state is not None:
+            X_aug[:n, 0] = initial_state
+        if k_dist == 0:
+            X_aug[3, 0] -= pressure_drop
+        Ad, Bd_r = cl.Ad, cl.Bd * r
+        for k in range(N - 1):
+            X_aug[:, k + 1] = Ad @ X_aug[:, k] + Bd_r
+            if k + 1 == k_dist:
+                X_aug[3, k + 1] -= pressure_drop
+        
+        t = np.arange(N) * dt
+        X = X_aug[:n].T
+        U = cl.Ku @ X_aug + cl.Du * r
+        self.results = {'t': t, 'X': X, 'U': U, 'P': X[:, 3],
+                        'P_setpoint': P_setpoint,
+                        'disturbance_time': disturbance_time}
+        return t, X, U
     
     def compute_recovery_time(self, P_setpoint, tolerance=0.02):
         """
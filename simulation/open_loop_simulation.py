@@ -8,7 +8,7 @@ Test: Apply step voltage input and observe valve angle response.
 """
 
 import numpy as np
-from scipy.integrate import solve_ivp
+from scipy import signal
 
 
 class OpenLoopSimulation:
@@ -29,20 +29,42 @@ class OpenLoopSimulation:
         self.model = state_space_model
         self.results = None
     
-    def run_step_response(self, V_step, t_final, initial_state=None):
+    def run_step_response(self, V_step, t_final, initial_state=None, dt=1e-3):
         """
         Simulate open-loop step response.
         
+        The plant is LTI and the input is constant, so the model is
+        discretised exactly (zero-order hold) once and stepped one
+        matrix-vector product per sample instead of integrating the ODE.
+        
         Args:
             V_step: Step voltage input (V)
             t_final: Simulation duration (s)
             initial_state: Initial state vector [i, ω, θm, P]
+            dt: Sample period (s)
         
         Returns:
             t: Time array
             X: State trajectory
         """
-        pass
+        m = self.model
+        n_states = m.A.shape[0]
+        N = int(round(t_final / dt)) + 1
+        t = np.arange(N) * dt
+        
+        sysd = signal.StateSpace(m.A, m.B, m.C, m.D).to_discrete(dt)
+        Ad, Bd_u = sysd.A, sysd.B[:, 0] * float(V_step)
+        
+        # One column per sample (column-major, so each column is contiguous)
+        X_cols = np.empty((n_states, N), order='F')
+        X_cols[:, 0] = 0.0 if initial_state is None else initial_state
+        for k in range(N - 1):
+            X_cols[:, k + 1] = Ad @ X_cols[:, k] + Bd_u
+        
+        X = X_cols.T
+        Y = m.C[0] @ X_cols
+        self.results = {'t': t, 'X': X, 'Y': Y, 'U': np.full(N, float(V_step))}
+        return t, X
     
     def extract_valve_angle(self, X):
         """
@@ -12,17 +12,94 @@ Communication Protocol:
 import sys
 import os
 import json
+import math
 import time
 import argparse
-import select
+import selectors
 import numpy as np
-from scipy.integrate import odeint
+
+try:
+    import orjson  # Optional fast path; falls back to the stdlib json module
+except ImportError:
+    orjson = None
 
 # Add src to path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
 
 from config.system_parameters import params
 from models.full_state_space_model import FullStateSpaceModel
+from simulation._closed_loop_builder import build_closed_loop
+
+# Gain-update parser (orjson when available); both raise ValueError subclasses
+_json_loads = orjson.loads if orjson is not None else json.loads
+
+# One output line for the fixed GUI schema (same keys/order as get_output_data)
+_OUTPUT_FMT = (b'{"pressure":%.4f,"valve_angle":%.4f,"motor_current":%.4f,'
+               b'"setpoint":%.4f,"timestamp":%.4f}\n')
+
+
+def _step5(Ad_rows, Bd, x, r):
+    """
+    One 5-state update Ad @ x + Bd * r, unrolled on Python floats.
+    
+    For a 5x5 system the 25 multiply-adds cost less as plain scalar
+    arithmetic than the NumPy matmul/ufunc dispatch around them.
+    
+    Args:
+        Ad_rows: Rows of Ad as tuples of floats
+        Bd: Bd as a tuple of floats
+        x: Current state as a list of 5 floats
+        r: Setpoint (bar)
+    
+    Returns:
+        List of the 5 next-state values
+    """
+    x0, x1, x2, x3, x4 = x
+    return [a0*x0 + a1*x1 + a2*x2 + a3*x3 + a4*x4 + b*r
+            for (a0, a1, a2, a3, a4), b in zip(Ad_rows, Bd)]
+
+
+def _saturate(x):
+    """
+    Apply the state saturation limits to x in place.
+    
+    Keeps the integration numerically sane: current -25 to 25 A, motor
+    angle -100 to 100 rad, pressure 0-700 bar.
+    
+    Args:
+        x: State as a list of 5 floats
+    """
+    i_a, theta_m, P = x[0], x[2], x[3]
+    x[0] = -25.0 if i_a < -25.0 else 25.0 if i_a > 25.0 else i_a
+    x[2] = -100.0 if theta_m < -100.0 else 100.0 if theta_m > 100.0 else theta_m
+    x[3] = 0.0 if P < 0.0 else 700.0 if P > 700.0 else P
+
+
+def _advance_interval(Ad_stack, Bd_stack, state, setpoint):
+    """
+    Advance one output interval if no intermediate state saturates.
+    
+    All intermediate states come from one stacked matmul. If none of them
+    reaches a saturation limit, per-step clipping would have been a no-op
+    and the last one is the exact next state.
+    
+    Args:
+        Ad_stack: Stacked powers Ad^1..Ad^N, shape (5N, 5)
+        Bd_stack: Matching stacked inputs, shape (5N,)
+        state: Current state (5,)
+        setpoint: Setpoint (bar)
+    
+    Returns:
+        Next state (5,), or None if the interval has to be stepped with
+        saturation applied
+    """
+    X = (Ad_stack @ state + Bd_stack * setpoint).reshape(-1, 5)
+    i_a, theta_m, P = X[:, 0], X[:, 2], X[:, 3]
+    
+    if ((np.abs(i_a) <= 25.0).all() and (np.abs(theta_m) <= 100.0).all()
+            and ((P >= 0.0) & (P <= 700.0)).all()):
+        return X[-1].copy()
+    return None
 
 
 class SimulationRunner:
@@ -43,6 +120,12 @@ class SimulationRunner:
         self.Ki = params.Ki
         self.Kd = params.Kd
         
+        # Simulation time as an integer step count, t = _k * dt, so it does
+        # not accumulate rounding error (dt is needed by rebuild_closed_loop)
+        self._k = 0
+        self.dt = 0.01  # 10ms integration step
+        self.output_interval = 0.1  # 100ms output interval
+        
         # Build closed-loop system (5 states: [i, ω, θ, P, x_int])
         self.A = A
         self.B = B
@@ -52,60 +135,140 @@ class SimulationRunner:
         # Initial state: [i_a, ω_m, θ_m, P, x_int] all zero
         self.state = np.zeros(5)
         
-        # Simulation time
-        self.t = 0.0
-        self.dt = 0.01  # 10ms integration step
-        self.output_interval = 0.1  # 100ms output interval
-        self.last_output_time = 0.0
+        # stdin readiness selector (registered on first check_stdin call)
+        self._stdin_selector = None
+    
+    @property
+    def t(self):
+        """Simulation time (s), derived from the integer step count."""
+        return self._k * self.dt
     
     def rebuild_closed_loop(self):
-        """Rebuild closed-loop A matrix with current PID gains."""
-        A = self.A
-        B = self.B
-        C = self.C
+        """
+        Rebuild closed-loop A matrix with current PID gains.
+        
+        The construction and its discretisation come from the shared,
+        gain-memoised build_closed_loop (also used by the simulation
+        classes), so revisiting a gain set costs a cache lookup.
+        """
+        cl = build_closed_loop(self.A, self.B, self.C,
+                               self.Kp, self.Ki, self.Kd, self.dt)
         
-        # Compute feedback gains
-        CxB = (C @ B)[0, 0]
-        denom = 1.0 + self.Kd * CxB
+        self.A_cl = cl.A_cl  # 5x5 closed-loop A matrix
+        self.B_ref = cl.B_ref  # 5x1 reference input matrix
         
-        K_state = -(self.Kp * C + self.Kd * C @ A) / denom  # 1x4
-        K_int = self.Ki / denom
-        K_ref = self.Kp / denom
+        # Equilibrium per unit setpoint: 0 = A_cl x_ss + B_ref r
+        self._x_ss_unit = cl.x_ss_per_setpoint
         
-        # Build 5x5 closed-loop A matrix
-        self.A_cl = np.zeros((5, 5))
-        self.A_cl[0:4, 0:4] = A + B @ K_state
-        self.A_cl[0:4, 4] = (B * K_int).flatten()
-        self.A_cl[4, 0:4] = -C.flatten()
-        self.A_cl[4, 4] = 0.0
+        # New gains: the loop has to be stepped again
+        self.idle = False
         
-        # Build 5x1 reference input matrix
-        self.B_ref = np.zeros(5)
-        self.B_ref[0:4] = (B * K_ref).flatten()
-        self.B_ref[4] = 1.0
+        self.precompute_discrete(cl)
     
-    def dynamics(self, state, t):
+    def precompute_discrete(self, cl):
         """
-        Closed-loop dynamics for integration.
+        Exact discretisation of the closed loop for one step of dt.
         
-        state: [i_a, ω_m, θ_m, P, x_int]
-        returns: state_dot
+        The setpoint is constant over a step, so
+        state[k+1] = Ad @ state[k] + Bd * setpoint
+        with Ad = exp(A_cl*dt) and Bd = A_cl^-1 (Ad - I) B_ref, taken from
+        the shared builder. Recomputed only when the gains change.
+        
+        Args:
+            cl: ClosedLoopDiscrete from build_closed_loop
         """
-        state_dot = self.A_cl @ state + self.B_ref * self.setpoint
-        return state_dot
+        self.Ad = cl.Ad
+        self.Bd = cl.Bd
+        
+        # Float tuples for the unrolled _step5 kernel
+        self._Ad_rows = tuple(map(tuple, self.Ad.tolist()))
+        self._Bd_flat = tuple(self.Bd.tolist())
+        
+        # Maps from the state at an output tick to every intermediate state
+        # of the next interval: X_k = Ad^k @ state + (sum_{j<k} Ad^j Bd) * r
+        # for k = 1..n, stacked into one (5n x 5) matrix. The last block row
+        # is the full-interval jump Ad10/Bd10.
+        n = self.steps_per_output = round(self.output_interval / self.dt)
+        Ad_pow = np.empty((n, 5, 5))
+        Bd_sum = np.empty((n, 5))
+        Ad_pow[0] = self.Ad
+        Bd_sum[0] = self.Bd
+        for k in range(1, n):
+            Ad_pow[k] = self.Ad @ Ad_pow[k - 1]
+            Bd_sum[k] = self.Ad @ Bd_sum[k - 1] + self.Bd
+        self._Ad_stack = Ad_pow.reshape(5 * n, 5)
+        self._Bd_stack = Bd_sum.reshape(5 * n)
+        self.Ad10 = Ad_pow[-1]
+        self.Bd10 = Bd_sum[-1]
     
     def step(self):
-        """Advance simulation by dt using odeint."""
-        t_span = [self.t, self.t + self.dt]
-        result = odeint(self.dynamics, self.state, t_span)
-        self.state = result[-1]
+        """Advance simulation by dt with the precomputed transition."""
+        x = _step5(self._Ad_rows, self._Bd_flat, self.state.tolist(), self.setpoint)
+        _saturate(x)
+        
+        self.state = np.array(x)
+        self._k += 1
+    
+    def step_many(self, n):
+        """
+        Advance simulation by n steps of dt, saturating after each step.
+        
+        Equivalent to n calls to step(), but the state stays a list of
+        floats between steps and is converted to an array once at the end.
+        
+        Args:
+            n: Number of steps
+        """
+        Ad_rows, Bd, r = self._Ad_rows, self._Bd_flat, self.setpoint
+        x = self.state.tolist()
+        for _ in range(n):
+            x = _step5(Ad_rows, Bd, x, r)
+            _saturate(x)
         
-        # Apply state saturation to prevent numerical instability
-        self.state[0] = np.clip(self.state[0], -25, 25)  # Current: -25 to 25 A
-        self.state[2] = np.clip(self.state[2], -100, 100)  # Motor angle: reasonable range
-        self.state[3] = np.clip(self.state[3], 0, 700)  # Pressure: 0-700 bar
+        self.state = np.array(x)
+        self._k += n
+    
+    def step_output_interval(self):
+        """
+        Advance simulation by one output interval (steps_per_output * dt).
+        
+        Takes the saturation-free jump from _advance_interval when it
+        applies; otherwise the interval is replayed with step_many() so
+        saturation is applied exactly as before.
+        """
+        x = _advance_interval(self._Ad_stack, self._Bd_stack, self.state, self.setpoint)
+        if x is not None:
+            self.state = x
+            self._k += self.steps_per_output
+        else:
+            self.step_many(self.steps_per_output)
+    
+    def _output_values(self):
+        """
+        Display values (pressure, valve angle, motor current) with saturation.
+        
+        Returns:
+            P: Pressure (bar), clipped to 0-700
+            valve_angle_deg: Valve angle (degrees), clipped to 0-180
+            i_a: Motor current (A), clipped to 0-25
+        """
+        # Extract states as Python floats (scalar math below, no ufuncs)
+        # [armature current (A), -, motor position (rad), pressure (bar), -]
+        i_a, _, theta_m, P, _ = self.state.tolist()
         
-        self.t += self.dt
+        # Convert motor position to valve angle
+        # Valve angle = motor angle / gear ratio
+        theta_valve = theta_m / params.N  # rad
+        valve_angle_deg = math.degrees(theta_valve)
+        
+        # Apply saturation limits to prevent display issues
+        P = 0.0 if P < 0.0 else 700.0 if P > 700.0 else P  # Pressure: 0-700 bar
+        valve_angle_deg = (0.0 if valve_angle_deg < 0.0 else
+                           180.0 if valve_angle_deg > 180.0 else
+                           valve_angle_deg)  # Valve: 0-180 degrees
+        i_a = 0.0 if i_a < 0.0 else 25.0 if i_a > 25.0 else i_a  # Current: 0-25 A
+        
+        return P, valve_angle_deg, i_a
     
     def get_output_data(self):
         """
@@ -118,30 +281,37 @@ class SimulationRunner:
         - setpoint: pressure setpoint (bar)
         - timestamp: simulation time (s)
         """
-        # Extract states
-        i_a = self.state[0]      # Armature current (A)
-        omega_m = self.state[1]  # Motor velocity (rad/s)
-        theta_m = self.state[2]  # Motor position (rad)
-        P = self.state[3]        # Pressure (bar)
-        
-        # Convert motor position to valve angle
-        # Valve angle = motor angle / gear ratio
-        theta_valve = theta_m / params.N  # rad
-        valve_angle_deg = np.degrees(theta_valve)
-        
-        # Apply saturation limits to prevent display issues
-        P = np.clip(P, 0, 700)  # Pressure: 0-700 bar
-        valve_angle_deg = np.clip(valve_angle_deg, 0, 180)  # Valve: 0-180 degrees
-        i_a = np.clip(i_a, 0, 25)  # Current: 0-25 A
+        P, valve_angle_deg, i_a = self._output_values()
         
         return {
-            "pressure": float(P),
-            "valve_angle": float(valve_angle_deg),
-            "motor_current": float(i_a),
+            "pressure": P,
+            "valve_angle": valve_angle_deg,
+            "motor_current": i_a,
             "setpoint": float(self.setpoint),
             "timestamp": float(self.t)
         }
     
+    def format_output(self):
+        """
+        Current output as one JSON line in bytes, ready for stdout.
+        
+        The schema is fixed, so the line is produced by a single bytes
+        format with no dict and no json encoder.
+        """
+        P, valve_angle_deg, i_a = self._output_values()
+        return _OUTPUT_FMT % (P, valve_angle_deg, i_a, self.setpoint, self.t)
+    
+    def at_steady_state(self, tol=1e-5):
+        """
+        Whether the state has converged to the equilibrium for the setpoint.
+        
+        Once there, further steps reproduce the same state and output, so
+        run() stops stepping (idle mode) until the setpoint or gains change.
+        """
+        if self._x_ss_unit is None:
+            return False
+        return bool(np.max(np.abs(self.state - self._x_ss_unit * self.setpoint)) < tol)
+    
     def update_gains(self, Kp, Ki, Kd):
         """Update PID gains and rebuild closed-loop system."""
         self.Kp = Kp
@@ -149,6 +319,20 @@ class SimulationRunner:
         self.Kd = Kd
         self.rebuild_closed_loop()
     
+    def _handle_stdin_line(self, line):
+        """Apply a JSON gain update line ({"Kp":..,"Ki":..,"Kd":..})."""
+        line = line.strip()
+        if line:
+            try:
+                data = _json_loads(line)
+                # Only a JSON object can carry gains; 123, null or a bare
+                # string would otherwise reach the membership test
+                if (isinstance(data, dict)
+                        and 'Kp' in data and 'Ki' in data and 'Kd' in data):
+                    self.update_gains(data['Kp'], data['Ki'], data['Kd'])
+            except ValueError:
+                pass
+    
     def check_stdin(self):
         """Check for gain updates from stdin (non-blocking)."""
         # Check if stdin has data available (non-blocking)
@@ -157,44 +341,66 @@ class SimulationRunner:
             # Use a simple try-except approach
             import msvcrt
             if msvcrt.kbhit():
-                line = sys.stdin.readline().strip()
-                if line:
-                    try:
-                        data = json.loads(line)
-                        if 'Kp' in data and 'Ki' in data and 'Kd' in data:
-                            self.update_gains(data['Kp'], data['Ki'], data['Kd'])
-                    except json.JSONDecodeError:
-                        pass
+                self._handle_stdin_line(sys.stdin.readline())
         else:
-            # Unix-like systems
-            if select.select([sys.stdin], [], [], 0)[0]:
-                line = sys.stdin.readline().strip()
-                if line:
-                    try:
-                        data = json.loads(line)
-                        if 'Kp' in data and 'Ki' in data and 'Kd' in data:
-                            self.update_gains(data['Kp'], data['Ki'], data['Kd'])
-                    except json.JSONDecodeError:
-                        pass
+            # Unix-like systems: stdin is registered once with an
+            # epoll/kqueue-backed selector and polled with zero timeout
+            if self._stdin_selector is None:
+                self._stdin_selector = selectors.DefaultSelector()
+                try:
+                    self._stdin_selector.register(sys.stdin, selectors.EVENT_READ)
+                except (PermissionError, ValueError):
+                    # epoll rejects regular files and /dev/null; select()
+                    # accepts them (always readable), as before
+                    self._stdin_selector.close()
+                    self._stdin_selector = selectors.SelectSelector()
+                    self._stdin_selector.register(sys.stdin, selectors.EVENT_READ)
+            if self._stdin_selector.select(0):
+                self._handle_stdin_line(sys.stdin.readline())
     
     def run(self):
-        """Main simulation loop - outputs JSON to stdout every 100ms."""
+        """
+        Main simulation loop - outputs JSON to stdout every 100ms.
+        
+        Steps are taken in a tight batch of one output interval, then the
+        loop sleeps once until the wall clock catches up with the simulation
+        time, so output cadence is set by the deadline rather than by the
+        per-step cost. After the response has settled, stepping is skipped
+        until the setpoint or the gains change.
+        """
+        out = sys.stdout.buffer
+        wall_start = time.monotonic() - self.t
+        
+        idle_setpoint = None
+        
+        # Bound once: the loop body is otherwise dominated by lookups
+        advance = self.step_output_interval
+        settled = self.at_steady_state
+        check_stdin = self.check_stdin
+        format_output = self.format_output
+        write, flush = out.write, out.flush
+        monotonic, sleep = time.monotonic, time.sleep
+        
         while True:
-            # Step simulation forward
-            self.step()
+            # Step simulation forward by one output interval; once settled,
+            # only time advances (the state is the cached equilibrium)
+            if self.idle and self.setpoint == idle_setpoint:
+                self._k += self.steps_per_output
+            else:
+                advance()
+                self.idle = settled()
+                idle_setpoint = self.setpoint
             
             # Check for gain updates from stdin
-            self.check_stdin()
+            check_stdin()
             
             # Output data every 100ms
-            if self.t - self.last_output_time >= self.output_interval:
-                data = self.get_output_data()
-                # CRITICAL: flush=True ensures Qt receives data immediately
-                print(json.dumps(data), flush=True)
-                self.last_output_time = self.t
+            write(format_output())
+            # CRITICAL: flush ensures Qt receives data immediately
+            flush()
             
-            # Small sleep to prevent CPU spinning
-            time.sleep(0.001)
+            # Sleep until the next output is due
+            sleep(max(0.0, wall_start + self.t - monotonic()))
 
 
 def main():
@@ -16,6 +16,131 @@ Note: The system is 5th-order when PID controller is included in state-space for
 
 import numpy as np
 
+if __name__ == "__main__":
+    # Run as a script (python analysis/pole_analysis.py): put the package
+    # root on sys.path so the absolute imports below resolve
+    import sys
+    import os
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from models.closed_loop_model import build_A_cl_batch
+
+
+def hurwitz_stable(coeffs):
+    """
+    Routh-Hurwitz stability test on a characteristic polynomial.
+    
+    Answers "are all roots in the open left half-plane?" from the Routh
+    table's first column, O(n^2) scalar work and no eigensolve. Useful when
+    only the stability verdict is needed, with the coefficients from
+    characteristic_polynomial(A_cl) (np.poly would eigensolve A_cl first).
+    
+    Args:
+        coeffs: Polynomial coefficients, highest power first
+    
+    Returns:
+        stable: True if every root has a strictly negative real part
+            (marginal cases, including a zero pivot, report False)
+    """
+    c = np.asarray(coeffs, dtype=float)
+    if c[0] < 0:
+        c = -c
+    # Necessary condition: all coefficients strictly positive
+    if np.any(c <= 0):
+        return False
+    
+    n = len(c) - 1
+    table = np.zeros((n + 1, n // 2 + 2))
+    table[0, :len(c[0::2])] = c[0::2]
+    table[1, :len(c[1::2])] = c[1::2]
+    for i in range(2, n + 1):
+        pivot = table[i - 1, 0]
+        if pivot <= 0:
+            return False
+        table[i, :-1] = (pivot * table[i - 2, 1:]
+                         - table[i - 2, 0] * table[i - 1, 1:]) / pivot
+    return bool(np.all(table[:, 0] > 0))
+
+
+def characteristic_polynomial(M):
+    """
+    Characteristic polynomial det(sI - M) by Faddeev-LeVerrier.
+    
+    n matrix products and traces, no eigensolve (np.poly on a matrix
+    computes its eigenvalues first). Well conditioned for the small
+    (4x4, 5x5) matrices used here.
+    
+    Args:
+        M: Square matrix (n x n)
+    
+    Returns:
+        coeffs: n+1 coefficients, highest power first (leading 1)
+    """
+    M = np.asarray(M, dtype=float)
+    n = M.shape[0]
+    I = np.eye(n)
+    coeffs = np.empty(n + 1)
+    coeffs[0] = 1.0
+    Mk = np.zeros((n, n))
+    for k in range(1, n + 1):
+        Mk = M @ Mk + coeffs[k - 1] * I
+        coeffs[k] = -np.trace(M @ Mk) / k
+    return coeffs
+
+
+def sweep_gains(Kp_arr, Ki_arr, Kd_arr, A, B, C, n_freq=2000):
+    """
+    Stability sweep over a PID gain grid, vectorised over every grid point.
+    
+    For each (Kp, Ki, Kd) the augmented 5x5 closed loop is assembled
+    by models.closed_loop_model.build_A_cl_batch (derivative on the
+    measured output C x, same construction as analysis_step6.py),
+    its poles computed with one stacked eigvals call, and the phase margin
+    read from the open-loop response PID(jw)*G(jw) on a fixed
+    0.01-1000 rad/s log grid. G(jw) does not depend on the gains, so it is
+    evaluated once and broadcast over the whole grid.
+    
+    Args:
+        Kp_arr, Ki_arr, Kd_arr: 1-D arrays of gains to sweep
+        A, B, C: Plant matrices (4x4, 4x1, 1x4)
+        n_freq: Number of frequency points for the margin search
+    
+    Returns:
+        results: Array (len(Kp_arr), len(Ki_arr), len(Kd_arr), 2) holding
+            [max real part of closed-loop poles, phase margin (deg)];
+            the phase margin is NaN where there is no gain crossover.
+    """
+    A = np.asarray(A, dtype=float)
+    b = np.asarray(B, dtype=float).reshape(-1)
+    c = np.asarray(C, dtype=float).reshape(-1)
+    n = A.shape[0]
+    
+    Kp, Ki, Kd = np.meshgrid(np.asarray(Kp_arr, dtype=float),
+                             np.asarray(Ki_arr, dtype=float),
+                             np.asarray(Kd_arr, dtype=float), indexing='ij')
+    
+    # Closed-loop assembly for all grid points at once (PID on y = C x)
+    A_cl = build_A_cl_batch(A, b, Kp, Ki, Kd, C_meas=c)
+    max_real = np.linalg.eigvals(A_cl).real.max(axis=-1)
+    
+    # Open-loop frequency response: plant once, PID broadcast over gains
+    w = np.logspace(-2, 3, n_freq)
+    jw = 1j * w
+    G = np.linalg.solve(jw[:, None, None] * np.eye(n) - A, b) @ c
+    L = G * (Kd[..., None] * jw**2 + Kp[..., None] * jw + Ki[..., None]) / jw
+    mag = np.abs(L)
+    phase = np.rad2deg(np.unwrap(np.angle(L), axis=-1))
+    
+    # PM = 180 + phase at the first downward 0 dB crossing, wrapped into
+    # [-180, 180) so the unwrap starting branch does not matter
+    crosses = (mag[..., :-1] >= 1.0) & (mag[..., 1:] < 1.0)
+    idx_gc = np.argmax(crosses, axis=-1)
+    phase_gc = np.take_along_axis(phase, idx_gc[..., None], axis=-1)[..., 0]
+    pm = (phase_gc + 360.0) % 360.0 - 180.0
+    pm = np.where(crosses.any(axis=-1), pm, np.nan)
+    
+    return np.stack((max_real, pm), axis=-1)
+
 
 class PoleAnalysis:
     """
@@ -13,19 +13,34 @@ All parameters and expected results are defined in docs/ folder.
 """
 
 import sys
-import argparse
 
 
-def main():
+MODES = ('open_loop', 'closed_loop', 'disturbance', 'analysis', 'gui')
+
+BANNER = (
+    "=" * 70 + "\n"
+    "INDUSTRIAL PRESSURE CONTROL SYSTEM SIMULATION\n"
+    + "=" * 70 + "\n"
+    "\nArchitecture: FROZEN (Implementation Only)\n"
+    "Design Reference: docs/industrial_pressure_control_system_design.md\n"
+    "Verification Reference: docs/final_verified_results_section.md\n"
+    + "=" * 70 + "\n"
+)
+
+
+def build_parser():
     """
-    Main simulation entry point.
+    Build the full argparse parser (imported lazily: only needed for --help,
+    errors and unusual argument forms).
     """
+    import argparse
+    
     parser = argparse.ArgumentParser(
         description='Industrial Pressure Control System Simulation'
     )
     parser.add_argument(
         '--mode',
-        choices=['open_loop', 'closed_loop', 'disturbance', 'analysis', 'gui'],
+        choices=MODES,
         default='closed_loop',
         help='Simulation mode'
     )
@@ -39,27 +54,63 @@ def main():
         action='store_true',
         help='Generate plots'
     )
+    return parser
+
+
+def parse_args(argv):
+    """
+    Parse command-line arguments.
     
-    args = parser.parse_args()
+    The common forms (--mode X, --mode=X, --validate, --plot) are handled
+    directly; anything else falls back to argparse, which also produces the
+    usual help and error messages.
     
-    print("=" * 70)
-    print("INDUSTRIAL PRESSURE CONTROL SYSTEM SIMULATION")
-    print("=" * 70)
-    print("\nArchitecture: FROZEN (Implementation Only)")
-    print("Design Reference: docs/industrial_pressure_control_system_design.md")
-    print("Verification Reference: docs/final_verified_results_section.md")
-    print("=" * 70)
+    Args:
+        argv: Argument list without the program name
+    
+    Returns:
+        (mode, validate, plot)
+    """
+    mode, validate, plot = 'closed_loop', False, False
+    i = 0
+    while i < len(argv):
+        arg = argv[i]
+        if arg == '--validate':
+            validate = True
+        elif arg == '--plot':
+            plot = True
+        elif arg == '--mode' and i + 1 < len(argv) and argv[i + 1] in MODES:
+            mode = argv[i + 1]
+            i += 1
+        elif arg.startswith('--mode=') and arg[7:] in MODES:
+            mode = arg[7:]
+        else:
+            args = build_parser().parse_args(argv)
+            return args.mode, args.validate, args.plot
+        i += 1
+    return mode, validate, plot
+
+
+def main(argv=None):
+    """
+    Main simulation entry point.
+    """
+    mode, validate, plot = parse_args(sys.argv[1:] if argv is None else argv)
+    
+    sys.stdout.write(BANNER)
     
     # TODO: Implementation in Step 2
-    # 1. Load models
+    # 1. Load models (imported inside the mode branch that needs them)
     # 2. Build state-space
     # 3. Run simulation based on mode
     # 4. Validate results
     # 5. Generate plots if requested
     
-    print("\nSimulation mode:", args.mode)
-    print("Validation:", "Enabled" if args.validate else "Disabled")
-    print("Plotting:", "Enabled" if args.plot else "Disabled")
+    sys.stdout.write(
+        f"\nSimulation mode: {mode}\n"
+        f"Validation: {'Enabled' if validate else 'Disabled'}\n"
+        f"Plotting: {'Enabled' if plot else 'Disabled'}\n"
+    )
     
     return 0
 
@@ -34,12 +34,198 @@ Y = C_cl * X_aug
 """
 
 import numpy as np
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from scipy import signal
+from scipy.linalg import expm
+from scipy.linalg.blas import get_blas_funcs
+from functools import lru_cache
+
+if __name__ == "__main__":
+    # Run as a script (python models/closed_loop_model.py): put the package root on
+    # sys.path so the absolute imports below resolve
+    import sys
+    import os
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from config.system_parameters import params
-from models.full_state_space_model import FullStateSpaceModel
+from models.full_state_space_model import get_default_plant
+
+
+def build_A_cl_batch(A_plant, B_plant, Kp, Ki, Kd, C_meas=None):
+    """
+    Build closed-loop A_cl matrices for whole arrays of PID gains at once.
+    
+    The one closed-loop assembly shared by ClosedLoopSystem (through
+    _build_cl_matrices) and analysis.pole_analysis.sweep_gains. PID acts on
+    the measured output y = C_meas x with derivative on measurement, as
+    derived in _build_cl_matrices:
+    K_feedback = -(Kp*C_meas + Kd*C_meas A) / (1 + Kd*C_meas B), ė_int = r - y.
+    Broadcast over the gains, so a sweep or Monte-Carlo run assembles every
+    A_cl in a handful of array operations instead of one ClosedLoopSystem
+    per gain triple. Feed the result to ClosedLoopSystem.poles_batch.
+    
+    Args:
+        A_plant: Plant A matrix (n_plant x n_plant)
+        B_plant: Plant B matrix (n_plant x 1)
+        Kp, Ki, Kd: PID gains, scalars or broadcastable arrays
+        C_meas: Measured output row (n_plant,) or (1 x n_plant); defaults to
+            the pressure state x[3] (unit row)
+    
+    Returns:
+        A_cl: Array of shape broadcast(Kp, Ki, Kd).shape + (n_plant+1, n_plant+1)
+    """
+    A_plant = np.asarray(A_plant, dtype=float)
+    b = np.asarray(B_plant, dtype=float).reshape(-1)
+    Kp, Ki, Kd = np.broadcast_arrays(*(np.asarray(K, dtype=float)
+                                       for K in (Kp, Ki, Kd)))
+    n_plant = A_plant.shape[0]
+    if C_meas is None:
+        c = np.zeros(n_plant)
+        c[3] = 1.0  # Pressure state P = x[3]
+    else:
+        c = np.asarray(C_meas, dtype=float).reshape(-1)
+    
+    inv_denom = 1.0 / (1.0 + Kd * (c @ b))
+    K_feedback = -(Kp[..., None] * c + Kd[..., None] * (c @ A_plant)) * inv_denom[..., None]
+    
+    A_cl = np.zeros(Kp.shape + (n_plant + 1, n_plant + 1))
+    A_cl[..., :n_plant, :n_plant] = A_plant + b[:, None] * K_feedback[..., None, :]
+    A_cl[..., :n_plant, n_plant] = b * (Ki * inv_denom)[..., None]
+    A_cl[..., n_plant, :n_plant] = -c
+    return A_cl
+
+
+@lru_cache(maxsize=32)
+def _build_cl_matrices(A_bytes, B_bytes, n_plant, Kp, Ki, Kd):
+    """
+    Build closed-loop augmented state-space matrices (memoised).
+    
+    The plant matrices are passed as float64 bytes so the arguments are
+    hashable; with the FROZEN parameters every ClosedLoopSystem shares one
+    cached result. The returned arrays are read-only, callers copy them.
+    
+    Args:
+        A_bytes: Plant A matrix (n_plant x n_plant) as float64 bytes
+        B_bytes: Plant B matrix (n_plant x 1) as float64 bytes
+        n_plant: Number of plant states
+        Kp, Ki, Kd: PID gains
+    
+    Returns:
+        A_cl, B_ref, C_cl (read-only)
+    """
+    A_plant = np.frombuffer(A_bytes).reshape(n_plant, n_plant)
+    B_plant = np.frombuffer(B_bytes).reshape(n_plant, 1)
+    
+    B_flat = B_plant.ravel()
+    
+    # ================================================================
+    # STEP 1: Extract pressure output row from C matrix
+    # C_plant = [0, 0, 0, Ks] extracts pressure
+    # Pressure is state x[3] (index 3)
+    # ================================================================
+    pressure_index = 3  # P is the 4th state (index 3)
+    e_pressure = np.zeros(n_plant)  # Unit row selecting the pressure state
+    e_pressure[pressure_index] = 1.0
+    
+    # ================================================================
+    # STEP 2: Compute error and its derivative
+    # e = P_ref - P = P_ref - x[3]
+    # de/dt = -dP/dt = -(A[3,:] @ X + B[3] * u)
+    # ================================================================
+    B_pressure = B_plant[pressure_index, 0]  # Pressure row of B
+    
+    # ================================================================
+    # STEP 3: PID Control Law
+    # u = Kp*e + Ki*e_int + Kd*de/dt
+    # u = Kp*(P_ref - P) + Ki*e_int + Kd*(-dP/dt)
+    # u = Kp*(P_ref - x[3]) + Ki*x[4] + Kd*(-(A[3,:] @ X + B[3]*u))
+    # 
+    # Solve for u:
+    # u = Kp*P_ref - Kp*x[3] + Ki*x[4] - Kd*A[3,:] @ X - Kd*B[3]*u
+    # u + Kd*B[3]*u = Kp*P_ref - Kp*x[3] + Ki*x[4] - Kd*A[3,:] @ X
+    # u*(1 + Kd*B[3]) = Kp*P_ref - Kp*x[3] + Ki*x[4] - Kd*A[3,:] @ X
+    # u = (Kp*P_ref - Kp*x[3] + Ki*x[4] - Kd*A[3,:] @ X) / (1 + Kd*B[3])
+    # ================================================================
+    
+    # Reference feedforward (the state and integral gains are formed by
+    # build_A_cl_batch from the same solved law)
+    K_ref = Kp / (1.0 + Kd * B_pressure)
+    
+    # ================================================================
+    # STEP 4: Build closed-loop A matrix (5x5)
+    # 
+    # Plant dynamics with feedback:
+    # Ẋ_plant = A*X + B*u
+    # where u = K_feedback @ X_plant + K_integral * e_int + K_ref * P_ref
+    # 
+    # Ẋ_plant = (A + B*K_feedback) @ X_plant + B*K_integral * e_int
+    # 
+    # Integral dynamics:
+    # ė_int = P_ref - P = P_ref - x[3]
+    # ================================================================
+    
+    # Shared with the batched gain-sweep builder (scalar gains: one 5x5)
+    A_cl = build_A_cl_batch(A_plant, B_plant, Kp, Ki, Kd, C_meas=e_pressure)
+    
+    # ================================================================
+    # STEP 5: Build reference input matrix B_ref (5x1)
+    # 
+    # Plant states: affected by u, which has K_ref * P_ref term
+    # Integral state: affected by P_ref directly (+P_ref term in ė_int)
+    # ================================================================
+    B_ref = np.append(B_flat * K_ref, 1.0)[:, None]
+    
+    # ================================================================
+    # STEP 6: Build output matrix C_cl (1x5)
+    # 
+    # Output is pressure: y = P = x[3]
+    # ================================================================
+    C_cl = np.append(e_pressure, 0.0)[None, :]
+    
+    for M in (A_cl, B_ref, C_cl):
+        M.setflags(write=False)
+    return A_cl, B_ref, C_cl
+
+
+# Nonzero pattern of A_cl produced by _build_cl_matrices: row 0 is dense
+# (state feedback through the voltage input), rows 1-3 are the plant chain
+# i -> ω -> θm -> P, row 4 is ė_int = -P (+ P_ref). B_ref only feeds rows 0, 4.
+_A_CL_PATTERN = np.array([
+    [1, 1, 1, 1, 1],
+    [1, 0, 0, 0, 0],
+    [0, 1, 0, 0, 0],
+    [0, 0, 1, 1, 0],
+    [0, 0, 0, 1, 0],
+], dtype=bool)
+_B_REF_PATTERN = np.array([1, 0, 0, 0, 1], dtype=bool)
+
+
+def _cl_rhs(c, X, P_ref, out):
+    """
+    Fused Ẋ_aug = A_cl X_aug + B_ref P_ref, unrolled over the A_cl sparsity.
+    
+    Plant feedback, integral action and reference feedforward are evaluated
+    in one pass of scalar arithmetic written straight into out: no matmul
+    dispatch and no NumPy temporaries for the 5x5 system.
+    
+    Args:
+        c: Coefficient tuple (a00, a01, a02, a03, a04, a10, a21, a32, a33,
+           a43, b0, b4) from ClosedLoopSystem._cache_rhs_coefficients
+        X: Augmented state [i, ω, θm, P, e_int]
+        P_ref: Reference pressure (bar)
+        out: Length-5 array receiving the derivative
+    
+    Returns:
+        out
+    """
+    a00, a01, a02, a03, a04, a10, a21, a32, a33, a43, b0, b4 = c
+    # Python floats: scalar arithmetic on NumPy scalars is several times slower
+    x0, x1, x2, x3, x4 = X.tolist() if isinstance(X, np.ndarray) else X
+    out[:] = (a00*x0 + a01*x1 + a02*x2 + a03*x3 + a04*x4 + b0*P_ref,
+              a10*x0,
+              a21*x1,
+              a32*x2 + a33*x3,
+              a43*x3 + b4*P_ref)
+    return out
 
 
 class ClosedLoopSystem:
@@ -51,12 +237,23 @@ class ClosedLoopSystem:
     - numerical_state_space_and_simulation_specification.md: Section 5
     """
     
-    def __init__(self):
+    def __init__(self, reuse_buffer=False, dtype=np.float64):
         """
         Initialize closed-loop system from plant model and PID gains.
+        
+        Args:
+            reuse_buffer: If True, state_derivative writes into one
+                preallocated array and returns it on every call (no
+                allocation). Only safe for solvers that do not keep the
+                returned derivative between calls.
+            dtype: Floating dtype of the stored plant and closed-loop
+                matrices. float32 is enough for pole placement and halves
+                the memory traffic of batched eigvals over A_cl stacks.
         """
-        # Load plant model (verified from Step 2)
-        self.plant = FullStateSpaceModel()
+        self.dtype = np.dtype(dtype)
+        
+        # Load plant model (verified from Step 2); shared, read-only matrices
+        self.plant = get_default_plant(self.dtype)
         
         # Extract plant matrices
         self.A_plant = self.plant.A  # 4x4
@@ -77,6 +274,19 @@ class ClosedLoopSystem:
         self.B_ref = None  # 5x1 reference input matrix
         self.C_cl = None  # 1x5 output matrix
         
+        # RHS output buffer (shared between calls when reuse_buffer=True)
+        self.reuse_buffer = reuse_buffer
+        self._rhs_buf = np.empty(5)
+        
+        # Transfer function P(s)/P_ref(s) and step residues (built by to_tf)
+        self._tf = None
+        self._step_residues = None
+        
+        # Zero-order-hold discretisation (built by precompute_discrete)
+        self.Phi = None  # 5x5 state transition over one step
+        self.Gamma = None  # 5x1 reference input over one step
+        self.dt = None  # Step the discretisation was built for (s)
+        
         # Build augmented matrices
         self.build_augmented_matrices()
     
@@ -101,117 +311,46 @@ class ClosedLoopSystem:
         - Compute dP/dt = A[3,:] * X + B[3] * u
         - Substitute PID law into plant dynamics
         - Add integral state equation
+        
+        The construction is done (and memoised) by _build_cl_matrices in
+        float64; this instance gets its own writable copies in self.dtype.
         """
-        # Extract dimensions
-        n_plant = self.A_plant.shape[0]  # 4
-        n_aug = n_plant + 1  # 5 (add integral state)
-        
-        # Initialize augmented matrices
-        self.A_cl = np.zeros((n_aug, n_aug))
-        self.B_ref = np.zeros((n_aug, 1))
-        self.C_cl = np.zeros((1, n_aug))
-        
-        # ================================================================
-        # STEP 1: Extract pressure output row from C matrix
-        # C_plant = [0, 0, 0, Ks] extracts pressure
-        # Pressure is state x[3] (index 3)
-        # ================================================================
-        pressure_index = 3  # P is the 4th state (index 3)
-        
-        # ================================================================
-        # STEP 2: Compute error and its derivative
-        # e = P_ref - P = P_ref - x[3]
-        # de/dt = -dP/dt = -(A[3,:] @ X + B[3] * u)
-        # ================================================================
-        # Extract pressure dynamics row from A matrix
-        A_pressure_row = self.A_plant[pressure_index, :]  # Row that computes dP/dt
-        B_pressure = self.B_plant[pressure_index, 0]  # Pressure row of B
-        
-        # ================================================================
-        # STEP 3: PID Control Law
-        # u = Kp*e + Ki*e_int + Kd*de/dt
-        # u = Kp*(P_ref - P) + Ki*e_int + Kd*(-dP/dt)
-        # u = Kp*(P_ref - x[3]) + Ki*x[4] + Kd*(-(A[3,:] @ X + B[3]*u))
-        # 
-        # Solve for u:
-        # u = Kp*P_ref - Kp*x[3] + Ki*x[4] - Kd*A[3,:] @ X - Kd*B[3]*u
-        # u + Kd*B[3]*u = Kp*P_ref - Kp*x[3] + Ki*x[4] - Kd*A[3,:] @ X
-        # u*(1 + Kd*B[3]) = Kp*P_ref - Kp*x[3] + Ki*x[4] - Kd*A[3,:] @ X
-        # u = (Kp*P_ref - Kp*x[3] + Ki*x[4] - Kd*A[3,:] @ X) / (1 + Kd*B[3])
-        # ================================================================
-        
-        # Compute denominator for PID feedback
-        denom = 1.0 + self.Kd * B_pressure
-        
-        # Compute feedback gains for each state
-        # u = (1/denom) * [Kp*P_ref - Kp*x[3] + Ki*x[4] - Kd*A[3,:] @ X]
-        # u = (1/denom) * [Kp*P_ref + (-Kd*A[3,0])*x[0] + (-Kd*A[3,1])*x[1] 
-        #                  + (-Kd*A[3,2])*x[2] + (-Kp - Kd*A[3,3])*x[3] + Ki*x[4]]
-        
-        # Feedback gain vector for plant states [i, ω, θm, P]
-        K_feedback = np.zeros(n_plant)
-        K_feedback[0] = -self.Kd * A_pressure_row[0]  # Current
-        K_feedback[1] = -self.Kd * A_pressure_row[1]  # Velocity
-        K_feedback[2] = -self.Kd * A_pressure_row[2]  # Position
-        K_feedback[3] = -self.Kp - self.Kd * A_pressure_row[3]  # Pressure
-        
-        # Integral state feedback
-        K_integral = self.Ki
-        
-        # Reference feedforward
-        K_ref = self.Kp
-        
-        # Scale by denominator
-        K_feedback = K_feedback / denom
-        K_integral = K_integral / denom
-        K_ref = K_ref / denom
-        
-        # ================================================================
-        # STEP 4: Build closed-loop A matrix (5x5)
-        # 
-        # Plant dynamics with feedback:
-        # Ẋ_plant = A*X + B*u
-        # where u = K_feedback @ X_plant + K_integral * e_int + K_ref * P_ref
-        # 
-        # Ẋ_plant = A*X + B*(K_feedback @ X_plant + K_integral * e_int)
-        # Ẋ_plant = (A + B*K_feedback) @ X_plant + B*K_integral * e_int
-        # 
-        # Integral dynamics:
-        # ė_int = P_ref - P = P_ref - x[3]
-        # ================================================================
-        
-        # Upper-left block: Plant dynamics with state feedback (4x4)
-        A_cl_plant = self.A_plant + self.B_plant @ K_feedback.reshape(1, -1)
-        self.A_cl[0:n_plant, 0:n_plant] = A_cl_plant
-        
-        # Upper-right column: Integral feedback to plant states (4x1)
-        self.A_cl[0:n_plant, n_plant] = (self.B_plant * K_integral).flatten()
-        
-        # Bottom row: Integral state dynamics (1x5)
-        # ė_int = P_ref - P = -x[3] (when P_ref contribution goes to B_ref)
-        self.A_cl[n_plant, pressure_index] = -1.0  # -P term
-        # All other states don't affect integral directly
-        
-        # ================================================================
-        # STEP 5: Build reference input matrix B_ref (5x1)
-        # 
-        # Plant states: affected by u, which has K_ref * P_ref term
-        # Integral state: affected by P_ref directly
-        # ================================================================
-        
-        # Plant states get reference through control input
-        self.B_ref[0:n_plant, 0] = (self.B_plant * K_ref).flatten()
-        
-        # Integral state gets reference directly
-        self.B_ref[n_plant, 0] = 1.0  # +P_ref term in ė_int
-        
-        # ================================================================
-        # STEP 6: Build output matrix C_cl (1x5)
-        # 
-        # Output is pressure: y = P = x[3]
-        # ================================================================
-        self.C_cl[0, pressure_index] = 1.0  # Extract pressure state
+        A_cl, B_ref, C_cl = _build_cl_matrices(
+            self.A_plant.astype(np.float64).tobytes(),
+            self.B_plant.astype(np.float64).tobytes(),
+            self.A_plant.shape[0], self.Kp, self.Ki, self.Kd)
         
+        self.A_cl = A_cl.astype(self.dtype)
+        self.B_ref = B_ref.astype(self.dtype)
+        self.C_cl = C_cl.astype(self.dtype)
+        
+        self._cache_rhs_coefficients()
+    
+    def _cache_rhs_coefficients(self):
+        """
+        Cache the nonzero A_cl/B_ref entries used by the unrolled RHS kernel,
+        and the flat B_ref, Fortran-ordered A_cl and BLAS gemv used by the
+        dense fallback.
+        
+        Falls back to the dense matmul path (None) if the matrices do not
+        have the expected sparsity. Call again after editing A_cl or B_ref
+        in place.
+        """
+        A, b = self.A_cl, self.B_ref[:, 0]
+        # Dense fallback operands: gemv is called directly, skipping the
+        # per-call dispatch of np.dot that dominates a 5x5 product
+        self._B_ref_flat = b.copy()
+        self._A_cl_F = np.asfortranarray(A)
+        self._gemv = get_blas_funcs('gemv', (self._A_cl_F,))
+        if np.any(A[~_A_CL_PATTERN]) or np.any(b[~_B_REF_PATTERN]):
+            self._rhs_coeffs = None
+            return
+        self._rhs_coeffs = (
+            float(A[0, 0]), float(A[0, 1]), float(A[0, 2]), float(A[0, 3]),
+            float(A[0, 4]), float(A[1, 0]), float(A[2, 1]), float(A[3, 2]),
+            float(A[3, 3]), float(A[4, 3]), float(b[0]), float(b[4]),
+        )
+    
     def get_state_space_model(self):
         """
         Get closed-loop state-space matrices.
@@ -235,14 +374,211 @@ class ClosedLoopSystem:
             P_ref: Reference pressure (bar)
         
         Returns:
-            dX_aug_dt: Augmented state derivative
+            dX_aug_dt: Augmented state derivative. With reuse_buffer=True
+                this is the same array on every call (not reentrant: copy it
+                if it must survive the next call).
+        """
+        out = self._rhs_buf if self.reuse_buffer else np.empty(5)
+        
+        if self._rhs_coeffs is not None:
+            return _cl_rhs(self._rhs_coeffs, X_aug, P_ref, out)
+        
+        # Dense fallback: out = B_ref*P_ref, then gemv adds A_cl @ X_aug in place
+        np.multiply(self._B_ref_flat, P_ref, out=out)
+        return self._gemv(1.0, self._A_cl_F, X_aug, beta=1.0, y=out, overwrite_y=True)
+    
+    def poles(self):
+        """
+        Closed-loop poles (eigenvalues of A_cl), sorted by real part.
+        
+        Uses numpy.linalg.eigvals directly: for a 5x5 matrix its lower
+        wrapper overhead beats scipy.linalg.
+        
+        Returns:
+            poles: Complex array of 5 poles, most negative real part first
+        """
+        p = np.linalg.eigvals(self.A_cl)
+        return p[np.argsort(p.real)]
+    
+    @staticmethod
+    def poles_batch(A_cl_stack):
+        """
+        Closed-loop poles for a stack of A_cl matrices (e.g. a gain sweep).
+        
+        One eigvals call over the leading batch dimension instead of a Python
+        loop of per-matrix calls.
+        
+        Args:
+            A_cl_stack: Array of shape (..., 5, 5)
+        
+        Returns:
+            poles: Complex array of shape (..., 5), each row sorted by real part
+        """
+        p = np.linalg.eigvals(A_cl_stack)
+        return np.take_along_axis(p, np.argsort(p.real, axis=-1), axis=-1)
+    
+    def to_tf(self):
+        """
+        Closed-loop transfer function P(s)/P_ref(s) of the augmented system.
+        
+        Computed once with scipy.signal.ss2tf from (A_cl, B_ref, C_cl, 0) and
+        cached; the result can be passed to scipy.signal.step or lsim.
+        
+        Returns:
+            num: Numerator coefficients (highest power first)
+            den: Denominator coefficients (degree 5, monic)
+        """
+        if self._tf is None:
+            num, den = signal.ss2tf(self.A_cl, self.B_ref, self.C_cl,
+                                    np.zeros((1, 1)))
+            self._tf = (num[0], den)
+        return self._tf
+    
+    def step_response(self, t, P_ref=1.0):
+        """
+        Analytic pressure response to a reference step applied at t = 0.
+        
+        With simple poles, Y(s) = G(s)/s expands into partial fractions
+        sum r_k/(s - p_k), so y(t) = sum r_k exp(p_k t) is evaluated
+        directly at the requested times: no time stepping and no solver
+        error control. The residues are computed once and cached.
+        
+        Args:
+            t: Array of time points (s)
+            P_ref: Step amplitude (bar)
+        
+        Returns:
+            y: Pressure (bar) at each time in t
+        """
+        if self._step_residues is None:
+            num, den = self.to_tf()
+            r, p, _ = signal.residue(num, np.polymul(den, [1.0, 0.0]))
+            self._step_residues = (r, p)
+        
+        r, p = self._step_residues
+        t = np.asarray(t, dtype=float)
+        return P_ref * (np.exp(np.multiply.outer(t, p)) @ r).real
+    
+    def precompute_discrete(self, dt):
+        """
+        Precompute the exact zero-order-hold discretisation for step dt.
+        
+        A_cl and B_ref are constant, so for a reference held over each step
+        X[k+1] = Phi X[k] + Gamma P_ref[k] is exact, with Phi = exp(A_cl dt)
+        and Gamma = A_cl^-1 (Phi - I) B_ref. Both come from one matrix
+        exponential of the augmented block [[A_cl, B_ref], [0, 0]] (Van Loan),
+        which does not require A_cl to be invertible.
+        
+        Args:
+            dt: Sample period (s)
+        
+        Returns:
+            Phi: 5x5 discrete state matrix
+            Gamma: 5x1 discrete reference input matrix
+        """
+        n = self.A_cl.shape[0]
+        M = np.zeros((n + 1, n + 1))
+        M[:n, :n] = self.A_cl
+        M[:n, n:] = self.B_ref
+        E = expm(M * dt)
+        
+        self.Phi = E[:n, :n]
+        self.Gamma = E[:n, n:]
+        self.dt = dt
+        return self.Phi, self.Gamma
+    
+    def simulate(self, P_ref_trajectory, dt, X0=None):
+        """
+        Simulate the closed loop for a piecewise-constant reference.
+        
+        Each step is one 5x5 matrix-vector product with the precomputed
+        (Phi, Gamma) instead of an ODE solve with repeated RHS evaluations.
+        
+        Args:
+            P_ref_trajectory: Reference pressure held over each step (bar), length N
+            dt: Sample period (s)
+            X0: Initial augmented state (default: zeros)
+        
+        Returns:
+            X: Augmented state trajectory, shape (N+1, 5), X[0] = X0
+        """
+        if self.Phi is None or self.dt != dt:
+            self.precompute_discrete(dt)
+        
+        P_ref_trajectory = np.asarray(P_ref_trajectory, dtype=float)
+        n = self.A_cl.shape[0]
+        X = np.empty((len(P_ref_trajectory) + 1, n))
+        X[0] = 0.0 if X0 is None else X0
+        
+        Phi = self.Phi
+        Gamma = self.Gamma[:, 0]
+        for k, P_ref in enumerate(P_ref_trajectory):
+            X[k + 1] = Phi @ X[k] + Gamma * P_ref
+        
+        return X
+    
+    def simulate_batch(self, P_ref_trajectory, dt, X0):
+        """
+        Simulate M initial conditions at once (e.g. a Monte Carlo run).
+        
+        Same ZOH recursion as simulate, but each step advances the whole
+        (M, 5) ensemble with one matrix product, so the per-step Python
+        overhead is paid once per time step rather than once per member.
+        
+        Args:
+            P_ref_trajectory: Reference pressure held over each step (bar), length N
+            dt: Sample period (s)
+            X0: Initial augmented states, shape (M, 5)
+        
+        Returns:
+            X: Augmented state trajectories, shape (N+1, M, 5), X[0] = X0
         """
-        X_aug = np.array(X_aug).reshape(-1, 1)
-        P_ref_vec = np.array([[P_ref]])
+        if self.Phi is None or self.dt != dt:
+            self.precompute_discrete(dt)
+        
+        P_ref_trajectory = np.asarray(P_ref_trajectory, dtype=float)
+        X0 = np.asarray(X0, dtype=float)
+        X = np.empty((len(P_ref_trajectory) + 1,) + X0.shape)
+        X[0] = X0
         
-        dX_aug_dt = self.A_cl @ X_aug + self.B_ref @ P_ref_vec
+        Phi_T = np.ascontiguousarray(self.Phi.T)
+        Gamma = self.Gamma[:, 0]
+        for k, P_ref in enumerate(P_ref_trajectory):
+            np.matmul(X[k], Phi_T, out=X[k + 1])
+            X[k + 1] += Gamma * P_ref
+        
+        return X
+    
+    def integrate(self, X0, t_eval, P_ref=0.0):
+        """
+        Solve the closed loop for a constant reference at arbitrary times.
+        
+        The augmented system is LTI, so
+        X(t) = x_ss + V exp(Λt) V^-1 (X0 - x_ss),  x_ss = -A_cl^-1 B_ref P_ref
+        is evaluated for every t at once from one eigendecomposition, with
+        no per-step right-hand-side callbacks. Falls back to one expm per
+        time if the eigenvectors are ill-conditioned.
+        
+        Args:
+            X0: Initial augmented state [i, ω, θm, P, e_int]
+            t_eval: Times at which to return the state (s), from t = 0
+            P_ref: Reference pressure held from t = 0 (bar)
         
-        return dX_aug_dt.flatten()
+        Returns:
+            X: Augmented states, shape (len(t_eval), 5)
+        """
+        A = np.asarray(self.A_cl, dtype=np.float64)
+        t_eval = np.asarray(t_eval, dtype=np.float64)
+        x_ss = -np.linalg.solve(A, self.B_ref[:, 0] * P_ref)
+        d0 = np.asarray(X0, dtype=np.float64) - x_ss
+        
+        lam, V = np.linalg.eig(A)
+        if np.linalg.cond(V) < 1e8:
+            c = np.linalg.solve(V, d0)
+            X = (np.exp(np.outer(t_eval, lam)) * c) @ V.T
+            return X.real + x_ss
+        
+        return np.array([expm(A * t) @ d0 for t in t_eval]) + x_ss
     
     def output(self, X_aug):
         """
@@ -256,9 +592,8 @@ class ClosedLoopSystem:
         Returns:
             Y: Pressure output (bar)
         """
-        X_aug = np.array(X_aug).reshape(-1, 1)
-        Y = self.C_cl @ X_aug
-        return Y[0, 0]
+        # 1-D dot with the current C_cl row: no column reshape or copy of X_aug
+        return self.C_cl[0] @ np.asarray(X_aug)
     
     def validate_against_documentation(self):
         """
@@ -331,6 +666,73 @@ class ClosedLoopSystem:
         print("=" * 70)
 
 
+
+class EnsembleClosedLoopSystem:
+    """
+    Closed-loop systems for M PID gain triples, stored as contiguous stacks.
+    
+    All members share the FROZEN plant; only the gains differ. A_cl and
+    B_ref live in (M, 5, 5) and (M, 5) arrays instead of M separate
+    ClosedLoopSystem instances, so one batched product evaluates every
+    derivative of a parameter sweep.
+    """
+    
+    def __init__(self, Kp, Ki, Kd):
+        """
+        Build the ensemble for arrays of PID gains.
+        
+        Args:
+            Kp, Ki, Kd: PID gains, scalars or broadcastable 1-D arrays
+        
+        Raises:
+            ValueError: If the gains do not broadcast to a 1-D shape
+        """
+        self.plant = get_default_plant()
+        Kp, Ki, Kd = np.broadcast_arrays(*(np.atleast_1d(np.asarray(K, dtype=float))
+                                           for K in (Kp, Ki, Kd)))
+        if Kp.ndim != 1:
+            raise ValueError(f"PID gains must broadcast to a 1-D shape, got {Kp.shape}")
+        M = Kp.shape[0]
+        self.Kp, self.Ki, self.Kd = Kp, Ki, Kd
+        
+        b = self.plant.B[:, 0]
+        n_plant = b.shape[0]
+        K_ref = Kp / (1.0 + Kd * b[3])
+        
+        self.A_cl_stack = np.ascontiguousarray(
+            build_A_cl_batch(self.plant.A, self.plant.B, Kp, Ki, Kd))  # (M, 5, 5)
+        B_ref_stack = np.zeros((M, n_plant + 1))
+        B_ref_stack[:, :n_plant] = b * K_ref[:, None]
+        B_ref_stack[:, n_plant] = 1.0
+        self.B_ref_stack = B_ref_stack  # (M, 5)
+    
+    def __len__(self):
+        return self.A_cl_stack.shape[0]
+    
+    def state_derivative_batch(self, X, P_ref):
+        """
+        Compute every member's augmented state derivative.
+        
+        Ẋ_m = A_cl_m X_m + B_ref_m P_ref_m
+        
+        Args:
+            X: Augmented states, shape (M, 5)
+            P_ref: Reference pressure (bar), scalar or shape (M,)
+        
+        Returns:
+            dX_dt: Derivatives, shape (M, 5)
+        """
+        P_ref = np.asarray(P_ref, dtype=float)
+        return (np.einsum('mij,mj->mi', self.A_cl_stack, X)
+                + self.B_ref_stack * P_ref[..., None])
+    
+    def poles(self):
+        """
+        Closed-loop poles of every member, shape (M, 5).
+        """
+        return ClosedLoopSystem.poles_batch(self.A_cl_stack)
+
+
 if __name__ == "__main__":
     # Test closed-loop system construction
     cl_system = ClosedLoopSystem()
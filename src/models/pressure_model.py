@@ -18,12 +18,42 @@ Equation:
 - State-space form: dP/dt = (1/τp) * [Kp_pressure * (θm/N) - P]
 """
 
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import numpy as np
+
+if __name__ == "__main__":
+    # Run as a script (python models/pressure_model.py): put the package root on
+    # sys.path so the absolute imports below resolve
+    import sys
+    import os
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from config.system_parameters import params
 
+# ===================================================================
+# PRESSURE CONSTANTS (FROZEN, read once at import)
+# Derived constants are fused so the dynamics need no division per call:
+# dP/dt = Kp/τp * θv - P/τp = Kp/(N τp) * θm - P/τp
+# ===================================================================
+_PRESSURE_CONSTANTS = (params.Kp_pressure, params.tau_p, params.Ks, params.N,
+                       params.P_min, params.P_max, params.P_setpoint)
+_DERIVED_CONSTANTS = (
+    1.0 / params.tau_p,  # 1/τp
+    params.Kp_pressure / params.tau_p,  # Kp/τp
+    (params.Kp_pressure / params.N) / params.tau_p,  # Kp/(N τp)
+)
+
+
+def _pressure_rhs(P, theta_valve, Kp_over_tau, inv_tau_p):
+    """
+    First-order pressure right-hand side with the constants passed in.
+    
+    Module-level and free of object state, so ODE drivers can call it
+    directly with the constants bound once.
+    
+    Equation: dP/dt = (Kp_pressure/τp) * θv - P/τp
+    """
+    return Kp_over_tau * theta_valve - inv_tau_p * P
+
 
 class PressureModel:
     """
@@ -37,22 +67,19 @@ class PressureModel:
     def __init__(self):
         """
         Initialize pressure system parameters from centralized parameter authority.
-        All values loaded from config.system_parameters.
+        All values come from config.system_parameters, read once at import.
         """
-        # Operating parameters
-        self.P_min = params.P_min  # Minimum pressure (bar)
-        self.P_max = params.P_max  # Maximum pressure (bar)
-        self.P_setpoint = params.P_setpoint  # Setpoint pressure (bar)
-        
-        # Model parameters
-        self.Kp_pressure = params.Kp_pressure  # Pressure gain (bar/rad)
-        self.tau_p = params.tau_p  # Pressure time constant (s)
-        
-        # Sensor parameters
-        self.Ks = params.Ks  # Sensor gain (V/bar)
+        (self.Kp_pressure,  # Pressure gain (bar/rad)
+         self.tau_p,  # Pressure time constant (s)
+         self.Ks,  # Sensor gain (V/bar)
+         self.N,  # Gearbox ratio (needed for valve angle conversion)
+         self.P_min,  # Minimum pressure (bar)
+         self.P_max,  # Maximum pressure (bar)
+         self.P_setpoint,  # Setpoint pressure (bar)
+         ) = _PRESSURE_CONSTANTS
         
-        # Gearbox ratio (needed for valve angle conversion)
-        self.N = params.N
+        # Fused constants for the dynamics (see module constants)
+        self._inv_tau_p, self._Kp_over_tau, self._inv_N_Kp_over_tau = _DERIVED_CONSTANTS
     
     def pressure_dynamics(self, P, theta_valve):
         """
@@ -62,14 +89,35 @@ class PressureModel:
         Reference: Section 3 of numerical_state_space_and_simulation_specification.md
         
         Args:
-            P: Current pressure (bar)
-            theta_valve: Valve angular position (rad)
+            P: Current pressure (bar), scalar or array
+            theta_valve: Valve angular position (rad), scalar or array
         
         Returns:
             dP_dt: Rate of change of pressure (bar/s)
         """
-        dP_dt = (1.0 / self.tau_p) * (self.Kp_pressure * theta_valve - P)
-        return dP_dt
+        return _pressure_rhs(P, theta_valve, self._Kp_over_tau, self._inv_tau_p)
+    
+    def pressure_dynamics_batch(self, P_arr, theta_valve_arr, out=None):
+        """
+        Compute dP/dt for an ensemble of operating points without temporaries.
+        
+        Same equation as pressure_dynamics, evaluated elementwise in three
+        in-place ufunc passes over out.
+        
+        Args:
+            P_arr: Pressures (bar), array
+            theta_valve_arr: Valve angular positions (rad), broadcastable to P_arr
+            out: Optional float array to write dP/dt into
+        
+        Returns:
+            dP_dt: Rates of change of pressure (bar/s), out if given
+        """
+        if out is None:
+            out = np.empty(np.broadcast_shapes(np.shape(P_arr), np.shape(theta_valve_arr)))
+        np.multiply(theta_valve_arr, self.Kp_pressure, out=out)
+        np.subtract(out, P_arr, out=out)
+        np.multiply(out, self._inv_tau_p, out=out)
+        return out
     
     def pressure_dynamics_from_motor_angle(self, P, theta_motor):
         """
@@ -79,14 +127,13 @@ class PressureModel:
         Reference: Section 3 of numerical_state_space_and_simulation_specification.md
         
         Args:
-            P: Current pressure (bar)
-            theta_motor: Motor angular position (rad)
+            P: Current pressure (bar), scalar or array
+            theta_motor: Motor angular position (rad), scalar or array
         
         Returns:
             dP_dt: Rate of change of pressure (bar/s)
         """
-        theta_valve = theta_motor / self.N
-        return self.pressure_dynamics(P, theta_valve)
+        return _pressure_rhs(P, theta_motor, self._inv_N_Kp_over_tau, self._inv_tau_p)
     
     def sensor_output(self, P):
         """
@@ -103,24 +150,32 @@ class PressureModel:
         """
         return self.Ks * P
     
-    def validate_parameters(self):
+    def validate_parameters(self, verbose=True):
         """
         Validate that loaded parameters match documentation values.
         Cross-reference with numerical_state_space_and_simulation_specification.md
+        
+        Args:
+            verbose: Print the parameter report (False: assert only, for
+                callers that validate silently, e.g. tests or batch runs)
         """
-        print("\n--- Pressure Model Parameter Validation ---")
-        print(f"Operating range: {self.P_min}-{self.P_max} bar")
-        print(f"Setpoint: {self.P_setpoint} bar")
-        print(f"Kp_pressure = {self.Kp_pressure} bar/rad (expected: 150)")
-        print(f"τp = {self.tau_p} s (expected: 0.5)")
-        print(f"Ks = {self.Ks} V/bar (expected: 0.01)")
+        if not __debug__:
+            return  # Diagnostic only: the asserts below are stripped by python -O
+        if verbose:
+            print("\n--- Pressure Model Parameter Validation ---")
+            print(f"Operating range: {self.P_min}-{self.P_max} bar")
+            print(f"Setpoint: {self.P_setpoint} bar")
+            print(f"Kp_pressure = {self.Kp_pressure} bar/rad (expected: 150)")
+            print(f"τp = {self.tau_p} s (expected: 0.5)")
+            print(f"Ks = {self.Ks} V/bar (expected: 0.01)")
         
         # Check if values match expected
         assert abs(self.Kp_pressure - 150.0) < 1e-6, "Kp_pressure mismatch"
         assert abs(self.tau_p - 0.5) < 1e-6, "tau_p mismatch"
         assert abs(self.Ks - 0.01) < 1e-6, "Ks mismatch"
         
-        print("✓ All pressure model parameters validated")
+        if verbose:
+            print("✓ All pressure model parameters validated")
 
 
 if __name__ == "__main__":
@@ -17,11 +17,37 @@ Computed Parameters:
 - Total load torque: τ_load = τg + τf = 463.35 Nm
 """
 
+if __name__ == "__main__":
+    # Run as a script (python models/valve_model.py): put the package root on
+    # sys.path so the absolute imports below resolve
+    import sys
+    import os
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config.system_parameters import params
+
+# ===================================================================
+# VALVE CONSTANTS (FROZEN, computed once at import)
+# Module-level floats so simulation loops can use them without method
+# calls or attribute lookups.
+# ===================================================================
+_M_VALVE = params.m_valve  # Valve mass m (kg)
+_R_VALVE = params.r_valve  # Valve radius r (m)
+_TAU_FRICTION = params.tau_friction  # Static friction torque τf (Nm)
+_G = params.g  # Gravitational acceleration g (m/s²)
+
+J_VALVE = 0.5 * _M_VALVE * _R_VALVE * _R_VALVE  # J_valve = (1/2) * m * r²
+TAU_GRAVITY = _M_VALVE * _G * _R_VALVE  # τg = m * g * r
+TAU_LOAD_TOTAL = TAU_GRAVITY + _TAU_FRICTION  # τ_load = τg + τf
+
 
 class ValveModel:
     """
     Rotary valve mechanical model.
     
+    The computed parameters are the FROZEN module-level constants; the
+    compute_* methods return them without recomputing.
+    
     References:
     - industrial_pressure_control_system_design.md: Section 1.1, 1.2
     - numerical_state_space_and_simulation_specification.md: Section 1.1
@@ -43,14 +69,22 @@ class ValveModel:
         self.tau_load_total = None  # Total load torque (Nm)
         
         # Constants
-        self.g = 9.81  # Gravitational acceleration (m/s²)
+        self.g = _G  # Gravitational acceleration (m/s²)
+        
+        self.load_parameters()
     
     def load_parameters(self):
         """
         Load numerical parameters from documentation.
         Must match Section 1.1 of numerical_state_space_and_simulation_specification.md
         """
-        pass
+        self.m = _M_VALVE
+        self.r = _R_VALVE
+        self.tau_friction = _TAU_FRICTION
+        
+        self.J_valve = J_VALVE
+        self.tau_gravity = TAU_GRAVITY
+        self.tau_load_total = TAU_LOAD_TOTAL
     
     def compute_inertia(self):
         """
@@ -62,7 +96,7 @@ class ValveModel:
         Returns:
             J_valve: Moment of inertia (kg·m²)
         """
-        pass
+        return self.J_valve
     
     def compute_gravitational_torque(self):
         """
@@ -74,7 +108,7 @@ class ValveModel:
         Returns:
             tau_gravity: Gravitational torque (Nm)
         """
-        pass
+        return self.tau_gravity
     
     def compute_total_load_torque(self):
         """
@@ -86,14 +120,36 @@ class ValveModel:
         Returns:
             tau_load_total: Total load torque (Nm)
         """
-        pass
+        return self.tau_load_total
     
-    def validate_parameters(self):
+    def validate_parameters(self, verbose=True):
         """
         Validate that computed parameters match documentation values.
         Expected values from industrial_pressure_control_system_design.md:
         - J_valve = 6.125 kg·m²
         - τg = 343.35 Nm
         - τ_load = 463.35 Nm
+        
+        Args:
+            verbose: Print the parameter report (False: assert only, for
+                callers that validate silently, e.g. tests or batch runs)
         """
-        pass
+        if not __debug__:
+            return  # Diagnostic only: the asserts below are stripped by python -O
+        if verbose:
+            print("\n--- Valve Model Parameter Validation ---")
+            print(f"J_valve = {self.J_valve} kg·m² (expected: 6.125)")
+            print(f"τg = {self.tau_gravity} Nm (expected: 343.35)")
+            print(f"τ_load = {self.tau_load_total} Nm (expected: 463.35)")
+        
+        assert abs(self.J_valve - 6.125) < 1e-6, "J_valve mismatch"
+        assert abs(self.tau_gravity - 343.35) < 1e-6, "tau_gravity mismatch"
+        assert abs(self.tau_load_total - 463.35) < 1e-6, "tau_load_total mismatch"
+        
+        if verbose:
+            print("✓ All valve model parameters validated")
+
+
+if __name__ == "__main__":
+    valve = ValveModel()
+    valve.validate_parameters()
@@ -14,7 +14,16 @@ Test: Apply pressure setpoint step and observe:
 """
 
 import numpy as np
-from scipy.integrate import solve_ivp
+
+if __name__ == "__main__":
+    # Run as a script (python simulation/closed_loop_simulation.py): put the package root on
+    # sys.path so the absolute imports below resolve
+    import sys
+    import os
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from analysis.performance_metrics import PerformanceMetrics
+from simulation._closed_loop_builder import build_closed_loop, controller_gains
 
 
 class ClosedLoopSimulation:
@@ -38,21 +47,52 @@ class ClosedLoopSimulation:
         self.controller = pid_controller
         self.results = None
     
-    def run_setpoint_step(self, P_setpoint, t_final, initial_state=None):
+    def run_setpoint_step(self, P_setpoint, t_final, initial_state=None, dt=1e-3):
         """
         Simulate closed-loop step response to pressure setpoint.
         
+        The PID loop (derivative on measurement, integral state appended)
+        closes into a 5-state LTI system with a constant reference; its exact
+        discretisation comes from the shared build_closed_loop and is
+        stepped one matrix-vector product per sample into a preallocated
+        trajectory instead of integrating the ODE.
+        
         Args:
             P_setpoint: Pressure setpoint (bar)
             t_final: Simulation duration (s)
             initial_state: Initial state vector [i, ω, θm, P]
+            dt: Sample period (s)
         
         Returns:
             t: Time array
             X: State trajectory
             U: Control voltage trajectory
         """
-        pass
+        A, B, C = self.model.A, self.model.B, self.model.C
+        n = A.shape[0]
+        cl = build_closed_loop(A, B, C, *controller_gains(self.controller), dt)
+        
+        N = int(round(t_final / dt)) + 1
+        t = np.arange(N) * dt
+        # The loop compares r with the sensor output y = C x (volts)
+        r = self.model.Ks * P_setpoint
+        
+        # One column per sample (column-major, so each column is contiguous)
+        X_aug = np.empty((n + 1, N), order='F')
+        X_aug[:, 0] = 0.0
+        if initial_state is not None:
+            X_aug[:n, 0] = initial_state
+        Ad, Bd_r = cl.Ad, cl.Bd * r
+        for k in range(N - 1):
+            X_aug[:, k + 1] = Ad @ X_aug[:, k] + Bd_r
+        
+        # Outputs over the whole trajectory in one product each
+        X = X_aug[:n].T
+        U = cl.Ku @ X_aug + cl.Du * r
+        P = X_aug[3]
+        self.results = {'t': t, 'X': X, 'U': U, 'P': P,
+                        'e_int': X_aug[n], 'P_setpoint': P_setpoint}
+        return t, X, U
     
     def compute_performance_metrics(self):
         """
@@ -67,7 +107,16 @@ class ClosedLoopSimulation:
         Returns:
             metrics: Dictionary of performance metrics
         """
-        pass
+        r = self.results
+        t, P, P_sp = r['t'], r['P'], r['P_setpoint']
+        pm = PerformanceMetrics()
+        
+        return {
+            'settling_time': pm.compute_settling_time(t, P, P_sp),
+            'overshoot': pm.compute_overshoot(P, P_sp),
+            'steady_state_error': float(abs(P_sp - P[-1])),
+            'peak_current': float(np.max(np.abs(r['X'][:, 0]))),
+        }
     
     def validate_against_documentation(self, metrics):
         """
@@ -0,0 +1,38 @@
+"""
+JSON backend shared by the serialization property tests.
+
+Picks the fastest installed backend, none of them required:
+orjson -> python-rapidjson -> ujson -> stdlib json. All four produce
+compact JSON and raise a ValueError subclass on malformed input.
+"""
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+if orjson is not None:
+    def dumps(obj):
+        """Serialize obj to a compact JSON string."""
+        return orjson.dumps(obj).decode()
+
+    loads = orjson.loads
+else:
+    try:
+        import rapidjson as _backend
+    except ImportError:
+        try:
+            import ujson as _backend
+        except ImportError:
+            _backend = None
+
+    if _backend is not None:
+        dumps = _backend.dumps
+        loads = _backend.loads
+    else:
+        import json
+
+        # One encoder/decoder for every call instead of the instance
+        # json.dumps/json.loads set up per call for non-default options
+        dumps = json.JSONEncoder(separators=(",", ":"), ensure_ascii=False).encode
+        loads = json.JSONDecoder().decode
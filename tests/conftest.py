@@ -0,0 +1,37 @@
+"""
+Shared pytest fixtures.
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+import pytest
+from hypothesis import settings
+
+from models.closed_loop_model import ClosedLoopSystem
+from models.full_state_space_model import FullStateSpaceModel
+
+# Hypothesis profiles, chosen with HYPOTHESIS_PROFILE (default "dev").
+# "dev" keeps the local example database so previously failing inputs are
+# replayed first; "ci" is a smaller, derandomised budget (derandomize implies
+# no database, so every CI run draws the same examples).
+settings.register_profile("ci", max_examples=50, derandomize=True, print_blob=True)
+settings.register_profile("dev", max_examples=100)
+settings.load_profile(os.environ.get("HYPOTHESIS_PROFILE", "dev"))
+
+
+@pytest.fixture(scope="session")
+def cl_system():
+    """
+    One ClosedLoopSystem for the whole test session (tests only read it).
+    """
+    return ClosedLoopSystem()
+
+
+@pytest.fixture(scope="session")
+def plant_model():
+    """
+    One FullStateSpaceModel for the whole test session (tests only read it).
+    """
+    return FullStateSpaceModel()
@@ -0,0 +1,69 @@
+"""
+Bode Analysis Unit Tests
+
+Validates the eigen-decomposition frequency response against scipy.signal.bode.
+References:
+- final_verified_results_section.md (Section 5)
+"""
+
+import unittest
+import numpy as np
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from scipy import signal
+
+from analysis.bode_analysis import BodeAnalysis
+from models.full_state_space_model import FullStateSpaceModel
+
+
+class TestBodeAnalysis(unittest.TestCase):
+    """
+    Unit tests for BodeAnalysis class.
+    """
+
+    def setUp(self):
+        """
+        Set up test fixtures: plant and PID open loop.
+        """
+        model = FullStateSpaceModel()
+        num, den = signal.ss2tf(model.A, model.B, model.C, model.D)
+        num = np.trim_zeros(np.where(np.abs(num[0]) < 1e-9, 0.0, num[0]), 'f')
+        self.plant = signal.TransferFunction(num, den)
+        self.open_loop = signal.TransferFunction(
+            np.polymul([49.92, 115.2, 34.56], num), np.polymul([1.0, 0.0], den))
+
+    def test_matches_scipy_bode(self):
+        """
+        Test magnitude and phase against scipy.signal.bode.
+        """
+        for sys_ol in (self.plant, self.open_loop):
+            w, mag, phase = BodeAnalysis(sys_ol).compute_bode((0.01, 1000.0))
+            _, mag_ref, phase_ref = signal.bode(sys_ol, w=w)
+
+            np.testing.assert_allclose(mag, mag_ref, atol=1e-6)
+            np.testing.assert_allclose(phase, phase_ref, atol=1e-6)
+
+        print("✓ Bode response matches scipy.signal.bode")
+
+    def test_frequency_argument_forms(self):
+        """
+        Test that a tuple is a (w_min, w_max) range and an array is used as given.
+        """
+        bode = BodeAnalysis(self.plant)
+
+        w, _, _ = bode.compute_bode((0.1, 10.0))
+        self.assertEqual(len(w), 1000)
+        self.assertAlmostEqual(w[0], 0.1)
+        self.assertAlmostEqual(w[-1], 10.0)
+
+        w, mag, _ = bode.compute_bode(np.array([1.0, 5.0]))
+        np.testing.assert_array_equal(w, [1.0, 5.0])
+        self.assertEqual(mag.shape, (2,))
+
+        print("✓ Range tuples and explicit grids handled")
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -7,28 +7,25 @@ References:
 - docs/numerical_state_space_and_simulation_specification.md (Section 5)
 """
 
-import unittest
 import numpy as np
+import pytest
 import sys
 import os
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
 
-from models.closed_loop_model import ClosedLoopSystem
+from models.closed_loop_model import ClosedLoopSystem, EnsembleClosedLoopSystem, build_A_cl_batch
 from config.system_parameters import params
 
 
-class TestClosedLoopModel(unittest.TestCase):
+class TestClosedLoopModel:
     """
     Unit tests for ClosedLoopSystem class.
-    """
     
-    def setUp(self):
-        """
-        Set up test fixtures.
-        """
-        self.cl_system = ClosedLoopSystem()
+    The system comes from the session-scoped cl_system fixture in
+    conftest.py; the tests only read it.
+    """
     
-    def test_matrix_dimensions(self):
+    def test_matrix_dimensions(self, cl_system):
         """
         Test that all matrices have correct dimensions.
         
@@ -37,16 +34,13 @@ class TestClosedLoopModel(unittest.TestCase):
         - B_ref: 5x1 (reference input)
         - C_cl: 1x5 (pressure output)
         """
-        self.assertEqual(self.cl_system.A_cl.shape, (5, 5), 
-                        "A_cl should be 5x5")
-        self.assertEqual(self.cl_system.B_ref.shape, (5, 1), 
-                        "B_ref should be 5x1")
-        self.assertEqual(self.cl_system.C_cl.shape, (1, 5), 
-                        "C_cl should be 1x5")
+        assert cl_system.A_cl.shape == (5, 5), "A_cl should be 5x5"
+        assert cl_system.B_ref.shape == (5, 1), "B_ref should be 5x1"
+        assert cl_system.C_cl.shape == (1, 5), "C_cl should be 1x5"
         
         print("✓ All matrix dimensions correct")
     
-    def test_pid_gains_frozen(self):
+    def test_pid_gains_frozen(self, cl_system):
         """
         Test that PID gains match frozen documentation values.
         
@@ -56,30 +50,26 @@ class TestClosedLoopModel(unittest.TestCase):
         - Ki = 34.56
         - Kd = 49.92
         """
-        self.assertAlmostEqual(self.cl_system.Kp, 115.2, places=6,
-                              msg="Kp must be 115.2 (FROZEN)")
-        self.assertAlmostEqual(self.cl_system.Ki, 34.56, places=6,
-                              msg="Ki must be 34.56 (FROZEN)")
-        self.assertAlmostEqual(self.cl_system.Kd, 49.92, places=6,
-                              msg="Kd must be 49.92 (FROZEN)")
+        assert cl_system.Kp == pytest.approx(115.2, abs=1e-6), "Kp must be 115.2 (FROZEN)"
+        assert cl_system.Ki == pytest.approx(34.56, abs=1e-6), "Ki must be 34.56 (FROZEN)"
+        assert cl_system.Kd == pytest.approx(49.92, abs=1e-6), "Kd must be 49.92 (FROZEN)"
         
         print("✓ PID gains match frozen documentation values")
-        print(f"  Kp = {self.cl_system.Kp}")
-        print(f"  Ki = {self.cl_system.Ki}")
-        print(f"  Kd = {self.cl_system.Kd}")
+        print(f"  Kp = {cl_system.Kp}")
+        print(f"  Ki = {cl_system.Ki}")
+        print(f"  Kd = {cl_system.Kd}")
     
-    def test_sensor_gain_consistency(self):
+    def test_sensor_gain_consistency(self, cl_system):
         """
         Test that sensor gain matches documentation.
         
         Expected: Ks = 0.01 V/bar
         """
-        self.assertAlmostEqual(self.cl_system.Ks, 0.01, places=6,
-                              msg="Sensor gain must be 0.01")
+        assert cl_system.Ks == pytest.approx(0.01, abs=1e-6), "Sensor gain must be 0.01"
         
         print("✓ Sensor gain matches documentation")
     
-    def test_output_matrix_structure(self):
+    def test_output_matrix_structure(self, cl_system):
         """
         Test that C_cl correctly extracts pressure state.
         
@@ -88,13 +78,13 @@ class TestClosedLoopModel(unittest.TestCase):
         """
         expected_C_cl = np.array([[0.0, 0.0, 0.0, 1.0, 0.0]])
         
-        np.testing.assert_array_almost_equal(self.cl_system.C_cl, expected_C_cl,
+        np.testing.assert_array_almost_equal(cl_system.C_cl, expected_C_cl,
                                             decimal=6,
                                             err_msg="C_cl must extract pressure state")
         
         print("✓ Output matrix correctly extracts pressure")
     
-    def test_integral_state_equation(self):
+    def test_integral_state_equation(self, cl_system):
         """
         Test that integral state equation is correct.
         
@@ -105,46 +95,40 @@ class TestClosedLoopModel(unittest.TestCase):
         - A_cl[4, 3] = -1.0 (negative pressure feedback)
         - B_ref[4, 0] = 1.0 (positive reference)
         """
-        # Check integral state row in A_cl
-        self.assertAlmostEqual(self.cl_system.A_cl[4, 3], -1.0, places=6,
-                              msg="Integral state must have -P term")
-        
-        # Check that other plant states don't directly affect integral
-        self.assertAlmostEqual(self.cl_system.A_cl[4, 0], 0.0, places=6)
-        self.assertAlmostEqual(self.cl_system.A_cl[4, 1], 0.0, places=6)
-        self.assertAlmostEqual(self.cl_system.A_cl[4, 2], 0.0, places=6)
-        
-        # Check integral state doesn't feed back to itself
-        self.assertAlmostEqual(self.cl_system.A_cl[4, 4], 0.0, places=6)
+        # Check integral state row in A_cl: -P term only (other plant states
+        # don't directly affect the integral, no self-feedback)
+        np.testing.assert_allclose(cl_system.A_cl[4, :], [0.0, 0.0, 0.0, -1.0, 0.0],
+                                   rtol=0, atol=1e-6,
+                                   err_msg="Integral state must have only the -P term")
         
         # Check reference input to integral
-        self.assertAlmostEqual(self.cl_system.B_ref[4, 0], 1.0, places=6,
-                              msg="Integral state must have +P_ref term")
+        np.testing.assert_allclose(cl_system.B_ref[4, 0], 1.0, rtol=0, atol=1e-6,
+                                   err_msg="Integral state must have +P_ref term")
         
         print("✓ Integral state equation correct")
-        print(f"  A_cl[4,3] = {self.cl_system.A_cl[4,3]} (error feedback)")
-        print(f"  B_ref[4,0] = {self.cl_system.B_ref[4,0]} (reference)")
+        print(f"  A_cl[4,3] = {cl_system.A_cl[4,3]} (error feedback)")
+        print(f"  B_ref[4,0] = {cl_system.B_ref[4,0]} (reference)")
     
-    def test_plant_parameters_no_drift(self):
+    def test_plant_parameters_no_drift(self, cl_system):
         """
         Test that plant parameters haven't drifted from Step 2.
         
         This ensures closed-loop construction used correct plant model.
         """
         # Check plant matrix dimensions
-        self.assertEqual(self.cl_system.A_plant.shape, (4, 4))
-        self.assertEqual(self.cl_system.B_plant.shape, (4, 1))
-        self.assertEqual(self.cl_system.C_plant.shape, (1, 4))
+        assert cl_system.A_plant.shape == (4, 4)
+        assert cl_system.B_plant.shape == (4, 1)
+        assert cl_system.C_plant.shape == (1, 4)
         
         # Check key plant parameters
-        self.assertAlmostEqual(self.cl_system.plant.R, params.R, places=6)
-        self.assertAlmostEqual(self.cl_system.plant.L, params.L, places=6)
-        self.assertAlmostEqual(self.cl_system.plant.Kt, params.Kt, places=6)
-        self.assertAlmostEqual(self.cl_system.plant.Ke, params.Ke, places=6)
+        plant = cl_system.plant
+        np.testing.assert_allclose([plant.R, plant.L, plant.Kt, plant.Ke],
+                                   [params.R, params.L, params.Kt, params.Ke],
+                                   rtol=0, atol=1e-6)
         
         print("✓ Plant parameters consistent with Step 2")
     
-    def test_state_derivative_computation(self):
+    def test_state_derivative_computation(self, cl_system):
         """
         Test state derivative computation.
         
@@ -156,21 +140,182 @@ class TestClosedLoopModel(unittest.TestCase):
         t = 0.0
         
         # Compute derivative
-        dX_aug_dt = self.cl_system.state_derivative(t, X_aug, P_ref)
+        dX_aug_dt = cl_system.state_derivative(t, X_aug, P_ref)
         
-        # Manually compute expected
-        X_aug_col = X_aug.reshape(-1, 1)
-        P_ref_col = np.array([[P_ref]])
-        expected_dX_aug_dt = (self.cl_system.A_cl @ X_aug_col + 
-                             self.cl_system.B_ref @ P_ref_col).flatten()
+        # Manually compute expected (1-D throughout)
+        expected_dX_aug_dt = (cl_system.A_cl @ X_aug +
+                              cl_system.B_ref[:, 0] * P_ref)
         
         # Compare
         np.testing.assert_array_almost_equal(dX_aug_dt, expected_dX_aug_dt, 
                                             decimal=6)
         
+        # Dense fallback path (used when A_cl lacks the expected sparsity)
+        dense = ClosedLoopSystem()
+        dense._rhs_coeffs = None
+        np.testing.assert_allclose(dense.state_derivative(t, X_aug, P_ref),
+                                   expected_dX_aug_dt, rtol=1e-12)
+        
         print("✓ State derivative computation validated")
     
-    def test_output_computation(self):
+    def test_discrete_simulation_matches_ode(self, cl_system):
+        """
+        Test that the ZOH-discretised simulation matches an ODE solve.
+        
+        X[k+1] = Phi X[k] + Gamma P_ref is exact for a held reference.
+        """
+        from scipy.integrate import solve_ivp
+        
+        dt = 0.001
+        n_steps = 200
+        P_ref = 500.0
+        
+        X = cl_system.simulate(np.full(n_steps, P_ref), dt)
+        
+        sol = solve_ivp(lambda t, x: cl_system.state_derivative(t, x, P_ref),
+                        (0.0, n_steps * dt), np.zeros(5),
+                        rtol=1e-10, atol=1e-10, t_eval=[n_steps * dt])
+        
+        assert X.shape == (n_steps + 1, 5)
+        np.testing.assert_allclose(X[-1], sol.y[:, -1], rtol=1e-6)
+        
+        print("✓ Discrete simulation matches ODE solution")
+    
+    def test_simulate_batch_matches_simulate(self, cl_system):
+        """
+        Test that the ensemble simulation matches per-member simulation.
+        """
+        dt = 0.001
+        P_ref = np.full(50, 500.0)
+        X0 = np.array([[0.0, 0.0, 0.0, 0.0, 0.0],
+                       [0.1, 0.0, 0.0, 10.0, 0.0],
+                       [0.0, 1.0, 0.5, 0.0, 2.0]])
+        
+        X = cl_system.simulate_batch(P_ref, dt, X0)
+        
+        assert X.shape == (51, 3, 5)
+        for m in range(3):
+            np.testing.assert_allclose(X[:, m], cl_system.simulate(P_ref, dt, X0[m]),
+                                       rtol=1e-12, atol=1e-9)
+        
+        print("✓ Ensemble simulation matches per-member simulation")
+    
+    def test_integrate_matches_ode(self, cl_system):
+        """
+        Test that the eigendecomposition solution matches an ODE solve.
+        """
+        from scipy.integrate import solve_ivp
+        
+        P_ref = 500.0
+        X0 = np.array([0.1, 0.0, 0.0, 10.0, 0.0])
+        t_eval = np.linspace(0.0, 0.2, 21)
+        
+        X = cl_system.integrate(X0, t_eval, P_ref)
+        sol = solve_ivp(lambda t, x: cl_system.state_derivative(t, x, P_ref),
+                        (0.0, t_eval[-1]), X0, rtol=1e-10, atol=1e-10, t_eval=t_eval)
+        
+        assert X.shape == (21, 5)
+        np.testing.assert_allclose(X, sol.y.T, rtol=1e-6, atol=1e-6)
+        
+        print("✓ Closed-form integration matches ODE solution")
+    
+    def test_poles_batch_matches_single(self, cl_system):
+        """
+        Test that batched pole computation matches per-matrix poles().
+        """
+        poles = cl_system.poles()
+        stack = np.stack([cl_system.A_cl, 2.0 * cl_system.A_cl])
+        batch = ClosedLoopSystem.poles_batch(stack)
+        
+        assert batch.shape == (2, 5)
+        np.testing.assert_allclose(batch[0], poles, rtol=1e-10)
+        np.testing.assert_allclose(batch[1], 2.0 * poles, rtol=1e-10)
+        
+        print("✓ Batched poles match single-matrix poles")
+    
+    def test_step_response_matches_simulation(self, cl_system):
+        """
+        Test that the residue-based step response matches the ZOH simulation.
+        """
+        dt = 0.001
+        n_steps = 200
+        P_ref = 500.0
+        t = np.arange(n_steps + 1) * dt
+        
+        y = cl_system.step_response(t, P_ref)
+        X = cl_system.simulate(np.full(n_steps, P_ref), dt)
+        
+        num, den = cl_system.to_tf()
+        assert len(den) == 6
+        np.testing.assert_allclose(y, X[:, 3], rtol=1e-8, atol=1e-9)
+        
+        print("✓ Analytic step response matches simulation")
+    
+    def test_build_A_cl_batch_matches_single(self, cl_system):
+        """
+        Test that the broadcast gain-sweep builder reproduces A_cl.
+        """
+        Kp = np.array([cl_system.Kp, 2.0 * cl_system.Kp])
+        Ki = np.array([cl_system.Ki, 0.5 * cl_system.Ki])
+        A_cl = build_A_cl_batch(cl_system.A_plant, cl_system.B_plant,
+                                Kp, Ki, cl_system.Kd)
+        
+        assert A_cl.shape == (2, 5, 5)
+        np.testing.assert_allclose(A_cl[0], cl_system.A_cl, rtol=1e-12)
+        assert ClosedLoopSystem.poles_batch(A_cl).shape == (2, 5)
+        
+        print("✓ Batched A_cl construction matches ClosedLoopSystem")
+    
+    def test_ensemble_matches_single(self, cl_system):
+        """
+        Test that ensemble derivatives match per-instance evaluation.
+        """
+        Kp = np.array([cl_system.Kp, 2.0 * cl_system.Kp, cl_system.Kp])
+        ensemble = EnsembleClosedLoopSystem(Kp, cl_system.Ki, cl_system.Kd)
+        X = np.arange(15.0).reshape(3, 5)
+        P_ref = np.array([500.0, 400.0, 300.0])
+        
+        dX = ensemble.state_derivative_batch(X, P_ref)
+        
+        assert len(ensemble) == 3
+        assert dX.shape == (3, 5)
+        for m in (0, 2):
+            np.testing.assert_allclose(dX[m], cl_system.state_derivative(0.0, X[m], P_ref[m]),
+                                       rtol=1e-12)
+        np.testing.assert_allclose(dX[1], ensemble.A_cl_stack[1] @ X[1]
+                                   + ensemble.B_ref_stack[1] * P_ref[1], rtol=1e-12)
+        
+        print("✓ Ensemble derivatives match single-system evaluation")
+    
+    def test_ensemble_broadcasts_gains(self, cl_system):
+        """
+        Test that a scalar gain broadcasts against array gains and 2-D input is rejected.
+        """
+        Ki = np.array([cl_system.Ki, 0.5 * cl_system.Ki, 2.0 * cl_system.Ki])
+        ensemble = EnsembleClosedLoopSystem(cl_system.Kp, Ki, cl_system.Kd)
+        
+        assert len(ensemble) == 3
+        assert ensemble.B_ref_stack.shape == (3, 5)
+        np.testing.assert_allclose(ensemble.A_cl_stack[0], cl_system.A_cl, rtol=1e-12)
+        
+        with pytest.raises(ValueError):
+            EnsembleClosedLoopSystem(np.ones((2, 2)), cl_system.Ki, cl_system.Kd)
+        
+        print("✓ Ensemble gains broadcast to a common 1-D shape")
+    
+    def test_float32_poles_match_float64(self, cl_system):
+        """
+        Test that single-precision matrices keep the poles within 1e-4.
+        """
+        cl32 = ClosedLoopSystem(dtype=np.float32)
+        
+        assert cl32.A_cl.dtype == np.float32
+        assert cl32.plant.A.dtype == np.float32
+        np.testing.assert_allclose(cl32.poles(), cl_system.poles(), atol=1e-4)
+        
+        print("✓ float32 poles match float64 poles")
+    
+    def test_output_computation(self, cl_system):
         """
         Test output computation.
         
@@ -180,16 +325,16 @@ class TestClosedLoopModel(unittest.TestCase):
         X_aug = np.array([1.0, 2.0, 3.0, 100.0, 5.0])  # [i, ω, θm, P, e_int]
         
         # Compute output
-        Y = self.cl_system.output(X_aug)
+        Y = cl_system.output(X_aug)
         
         # Expected: Y = P = 100.0
         expected_Y = X_aug[3]
         
-        self.assertAlmostEqual(Y, expected_Y, places=6)
+        assert Y == pytest.approx(expected_Y, abs=1e-6)
         
         print("✓ Output computation validated")
     
-    def test_zero_steady_state_error_structure(self):
+    def test_zero_steady_state_error_structure(self, cl_system):
         """
         Test structural property for zero steady-state error.
         
@@ -202,60 +347,55 @@ class TestClosedLoopModel(unittest.TestCase):
         - Integral state feeds back to control: u includes Ki*e_int
         """
         # Check augmented system has 5 states (includes integral)
-        self.assertEqual(self.cl_system.A_cl.shape[0], 5,
-                        "System must have integral state for zero SS error")
+        assert cl_system.A_cl.shape[0] == 5, "System must have integral state for zero SS error"
         
         # Check integral state equation structure
         # Row 4 (index 4) should be: [0, 0, 0, -1, 0] for A_cl
-        integral_row = self.cl_system.A_cl[4, :]
+        integral_row = cl_system.A_cl[4, :]
         expected_integral_row = np.array([0.0, 0.0, 0.0, -1.0, 0.0])
-        np.testing.assert_array_almost_equal(integral_row, expected_integral_row,
-                                            decimal=6,
-                                            err_msg="Integral state structure incorrect")
+        np.testing.assert_allclose(integral_row, expected_integral_row, rtol=0, atol=1e-6,
+                                   err_msg="Integral state structure incorrect")
         
         # Check integral state has non-zero feedback to plant
         # Column 4 (index 4) of A_cl should have non-zero entry in row 0
         # (integral feeds back through control input to current)
-        integral_feedback = self.cl_system.A_cl[0, 4]
-        self.assertNotAlmostEqual(integral_feedback, 0.0, places=2,
-                                 msg="Integral state must feed back to plant")
+        integral_feedback = cl_system.A_cl[0, 4]
+        assert abs(integral_feedback) > 0.005, "Integral state must feed back to plant"
         
         print("✓ Zero steady-state error structure validated")
         print(f"  Integral feedback gain: {integral_feedback}")
     
-    def test_matrix_numerical_consistency(self):
+    def test_matrix_numerical_consistency(self, cl_system):
         """
         Test that closed-loop matrices are numerically consistent.
         
         Recompute key elements and verify they match.
         """
         # Extract plant matrices
-        A = self.cl_system.A_plant
-        B = self.cl_system.B_plant
+        A = cl_system.A_plant
+        B = cl_system.B_plant
         
         # Extract pressure dynamics row
         A_pressure_row = A[3, :]
         B_pressure = B[3, 0]
         
         # Compute PID denominator
-        denom = 1.0 + self.cl_system.Kd * B_pressure
+        denom = 1.0 + cl_system.Kd * B_pressure
         
         # Verify denominator is positive (stability requirement)
-        self.assertGreater(denom, 0.0, "PID denominator must be positive")
+        assert denom > 0.0, "PID denominator must be positive"
         
         # Compute expected feedback gains
-        K_feedback_expected = np.zeros(4)
-        K_feedback_expected[0] = -self.cl_system.Kd * A_pressure_row[0] / denom
-        K_feedback_expected[1] = -self.cl_system.Kd * A_pressure_row[1] / denom
-        K_feedback_expected[2] = -self.cl_system.Kd * A_pressure_row[2] / denom
-        K_feedback_expected[3] = (-self.cl_system.Kp - self.cl_system.Kd * A_pressure_row[3]) / denom
+        # -Kd*A[3,:] on every state, plus -Kp on the pressure state
+        K_feedback_expected = (-cl_system.Kd * A_pressure_row
+                               - cl_system.Kp * np.array([0.0, 0.0, 0.0, 1.0])) / denom
         
         # Compute expected A_cl upper-left block
         A_cl_plant_expected = A + B @ K_feedback_expected.reshape(1, -1)
         
         # Compare with actual
         np.testing.assert_array_almost_equal(
-            self.cl_system.A_cl[0:4, 0:4], 
+            cl_system.A_cl[0:4, 0:4], 
             A_cl_plant_expected,
             decimal=6,
             err_msg="A_cl plant block doesn't match recomputed values"
@@ -266,4 +406,4 @@ class TestClosedLoopModel(unittest.TestCase):
 
 
 if __name__ == '__main__':
-    unittest.main(verbosity=2)
+    pytest.main([__file__, '-v'])
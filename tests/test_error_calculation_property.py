@@ -8,11 +8,33 @@ This test verifies that the error calculation (setpoint - pressure)
 is correct and properly formatted to 2 decimal places.
 """
 
+import math
+from decimal import Decimal, ROUND_HALF_UP
+from fractions import Fraction
+
+import numpy as np
 import pytest
 from hypothesis import given, strategies as st
 
 
+_CENT = Decimal("0.01")
+
+# |100 x| within this of a half-cent is re-rounded exactly (the float
+# product x * 100 carries at most ~1e-13 error over the 0-700 bar range)
+_TIE_BAND = 1e-6
+
+
 # Helper functions for error calculation
+def _round2(x):
+    """
+    Round to 2 decimal places, half away from zero, on the exact value of x.
+    
+    This is the rule of QString::number(x, 'f', 2): 0.125 (exactly
+    representable) gives 0.13, where round(x, 2) and '%.2f' give 0.12.
+    """
+    return float(Decimal(x).quantize(_CENT, rounding=ROUND_HALF_UP))
+
+
 def calculate_error(setpoint, pressure):
     """
     Calculate pressure error.
@@ -30,7 +52,30 @@ def calculate_error(setpoint, pressure):
     """
     error = setpoint - pressure
     # Format to 2 decimal places (mimics QString::number(error, 'f', 2))
-    return round(error, 2)
+    return _round2(error)
+
+
+def calculate_error_batch(setpoints, pressures):
+    """
+    Calculate pressure errors for arrays of setpoints and pressures.
+    
+    Args:
+        setpoints: Target pressures (bar), scalar or array
+        pressures: Current pressures (bar), array
+    
+    Returns:
+        Array of errors rounded to 2 decimal places, same rule as
+        calculate_error (half away from zero)
+    """
+    errors = np.subtract(setpoints, pressures)
+    scaled = np.abs(errors) * 100.0
+    rounded = np.copysign(np.floor(scaled + 0.5), errors) / 100.0
+    
+    # floor(|100 x| + 0.5) is only in doubt next to a half-cent, where the
+    # float product may have crossed it; redo those with the exact rule
+    near_tie = np.abs(scaled - np.floor(scaled) - 0.5) < _TIE_BAND
+    rounded[near_tie] = [_round2(e) for e in errors[near_tie].tolist()]
+    return rounded
 
 
 def format_error(error):
@@ -46,24 +91,36 @@ def format_error(error):
     return f"{error:.2f}"
 
 
-# Hypothesis strategy for generating pressure values
-@st.composite
-def pressure_values_strategy(draw):
+# Hypothesis strategy for generating batches of pressure values
+def pressure_batches_strategy():
     """
-    Generate random pressure values.
+    Generate arrays of random pressure values.
     
     Range: 0-700 bar (valid pressure range from Requirements 6.1)
     Allows for edge cases at boundaries
     Excludes NaN and infinity
+    One example checks a whole batch, so the per-example framework cost
+    is amortised over up to 1024 values.
+    """
+    return st.lists(st.floats(min_value=0.0, max_value=700.0,
+                              allow_nan=False, allow_infinity=False),
+                    min_size=128, max_size=1024).map(np.asarray)
+
+
+def _expected_error(setpoint, pressure):
+    """
+    Reference error for the property test: the exact value of the double
+    setpoint - pressure, rounded half away from zero to 2 places in
+    rational arithmetic.
     """
-    pressure = draw(st.floats(min_value=0.0, max_value=700.0,
-                              allow_nan=False, allow_infinity=False))
-    return pressure
+    cents = Fraction(setpoint - pressure) * 100
+    rounded = math.floor(abs(cents) + Fraction(1, 2))
+    return math.copysign(rounded, cents) / 100
 
 
 # Property Test
-@given(pressure=pressure_values_strategy())
-def test_error_calculation_property(pressure):
+@given(pressures=pressure_batches_strategy())
+def test_error_calculation_property(pressures):
     """
     **Validates: Requirements 5.1**
     
@@ -80,28 +137,30 @@ def test_error_calculation_property(pressure):
     """
     setpoint = 500.0  # Standard setpoint from requirements
     
-    # Calculate error
-    error = calculate_error(setpoint, pressure)
-    
-    # Verify error formula: error = setpoint - pressure
-    expected_error = setpoint - pressure
-    
-    # Round expected error to 2 decimal places for comparison
-    expected_error_rounded = round(expected_error, 2)
+    # Calculate errors for the whole batch and one at a time
+    errors = calculate_error_batch(setpoint, pressures)
+    scalar_errors = [calculate_error(setpoint, p) for p in pressures.tolist()]
     
-    # Verify error matches expected value
+    # Verify error formula: error = setpoint - pressure, rounded to 2 places
+    # (expectation from exact rational arithmetic, not the helpers under test)
     tolerance = 0.01  # Allow for rounding differences
-    assert abs(error - expected_error_rounded) < tolerance, \
-        f"Error mismatch: {error} != {expected_error_rounded} (pressure={pressure})"
+    for pressure, error in zip(pressures.tolist(), scalar_errors):
+        expected_error_rounded = _expected_error(setpoint, pressure)
+        assert abs(error - expected_error_rounded) < tolerance, \
+            f"Error mismatch: {error} != {expected_error_rounded} (pressure={pressure})"
     
-    # Verify formatting to 2 decimal places
-    error_str = format_error(error)
+    # Batch path matches the scalar path element for element
+    mismatch = errors != scalar_errors
+    assert not mismatch.any(), \
+        f"Scalar/batch mismatch at pressures {pressures[mismatch]}"
     
-    # Check that string has exactly 2 decimal places
-    if '.' in error_str:
-        decimal_part = error_str.split('.')[1]
-        assert len(decimal_part) == 2, \
-            f"Error should have 2 decimal places, got {len(decimal_part)}: {error_str}"
+    # Check that every string has exactly 2 decimal places
+    for error in errors.tolist():
+        error_str = format_error(error)
+        if '.' in error_str:
+            decimal_part = error_str.split('.')[1]
+            assert len(decimal_part) == 2, \
+                f"Error should have 2 decimal places, got {len(decimal_part)}: {error_str}"
 
 
 # Edge case tests
@@ -132,23 +191,32 @@ def test_error_calculation_edge_cases():
         (525.01, -25.01, "Just beyond negative threshold (WARNING)"),
         (250.0, 250.0, "Large positive error"),
         (650.0, -150.0, "Large negative error"),
+        (499.875, 0.13, "Exact half-cent tie (rounds away from zero)"),
+        (500.125, -0.13, "Exact negative half-cent tie"),
+        (499.625, 0.38, "Exact half-cent tie above an even cent"),
+        (500.375, -0.38, "Exact negative half-cent tie above an even cent"),
     ]
     
-    for pressure, expected_error, description in test_cases:
-        # Calculate error
-        error = calculate_error(setpoint, pressure)
-        
-        # Verify error value
-        tolerance = 0.01
-        assert abs(error - expected_error) < tolerance, \
-            f"{description}: error mismatch {error} != {expected_error}"
-        
-        # Verify formatting
-        error_str = format_error(error)
-        if '.' in error_str:
-            decimal_part = error_str.split('.')[1]
-            assert len(decimal_part) == 2, \
-                f"{description}: should have 2 decimal places, got {error_str}"
+    # Table as parallel arrays, checked in one comparison
+    pressures = np.array([case[0] for case in test_cases])
+    expected_errors = np.array([case[1] for case in test_cases])
+    
+    # Verify error values
+    errors = calculate_error_batch(setpoint, pressures)
+    tolerance = 0.01
+    mismatch = np.abs(errors - expected_errors) >= tolerance
+    assert not mismatch.any(), \
+        f"Error mismatch: {[case[2] for case, bad in zip(test_cases, mismatch) if bad]}"
+    
+    # Scalar and batch paths round identically, ties included
+    scalar_errors = [calculate_error(setpoint, p) for p in pressures.tolist()]
+    assert np.array_equal(errors, scalar_errors), \
+        f"Scalar/batch mismatch: {scalar_errors} != {errors.tolist()}"
+    
+    # Verify formatting
+    decimal_lengths = np.array([len(format_error(e).split('.')[1]) for e in errors])
+    assert (decimal_lengths == 2).all(), \
+        f"Should have 2 decimal places: {[format_error(e) for e in errors]}"
 
 
 def test_error_calculation_formula():
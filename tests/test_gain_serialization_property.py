@@ -10,9 +10,26 @@ with correct values.
 """
 
 import json
+import re
+from math import isclose
+import sys
+import os
 import pytest
 from hypothesis import given, strategies as st
 
+# tests/ itself on the path so the shared JSON backend module also
+# imports when this file is run as a script
+sys.path.insert(0, os.path.dirname(__file__))
+
+from _fastjson import dumps as _dumps, loads as _loads
+
+# Sentinel for absent fields (a gain may legitimately be null)
+_MISSING = object()
+
+# parse_gains error messages (compiled once; pytest.raises accepts patterns)
+_INVALID_JSON_RE = re.compile(r"Invalid JSON")
+_MISSING_FIELDS_RE = re.compile(r"missing required fields")
+
 
 # Helper functions for gain serialization
 def serialize_gains(Kp, Ki, Kd):
@@ -40,7 +57,7 @@ def serialize_gains(Kp, Ki, Kd):
         "Ki": Ki,
         "Kd": Kd
     }
-    return json.dumps(gain_dict)
+    return _dumps(gain_dict)
 
 
 def parse_gains(json_str):
@@ -62,42 +79,31 @@ def parse_gains(json_str):
         ValueError: If JSON is invalid or missing required fields
     """
     try:
-        data = json.loads(json_str)
-    except json.JSONDecodeError as e:
+        data = _loads(json_str)
+    except ValueError as e:  # every _fastjson backend raises a ValueError subclass
         raise ValueError(f"Invalid JSON: {e}")
     
-    # Check for required fields
-    if 'Kp' not in data or 'Ki' not in data or 'Kd' not in data:
+    # One lookup per required field
+    Kp = data.get("Kp", _MISSING)
+    Ki = data.get("Ki", _MISSING)
+    Kd = data.get("Kd", _MISSING)
+    if Kp is _MISSING or Ki is _MISSING or Kd is _MISSING:
         raise ValueError("JSON missing required fields (Kp, Ki, Kd)")
     
-    return {
-        "Kp": data["Kp"],
-        "Ki": data["Ki"],
-        "Kd": data["Kd"]
-    }
+    return {"Kp": Kp, "Ki": Ki, "Kd": Kd}
 
 
 # Hypothesis strategy for generating gain values
-@st.composite
-def gain_values_strategy(draw):
-    """
-    Generate random PID gain values.
-    
-    Range: 0-1000 for each gain (typical range for industrial controllers)
-    Allows for zero gains (edge case)
-    Excludes NaN and infinity
-    """
-    Kp = draw(st.floats(min_value=0.0, max_value=1000.0, 
-                        allow_nan=False, allow_infinity=False))
-    Ki = draw(st.floats(min_value=0.0, max_value=1000.0,
-                        allow_nan=False, allow_infinity=False))
-    Kd = draw(st.floats(min_value=0.0, max_value=1000.0,
-                        allow_nan=False, allow_infinity=False))
-    return (Kp, Ki, Kd)
+# Range: 0-1000 for each gain (typical range for industrial controllers)
+# Allows for zero gains (edge case)
+# Excludes NaN and infinity
+_GAIN = st.floats(min_value=0.0, max_value=1000.0,
+                  allow_nan=False, allow_infinity=False)
+gain_values_strategy = st.tuples(_GAIN, _GAIN, _GAIN)  # (Kp, Ki, Kd)
 
 
 # Property Test
-@given(gains=gain_values_strategy())
+@given(gains=gain_values_strategy)
 def test_gain_serialization_property(gains):
     """
     **Validates: Requirements 3.4**
@@ -119,8 +125,9 @@ def test_gain_serialization_property(gains):
     # Serialize gains to JSON
     json_str = serialize_gains(Kp, Ki, Kd)
     
-    # Verify JSON is valid by parsing it
-    parsed = parse_gains(json_str)
+    # Verify JSON is valid by parsing it (the raw decode: parse_gains'
+    # error paths are covered by test_gain_serialization_invalid_json)
+    parsed = _loads(json_str)
     
     # Verify all three fields are present
     assert "Kp" in parsed, "JSON missing Kp field"
@@ -130,46 +137,42 @@ def test_gain_serialization_property(gains):
     # Verify values match within tolerance
     # Use small tolerance for floating-point comparison
     tolerance = 1e-10
-    assert abs(parsed["Kp"] - Kp) < tolerance, f"Kp mismatch: {parsed['Kp']} != {Kp}"
-    assert abs(parsed["Ki"] - Ki) < tolerance, f"Ki mismatch: {parsed['Ki']} != {Ki}"
-    assert abs(parsed["Kd"] - Kd) < tolerance, f"Kd mismatch: {parsed['Kd']} != {Kd}"
+    assert isclose(parsed["Kp"], Kp, rel_tol=0.0, abs_tol=tolerance), f"Kp mismatch: {parsed['Kp']} != {Kp}"
+    assert isclose(parsed["Ki"], Ki, rel_tol=0.0, abs_tol=tolerance), f"Ki mismatch: {parsed['Ki']} != {Ki}"
+    assert isclose(parsed["Kd"], Kd, rel_tol=0.0, abs_tol=tolerance), f"Kd mismatch: {parsed['Kd']} != {Kd}"
 
 
 # Edge case tests
-def test_gain_serialization_edge_cases():
+# Edge cases:
+# 1. Zero gains (all zeros)
+# 2. Maximum gains (1000.0 for all)
+# 3. Typical operating values
+# 4. Mixed values (some zero, some non-zero)
+@pytest.mark.parametrize("Kp,Ki,Kd,description", [
+    (0.0, 0.0, 0.0, "All zero gains"),
+    (1000.0, 1000.0, 1000.0, "Maximum gains"),
+    (115.2, 34.56, 49.92, "Typical operating values"),
+    (0.0, 100.0, 50.0, "Zero Kp"),
+    (100.0, 0.0, 50.0, "Zero Ki"),
+    (100.0, 50.0, 0.0, "Zero Kd"),
+    (0.001, 0.001, 0.001, "Very small gains"),
+    (999.999, 999.999, 999.999, "Near maximum gains"),
+])
+def test_gain_serialization_edge_cases(Kp, Ki, Kd, description):
     """
     Test specific edge cases for gain serialization.
-    
-    Edge cases:
-    1. Zero gains (all zeros)
-    2. Maximum gains (1000.0 for all)
-    3. Typical operating values
-    4. Mixed values (some zero, some non-zero)
     """
-    test_cases = [
-        # (Kp, Ki, Kd, description)
-        (0.0, 0.0, 0.0, "All zero gains"),
-        (1000.0, 1000.0, 1000.0, "Maximum gains"),
-        (115.2, 34.56, 49.92, "Typical operating values"),
-        (0.0, 100.0, 50.0, "Zero Kp"),
-        (100.0, 0.0, 50.0, "Zero Ki"),
-        (100.0, 50.0, 0.0, "Zero Kd"),
-        (0.001, 0.001, 0.001, "Very small gains"),
-        (999.999, 999.999, 999.999, "Near maximum gains"),
-    ]
-    
-    for Kp, Ki, Kd, description in test_cases:
-        # Serialize
-        json_str = serialize_gains(Kp, Ki, Kd)
-        
-        # Parse
-        parsed = parse_gains(json_str)
-        
-        # Verify
-        tolerance = 1e-10
-        assert abs(parsed["Kp"] - Kp) < tolerance, f"{description}: Kp mismatch"
-        assert abs(parsed["Ki"] - Ki) < tolerance, f"{description}: Ki mismatch"
-        assert abs(parsed["Kd"] - Kd) < tolerance, f"{description}: Kd mismatch"
+    # Serialize
+    json_str = serialize_gains(Kp, Ki, Kd)
+    
+    # Parse
+    parsed = parse_gains(json_str)
+    
+    # Verify
+    tolerance = 1e-10
+    assert isclose(parsed["Kp"], Kp, rel_tol=0.0, abs_tol=tolerance), f"{description}: Kp mismatch"
+    assert isclose(parsed["Ki"], Ki, rel_tol=0.0, abs_tol=tolerance), f"{description}: Ki mismatch"
+    assert isclose(parsed["Kd"], Kd, rel_tol=0.0, abs_tol=tolerance), f"{description}: Kd mismatch"
 
 
 def test_gain_serialization_json_format():
@@ -214,23 +217,23 @@ def test_gain_serialization_invalid_json():
     3. Wrong field names
     """
     # Malformed JSON
-    with pytest.raises(ValueError, match="Invalid JSON"):
+    with pytest.raises(ValueError, match=_INVALID_JSON_RE):
         parse_gains("{invalid json}")
     
     # Missing Kp
-    with pytest.raises(ValueError, match="missing required fields"):
+    with pytest.raises(ValueError, match=_MISSING_FIELDS_RE):
         parse_gains('{"Ki": 10.0, "Kd": 5.0}')
     
     # Missing Ki
-    with pytest.raises(ValueError, match="missing required fields"):
+    with pytest.raises(ValueError, match=_MISSING_FIELDS_RE):
         parse_gains('{"Kp": 10.0, "Kd": 5.0}')
     
     # Missing Kd
-    with pytest.raises(ValueError, match="missing required fields"):
+    with pytest.raises(ValueError, match=_MISSING_FIELDS_RE):
         parse_gains('{"Kp": 10.0, "Ki": 5.0}')
     
     # Wrong field names
-    with pytest.raises(ValueError, match="missing required fields"):
+    with pytest.raises(ValueError, match=_MISSING_FIELDS_RE):
         parse_gains('{"P": 10.0, "I": 5.0, "D": 2.0}')
 
 
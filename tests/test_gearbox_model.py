@@ -0,0 +1,64 @@
+"""
+Gearbox Model Unit Tests
+
+Validates gearbox reflection equations against documentation.
+References:
+- docs/industrial_pressure_control_system_design.md (Section 1.3)
+- docs/numerical_state_space_and_simulation_specification.md (Section 1.1)
+"""
+
+import unittest
+import numpy as np
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from models.gearbox_model import GearboxModel
+from config.system_parameters import params
+
+
+class TestGearboxModel(unittest.TestCase):
+    """
+    Unit tests for GearboxModel class.
+    """
+    
+    def setUp(self):
+        """
+        Set up test fixtures.
+        """
+        self.gearbox = GearboxModel()
+    
+    def test_parameter_values(self):
+        """
+        Test that gear ratio and efficiency match documentation (N = 40, η = 0.85).
+        """
+        self.assertEqual(self.gearbox.N, 40)
+        self.assertAlmostEqual(self.gearbox.eta, 0.85, places=6)
+        
+        print("✓ Gearbox parameters match documentation")
+    
+    def test_reflection_equations(self):
+        """
+        Test torque, inertia and angle reflection against the documented formulas.
+        """
+        self.assertAlmostEqual(self.gearbox.reflect_torque_to_motor(params.tau_load_total),
+                               params.tau_load_total / (0.85 * 40), places=12)
+        self.assertAlmostEqual(self.gearbox.reflect_inertia_to_motor(params.J_valve),
+                               params.J_ref, places=12)
+        self.assertAlmostEqual(self.gearbox.motor_angle_to_valve_angle(40.0), 1.0, places=12)
+        
+        print("✓ Reflection equations validated")
+    
+    def test_array_inputs(self):
+        """
+        Test that reflections broadcast over arrays of operating points.
+        """
+        theta_m = np.linspace(0.0, 80.0, 5)
+        np.testing.assert_allclose(self.gearbox.motor_angle_to_valve_angle(theta_m),
+                                   theta_m / 40.0)
+        
+        print("✓ Array inputs supported")
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -8,35 +8,49 @@ This test verifies that data points can be serialized to JSON and parsed back
 with all fields preserved within acceptable tolerance.
 """
 
-import json
+from math import isclose
+import sys
+import os
 import pytest
 from hypothesis import given, strategies as st
 
+# tests/ itself on the path so the shared JSON backend module also
+# imports when this file is run as a script
+sys.path.insert(0, os.path.dirname(__file__))
 
-# Strategy for generating valid data points
-@st.composite
-def data_point_strategy(draw):
-    """Generate random data points with valid ranges."""
-    return {
-        "pressure": draw(st.floats(min_value=0.0, max_value=700.0, allow_nan=False, allow_infinity=False)),
-        "valve_angle": draw(st.floats(min_value=0.0, max_value=180.0, allow_nan=False, allow_infinity=False)),
-        "motor_current": draw(st.floats(min_value=0.0, max_value=25.0, allow_nan=False, allow_infinity=False)),
-        "setpoint": 500.0,  # Constant as per spec
-        "timestamp": draw(st.floats(min_value=0.0, max_value=1000.0, allow_nan=False, allow_infinity=False))
-    }
+from _fastjson import dumps as _dumps, loads as _loads
+
+
+# The five fields every data point carries (set built once for the superset check)
+REQUIRED_FIELDS = ("pressure", "valve_angle", "motor_current", "setpoint", "timestamp")
+_REQUIRED_FIELD_SET = frozenset(REQUIRED_FIELDS)
+
+
+# Strategy for generating valid data points (field strategies built once)
+def _finite(min_value, max_value):
+    return st.floats(min_value=min_value, max_value=max_value, allow_nan=False, allow_infinity=False)
+
+
+data_point_strategy = st.fixed_dictionaries({
+    "pressure": _finite(0.0, 700.0),
+    "valve_angle": _finite(0.0, 180.0),
+    "motor_current": _finite(0.0, 25.0),
+    "setpoint": st.just(500.0),  # Constant as per spec
+    "timestamp": _finite(0.0, 1000.0),
+})
 
 
 def serialize_data_point(data):
     """Serialize data point to JSON string (simulates Python backend output)."""
-    return json.dumps(data)
+    return _dumps(data)
 
 
 def parse_data_point(json_str):
     """Parse JSON string to data point (simulates Qt GUI parsing)."""
-    return json.loads(json_str)
+    return _loads(json_str)
 
 
-@given(data_point=data_point_strategy())
+@given(data_point=data_point_strategy)
 def test_json_roundtrip_property(data_point):
     """
     **Validates: Requirements 3.1, 3.2**
@@ -58,19 +72,12 @@ def test_json_roundtrip_property(data_point):
     parsed = parse_data_point(json_str)
     
     # Verify all five fields are present
-    assert "pressure" in parsed
-    assert "valve_angle" in parsed
-    assert "motor_current" in parsed
-    assert "setpoint" in parsed
-    assert "timestamp" in parsed
+    assert parsed.keys() >= _REQUIRED_FIELD_SET
     
     # Verify values match within tolerance (0.001)
     tolerance = 0.001
-    assert abs(parsed["pressure"] - data_point["pressure"]) < tolerance
-    assert abs(parsed["valve_angle"] - data_point["valve_angle"]) < tolerance
-    assert abs(parsed["motor_current"] - data_point["motor_current"]) < tolerance
-    assert abs(parsed["setpoint"] - data_point["setpoint"]) < tolerance
-    assert abs(parsed["timestamp"] - data_point["timestamp"]) < tolerance
+    for key in REQUIRED_FIELDS:
+        assert isclose(parsed[key], data_point[key], rel_tol=0.0, abs_tol=tolerance), key
 
 
 def test_json_roundtrip_edge_cases():
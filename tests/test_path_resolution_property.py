@@ -16,6 +16,9 @@ import pytest
 from pathlib import Path
 from hypothesis import given, strategies as st, assume
 
+# Project root of this checkout (tests/ is in project root), resolved once
+_PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
 
 def resolve_simulation_runner_path(executable_dir):
     """
@@ -35,28 +38,31 @@ def resolve_simulation_runner_path(executable_dir):
         
         QString scriptPath = projectRoot.absoluteFilePath("simulation_runner.py");
     
+    The navigation is purely lexical (like QDir::cdUp on an absolute
+    path): nothing is read from disk, so the logic can be checked on
+    paths that do not exist.
+    
     Args:
         executable_dir: Absolute path to the directory containing the executable
     
     Returns:
         Absolute path to simulation_runner.py
     """
-    project_root = Path(executable_dir)
+    # abspath also normalises (trailing separators, "." and "..")
+    project_root = os.path.abspath(executable_dir)
     
     # Navigate up from build directory
-    project_root = project_root.parent  # From build/ or Release/ to gui/ or build/
+    project_root = os.path.dirname(project_root)  # From build/ or Release/ to gui/ or build/
     
     # If we're in a build subdirectory (e.g., Release/), go up one more level
-    if project_root.name == "build":
-        project_root = project_root.parent  # From build/ to gui/
+    if os.path.basename(project_root) == "build":
+        project_root = os.path.dirname(project_root)  # From build/ to gui/
     
     # Go up from gui/ to project root
-    project_root = project_root.parent
+    project_root = os.path.dirname(project_root)
     
     # Construct path to simulation_runner.py
-    script_path = project_root / "simulation_runner.py"
-    
-    return script_path.resolve()
+    return Path(os.path.join(project_root, "simulation_runner.py"))
 
 
 # Hypothesis strategy for generating executable directory structures
@@ -106,84 +112,85 @@ def test_path_resolution_property(build_config):
     3. Resulting path is absolute
     4. Resulting path points to the correct location
     """
-    # Create temporary directory structure
-    with tempfile.TemporaryDirectory() as temp_dir:
-        project_root = Path(temp_dir)
-        
-        # Create directory structure
-        gui_dir = project_root / "gui"
-        build_dir = gui_dir / build_config
-        build_dir.mkdir(parents=True, exist_ok=True)
-        
-        # Create simulation_runner.py in project root
-        script_path = project_root / "simulation_runner.py"
-        script_path.write_text("# Simulation runner script\n")
-        
-        # Resolve path from executable directory
-        resolved_path = resolve_simulation_runner_path(str(build_dir))
-        
-        # Verify path is absolute
-        assert resolved_path.is_absolute(), \
-            f"Resolved path should be absolute: {resolved_path}"
-        
-        # Verify path points to simulation_runner.py
-        assert resolved_path.name == "simulation_runner.py", \
-            f"Resolved path should point to simulation_runner.py: {resolved_path}"
-        
-        # Verify path exists
-        assert resolved_path.exists(), \
-            f"Resolved path should exist: {resolved_path}"
-        
-        # Verify path is in project root
-        assert resolved_path.parent == project_root, \
-            f"Resolved path should be in project root: {resolved_path.parent} != {project_root}"
-        
-        # Verify we can read the file
-        content = resolved_path.read_text()
-        assert "Simulation runner script" in content, \
-            "Should be able to read simulation_runner.py"
+    # Path logic only: a fake absolute root, no filesystem access
+    project_root = Path("/fake/root").absolute()
+    resolved_path = resolve_simulation_runner_path(str(project_root / "gui" / build_config))
+    
+    # Verify path is absolute
+    assert resolved_path.is_absolute(), \
+        f"Resolved path should be absolute: {resolved_path}"
+    
+    # Verify path points to simulation_runner.py
+    assert resolved_path.name == "simulation_runner.py", \
+        f"Resolved path should point to simulation_runner.py: {resolved_path}"
+    
+    # Verify path is in project root
+    assert resolved_path.parent == project_root, \
+        f"Resolved path should be in project root: {resolved_path.parent} != {project_root}"
+    assert ".." not in resolved_path.parts, "Path should not contain '..'"
+
+
+def test_path_resolution_filesystem_smoke(tmp_path):
+    """
+    Test one real directory layout end to end: the resolved script exists
+    and can be read.
+    """
+    project_root = tmp_path
+    build_dir = project_root / "gui" / "build" / "Release"
+    build_dir.mkdir(parents=True)
+    (project_root / "simulation_runner.py").write_text("# Simulation runner script\n")
+    
+    resolved_path = resolve_simulation_runner_path(str(build_dir))
+    
+    assert resolved_path.exists(), f"Resolved path should exist: {resolved_path}"
+    assert resolved_path.parent == project_root
+    assert "Simulation runner script" in resolved_path.read_text(), \
+        "Should be able to read simulation_runner.py"
+
+
+@pytest.fixture(scope="module")
+def shared_project_root(tmp_path_factory):
+    """
+    One temporary project root with simulation_runner.py, shared by the
+    edge cases (each build layout is a sibling directory under it).
+    """
+    project_root = tmp_path_factory.mktemp("proj")
+    (project_root / "simulation_runner.py").write_text("# Test script\n")
+    return project_root
 
 
 # Edge case tests
-def test_path_resolution_edge_cases():
+# Edge cases:
+# 1. Unix-style build directory (gui/build/)
+# 2. Windows Release build (gui/build/Release/)
+# 3. Windows Debug build (gui/build/Debug/)
+# 4. Deep nested structure
+@pytest.mark.parametrize("build_path,description", [
+    ("gui/build", "Unix-style build directory"),
+    ("gui/build/Release", "Windows Release build"),
+    ("gui/build/Debug", "Windows Debug build"),
+    ("gui/build/RelWithDebInfo", "RelWithDebInfo build"),
+    ("gui/build/MinSizeRel", "MinSizeRel build"),
+])
+def test_path_resolution_edge_cases(shared_project_root, build_path, description):
     """
     Test specific edge cases for path resolution.
-    
-    Edge cases:
-    1. Unix-style build directory (gui/build/)
-    2. Windows Release build (gui/build/Release/)
-    3. Windows Debug build (gui/build/Debug/)
-    4. Deep nested structure
     """
-    test_cases = [
-        ("gui/build", "Unix-style build directory"),
-        ("gui/build/Release", "Windows Release build"),
-        ("gui/build/Debug", "Windows Debug build"),
-        ("gui/build/RelWithDebInfo", "RelWithDebInfo build"),
-        ("gui/build/MinSizeRel", "MinSizeRel build"),
-    ]
+    project_root = shared_project_root
+    
+    # Create directory structure
+    build_dir = project_root / build_path
+    build_dir.mkdir(parents=True, exist_ok=True)
+    
+    # Resolve path
+    resolved_path = resolve_simulation_runner_path(str(build_dir))
     
-    for build_path, description in test_cases:
-        with tempfile.TemporaryDirectory() as temp_dir:
-            project_root = Path(temp_dir)
-            
-            # Create directory structure
-            build_dir = project_root / build_path
-            build_dir.mkdir(parents=True, exist_ok=True)
-            
-            # Create simulation_runner.py
-            script_path = project_root / "simulation_runner.py"
-            script_path.write_text(f"# Test: {description}\n")
-            
-            # Resolve path
-            resolved_path = resolve_simulation_runner_path(str(build_dir))
-            
-            # Verify
-            assert resolved_path.exists(), f"{description}: Path should exist"
-            assert resolved_path.name == "simulation_runner.py", \
-                f"{description}: Should resolve to simulation_runner.py"
-            assert resolved_path.parent == project_root, \
-                f"{description}: Should be in project root"
+    # Verify
+    assert resolved_path.exists(), f"{description}: Path should exist"
+    assert resolved_path.name == "simulation_runner.py", \
+        f"{description}: Should resolve to simulation_runner.py"
+    assert resolved_path.parent == project_root, \
+        f"{description}: Should be in project root"
 
 
 def test_path_resolution_absolute_path():
@@ -254,42 +261,26 @@ def test_path_resolution_current_project():
     Test path resolution with the actual current project structure.
     
     This test verifies that the path resolution logic works with
-    the real project directory structure.
+    the real project directory structure. Resolution is lexical, so the
+    build directories need not exist and the source tree is not touched.
     """
-    # Get the actual project root (tests/ is in project root)
-    current_file = Path(__file__)
-    project_root = current_file.parent.parent  # Up from tests/ to project root
-    
     # Check if we're in the expected structure
-    if not (project_root / "gui").exists():
+    if not (_PROJECT_ROOT / "gui").exists():
         pytest.skip("Not in expected project structure")
     
-    # Simulate executable directories
-    test_cases = [
-        project_root / "gui" / "build",
-        project_root / "gui" / "build" / "Release",
-    ]
+    expected_path = _PROJECT_ROOT / "simulation_runner.py"
     
-    for build_dir in test_cases:
-        # Create the directory if it doesn't exist (for testing)
-        build_dir.mkdir(parents=True, exist_ok=True)
+    # Simulate executable directories
+    for build_dir in (_PROJECT_ROOT / "gui" / "build",
+                      _PROJECT_ROOT / "gui" / "build" / "Release"):
+        resolved_path = resolve_simulation_runner_path(str(build_dir))
         
-        try:
-            # Resolve path
-            resolved_path = resolve_simulation_runner_path(str(build_dir))
-            
-            # Verify it points to the correct location
-            expected_path = project_root / "simulation_runner.py"
-            assert resolved_path == expected_path, \
-                f"Should resolve to {expected_path}, got {resolved_path}"
-            
-            # Verify the file exists
-            if expected_path.exists():
-                assert resolved_path.exists(), "Resolved path should exist"
-        finally:
-            # Clean up test directories if they were created
-            if build_dir.exists() and not any(build_dir.iterdir()):
-                build_dir.rmdir()
+        # Verify it points to the correct location
+        assert resolved_path == expected_path, \
+            f"Should resolve to {expected_path}, got {resolved_path}"
+    
+    # Verify the file exists
+    assert expected_path.exists(), "Resolved path should exist"
 
 
 if __name__ == "__main__":
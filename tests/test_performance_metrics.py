@@ -0,0 +1,90 @@
+"""
+Performance Metrics Unit Tests
+
+Validates time-domain metric extraction on analytic responses.
+References:
+- final_verified_results_section.md (Section 4)
+- numerical_state_space_and_simulation_specification.md (Section 7)
+"""
+
+import unittest
+import numpy as np
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from analysis.performance_metrics import PerformanceMetrics
+
+
+class TestPerformanceMetrics(unittest.TestCase):
+    """
+    Unit tests for PerformanceMetrics class.
+    """
+
+    def setUp(self):
+        """
+        Set up test fixtures: first-order response y = 1 - exp(-t).
+        """
+        self.metrics = PerformanceMetrics()
+        self.t = np.linspace(0.0, 10.0, 10001)
+        self.y = 1.0 - np.exp(-self.t)
+
+    def test_settling_time_first_order(self):
+        """
+        Test 2% settling time of a first-order lag (ln 50 ≈ 3.912 s).
+        """
+        ts = self.metrics.compute_settling_time(self.t, self.y, 1.0)
+        self.assertAlmostEqual(ts, np.log(50.0), places=2)
+
+        print(f"✓ Settling time: {ts:.4f} s")
+
+    def test_rise_time_first_order(self):
+        """
+        Test 10-90% rise time of a first-order lag (ln 9 ≈ 2.197 s).
+        """
+        tr = self.metrics.compute_rise_time(self.t, self.y, 1.0)
+        self.assertAlmostEqual(tr, np.log(9.0), places=2)
+
+        print(f"✓ Rise time: {tr:.4f} s")
+
+    def test_overshoot(self):
+        """
+        Test overshoot is zero for a monotone response and exact for a peak.
+        """
+        self.assertEqual(self.metrics.compute_overshoot(self.y, 1.0), 0.0)
+
+        y_peak = np.array([0.0, 0.5, 1.1, 1.0, 1.0])
+        self.assertAlmostEqual(self.metrics.compute_overshoot(y_peak, 1.0), 10.0)
+
+        print("✓ Overshoot computed correctly")
+
+    def test_unsettled_response(self):
+        """
+        Test that a response ending outside the band reports NaN.
+        """
+        y = np.linspace(0.0, 0.5, 100)
+        t = np.linspace(0.0, 1.0, 100)
+        self.assertTrue(np.isnan(self.metrics.compute_settling_time(t, y, 1.0)))
+        self.assertTrue(np.isnan(self.metrics.compute_rise_time(t, y, 1.0)))
+
+        print("✓ Unsettled response reported as NaN")
+
+    def test_batched_matches_single(self):
+        """
+        Test that a batch of responses gives the same metrics as per-trial calls.
+        """
+        gains = np.array([0.5, 1.0, 2.0])
+        y_batch = 1.0 - np.exp(-np.outer(gains, self.t))
+
+        ts_batch = self.metrics.compute_settling_time(self.t, y_batch, 1.0)
+        tr_batch = self.metrics.compute_rise_time(self.t, y_batch, 1.0)
+
+        for i, y in enumerate(y_batch):
+            self.assertEqual(ts_batch[i], self.metrics.compute_settling_time(self.t, y, 1.0))
+            self.assertEqual(tr_batch[i], self.metrics.compute_rise_time(self.t, y, 1.0))
+
+        print("✓ Batched metrics match per-trial metrics")
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
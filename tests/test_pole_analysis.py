@@ -0,0 +1,117 @@
+"""
+Pole Analysis Unit Tests
+
+Validates the vectorised PID gain stability sweep.
+References:
+- final_verified_results_section.md (Section 3)
+- numerical_state_space_and_simulation_specification.md (Section 7)
+"""
+
+import unittest
+import numpy as np
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from analysis.pole_analysis import sweep_gains, hurwitz_stable, characteristic_polynomial
+from models.full_state_space_model import FullStateSpaceModel
+from config.system_parameters import params
+
+
+class TestSweepGains(unittest.TestCase):
+    """
+    Unit tests for sweep_gains.
+    """
+    
+    def setUp(self):
+        """
+        Set up test fixtures.
+        """
+        model = FullStateSpaceModel()
+        self.A, self.B, self.C = model.A, model.B, model.C
+    
+    def test_frozen_gains(self):
+        """
+        Test the frozen design point: stable, slowest pole -0.387, PM ≈ 74°.
+        """
+        result = sweep_gains([params.Kp], [params.Ki], [params.Kd],
+                             self.A, self.B, self.C)
+        
+        self.assertEqual(result.shape, (1, 1, 1, 2))
+        max_real, pm = result[0, 0, 0]
+        self.assertAlmostEqual(max_real, -0.386772, places=5)
+        self.assertAlmostEqual(pm, 74.13, delta=0.1)
+        
+        print(f"✓ Frozen gains: max Re(s) = {max_real:.6f}, PM = {pm:.2f}°")
+    
+    def test_grid_matches_pointwise_eigenvalues(self):
+        """
+        Test every grid point against a scalar closed-loop build.
+        """
+        Kp_arr = np.array([20.0, 115.2, 400.0])
+        Ki_arr = np.array([5.0, 34.56])
+        Kd_arr = np.array([10.0, 49.92, 150.0])
+        result = sweep_gains(Kp_arr, Ki_arr, Kd_arr, self.A, self.B, self.C)
+        
+        CB = (self.C @ self.B)[0, 0]
+        for i, Kp in enumerate(Kp_arr):
+            for j, Ki in enumerate(Ki_arr):
+                for k, Kd in enumerate(Kd_arr):
+                    den = 1 + Kd * CB
+                    K_state = -(Kp * self.C + Kd * self.C @ self.A) / den
+                    A_cl = np.zeros((5, 5))
+                    A_cl[0:4, 0:4] = self.A + self.B @ K_state
+                    A_cl[0:4, 4] = (self.B * Ki / den).flatten()
+                    A_cl[4, 0:4] = -self.C
+                    expected = np.linalg.eigvals(A_cl).real.max()
+                    self.assertAlmostEqual(result[i, j, k, 0], expected, places=8)
+        
+        print("✓ Swept pole real parts match pointwise eigenvalues")
+
+
+class TestHurwitzStable(unittest.TestCase):
+    """
+    Unit tests for hurwitz_stable.
+    """
+    
+    def test_known_polynomials(self):
+        """
+        Test textbook cases: (s+1)^3 stable, s^2+1 marginal, s^3+s^2+2s+8 unstable.
+        """
+        self.assertTrue(hurwitz_stable([1.0, 3.0, 3.0, 1.0]))
+        self.assertFalse(hurwitz_stable([1.0, 0.0, 1.0]))
+        self.assertFalse(hurwitz_stable([1.0, 1.0, 2.0, 8.0]))
+        
+        print("✓ Routh-Hurwitz verdicts correct for known polynomials")
+    
+    def test_matches_eigenvalues(self):
+        """
+        Test the verdict against eigenvalues for random matrices.
+        """
+        rng = np.random.default_rng(0)
+        for _ in range(500):
+            n = rng.integers(1, 7)
+            A = rng.normal(size=(n, n)) - rng.uniform(0.0, 2.0) * np.eye(n)
+            eig = np.linalg.eigvals(A)
+            if np.abs(eig.real).min() < 1e-6:
+                continue
+            self.assertEqual(hurwitz_stable(characteristic_polynomial(A)),
+                             bool(np.all(eig.real < 0)))
+        
+        print("✓ Routh-Hurwitz verdicts match eigenvalues")
+    
+    def test_characteristic_polynomial(self):
+        """
+        Test Faddeev-LeVerrier coefficients against np.poly.
+        """
+        rng = np.random.default_rng(1)
+        for n in range(1, 7):
+            A = rng.normal(size=(n, n))
+            np.testing.assert_allclose(characteristic_polynomial(A), np.poly(A),
+                                       rtol=1e-9, atol=1e-9)
+        
+        print("✓ Characteristic polynomial matches np.poly")
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
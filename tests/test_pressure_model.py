@@ -0,0 +1,64 @@
+"""
+Pressure Model Unit Tests
+
+Validates first-order pressure dynamics against documentation.
+References:
+- docs/industrial_pressure_control_system_design.md (Section 2.5)
+- docs/numerical_state_space_and_simulation_specification.md (Section 3)
+"""
+
+import unittest
+import numpy as np
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from models.pressure_model import PressureModel
+from config.system_parameters import params
+
+
+class TestPressureModel(unittest.TestCase):
+    """
+    Unit tests for PressureModel class.
+    """
+    
+    def setUp(self):
+        """
+        Set up test fixtures.
+        """
+        self.pressure = PressureModel()
+    
+    def test_pressure_dynamics(self):
+        """
+        Test dP/dt = (Kp_pressure * θv - P) / τp at a single operating point.
+        """
+        dP_dt = self.pressure.pressure_dynamics(300.0, 2.0)
+        expected = (params.Kp_pressure * 2.0 - 300.0) / params.tau_p
+        
+        self.assertAlmostEqual(dP_dt, expected, places=9)
+        self.assertAlmostEqual(self.pressure.pressure_dynamics_from_motor_angle(300.0, 2.0 * params.N),
+                               expected, places=9)
+        
+        print("✓ Pressure dynamics match documented equation")
+    
+    def test_batch_matches_scalar(self):
+        """
+        Test that the batch evaluation matches the scalar one and fills out in place.
+        """
+        P = np.linspace(250.0, 700.0, 7)
+        theta_v = np.linspace(0.0, 4.0, 7)
+        out = np.empty(7)
+        
+        result = self.pressure.pressure_dynamics_batch(P, theta_v, out=out)
+        
+        self.assertIs(result, out)
+        np.testing.assert_allclose(out, [self.pressure.pressure_dynamics(p, th)
+                                         for p, th in zip(P, theta_v)], rtol=1e-12)
+        np.testing.assert_allclose(self.pressure.pressure_dynamics_batch(P, 2.0),
+                                   self.pressure.pressure_dynamics(P, 2.0), rtol=1e-12)
+        
+        print("✓ Batch pressure dynamics match scalar evaluation")
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -0,0 +1,61 @@
+"""
+Communication Protocol Unit Tests
+
+Validates GUI message serialization round-trips.
+References:
+- numerical_state_space_and_simulation_specification.md (Section 8)
+"""
+
+import unittest
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from communication import protocol_definition
+from communication.protocol_definition import SystemState
+
+
+class TestSystemState(unittest.TestCase):
+    """
+    Unit tests for SystemState serialization.
+    """
+    
+    def setUp(self):
+        """
+        Set up test fixtures.
+        """
+        self.state = SystemState(
+            timestamp=1.25, pressure=487.5, valve_angle=0.42,
+            motor_current=3.1, motor_velocity=-12.0,
+            control_voltage=24.0, setpoint=500.0,
+        )
+    
+    def test_roundtrip(self):
+        """
+        Test that from_json(to_json(x)) reproduces every field exactly.
+        """
+        restored = SystemState.from_json(self.state.to_json())
+        self.assertEqual(restored, self.state)
+        
+        print("✓ SystemState JSON round-trip exact")
+    
+    def test_stdlib_fallback_roundtrip(self):
+        """
+        Test the json fallback used when orjson is not installed.
+        """
+        saved = protocol_definition.orjson
+        protocol_definition.orjson = None
+        try:
+            json_string = self.state.to_json()
+            restored = SystemState.from_json(json_string)
+        finally:
+            protocol_definition.orjson = saved
+        
+        self.assertIsInstance(json_string, str)
+        self.assertEqual(restored, self.state)
+        
+        print("✓ SystemState stdlib JSON fallback round-trip exact")
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
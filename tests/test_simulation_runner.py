@@ -8,6 +8,7 @@ import sys
 import os
 import json
 import numpy as np
+import pytest
 
 # Add project root to path
 sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
@@ -15,24 +16,32 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
 from simulation_runner import SimulationRunner
 
 
+@pytest.fixture(scope="module")
+def fresh_sim():
+    """Runner in its initial state, shared by tests that only read it."""
+    return SimulationRunner(setpoint=500.0)
+
+
+@pytest.fixture
+def sim():
+    """Runner for tests that step it or change its gains."""
+    return SimulationRunner(setpoint=500.0)
+
+
 class TestSimulationRunner:
     """Test suite for SimulationRunner class."""
     
-    def test_initialization(self):
+    def test_initialization(self, fresh_sim):
         """Test that SimulationRunner initializes correctly."""
-        sim = SimulationRunner(setpoint=500.0)
-        
-        assert sim.setpoint == 500.0
-        assert sim.state.shape == (5,)
-        assert sim.t == 0.0
-        assert sim.output_interval == 0.1
+        assert fresh_sim.setpoint == 500.0
+        assert fresh_sim.state.shape == (5,)
+        assert fresh_sim.t == 0.0
+        assert fresh_sim.output_interval == 0.1
         
-    def test_get_output_data_format(self):
+    def test_get_output_data_format(self, fresh_sim):
         """Test that get_output_data() returns dict with all required fields."""
-        sim = SimulationRunner(setpoint=500.0)
-        
         # Get output data
-        data = sim.get_output_data()
+        data = fresh_sim.get_output_data()
         
         # Verify all required fields are present
         assert "pressure" in data
@@ -51,12 +60,10 @@ class TestSimulationRunner:
         # Verify setpoint value
         assert data["setpoint"] == 500.0
         
-    def test_json_serialization(self):
+    def test_json_serialization(self, fresh_sim):
         """Test that output data can be serialized to valid JSON."""
-        sim = SimulationRunner(setpoint=500.0)
-        
         # Get output data
-        data = sim.get_output_data()
+        data = fresh_sim.get_output_data()
         
         # Serialize to JSON
         json_str = json.dumps(data)
@@ -71,10 +78,22 @@ class TestSimulationRunner:
         assert parsed["setpoint"] == data["setpoint"]
         assert parsed["timestamp"] == data["timestamp"]
         
-    def test_update_gains(self):
-        """Test that update_gains() correctly updates Kp, Ki, Kd."""
-        sim = SimulationRunner(setpoint=500.0)
+    def test_format_output_matches_output_data(self, sim):
+        """Test that the preformatted bytes line parses to get_output_data()."""
+        for _ in range(7):
+            sim.step()
+        
+        line = sim.format_output()
+        assert line.endswith(b'\n') and line.count(b'\n') == 1
+        
+        parsed = json.loads(line)
+        data = sim.get_output_data()
+        assert list(parsed) == list(data)
+        for key in data:
+            assert abs(parsed[key] - data[key]) <= 5e-5
         
+    def test_update_gains(self, sim):
+        """Test that update_gains() correctly updates Kp, Ki, Kd."""
         # Store original gains
         original_Kp = sim.Kp
         original_Ki = sim.Ki
@@ -96,10 +115,8 @@ class TestSimulationRunner:
         assert sim.Ki != original_Ki or new_Ki == original_Ki
         assert sim.Kd != original_Kd or new_Kd == original_Kd
         
-    def test_rebuild_closed_loop_called(self):
+    def test_rebuild_closed_loop_called(self, sim):
         """Test that rebuild_closed_loop() updates system matrices."""
-        sim = SimulationRunner(setpoint=500.0)
-        
         # Store original closed-loop matrix
         original_A_cl = sim.A_cl.copy()
         
@@ -109,29 +126,120 @@ class TestSimulationRunner:
         # Verify closed-loop matrix changed
         assert not np.allclose(sim.A_cl, original_A_cl)
         
-    def test_step_advances_time(self):
+    def test_step_advances_time(self, sim):
         """Test that step() advances simulation time."""
-        sim = SimulationRunner(setpoint=500.0)
-        
         initial_time = sim.t
         sim.step()
         
         # Verify time advanced by dt
         assert sim.t == initial_time + sim.dt
         
-    def test_step_updates_state(self):
+    def test_step_updates_state(self, sim):
         """Test that step() updates the state vector."""
-        sim = SimulationRunner(setpoint=500.0)
-        
         # Initial state should be all zeros
         initial_state = sim.state.copy()
         
         # Run a few steps
-        for _ in range(10):
-            sim.step()
+        sim.step_many(10)
         
         # State should have changed (system is responding to setpoint)
-        assert not np.allclose(sim.state, initial_state)
+        assert (sim.state != initial_state).any()
+        assert sim._k == 10
+
+    def test_step_many_matches_steps(self):
+        """Test that step_many(n) equals n calls to step(), saturation included."""
+        batch = SimulationRunner(setpoint=500.0)
+        single = SimulationRunner(setpoint=500.0)
+        
+        batch.step_many(50)
+        for _ in range(50):
+            single.step()
+        
+        assert np.array_equal(batch.state, single.state)
+        assert batch.t == single.t
+
+    def test_step_matches_continuous_solution(self):
+        """Test that the discrete step equals the exact continuous update."""
+        from scipy.integrate import solve_ivp
+        
+        sim = SimulationRunner(setpoint=500.0)
+        sol = solve_ivp(lambda t, x: sim.A_cl @ x + sim.B_ref * sim.setpoint,
+                        (0.0, sim.dt), np.zeros(5), method='LSODA',
+                        rtol=1e-10, atol=1e-12)
+        
+        # Unsaturated one-step update (step() clips afterwards)
+        x1 = sim.Ad @ np.zeros(5) + sim.Bd * sim.setpoint
+        
+        assert np.allclose(x1, sol.y[:, -1], rtol=1e-6, atol=1e-9)
+
+    def test_step_output_interval_matches_steps(self):
+        """Test that one output-interval jump equals the individual steps."""
+        for setpoint in (500.0, 0.001):  # saturating and linear regimes
+            jump = SimulationRunner(setpoint=setpoint)
+            steps = SimulationRunner(setpoint=setpoint)
+            
+            for _ in range(5):
+                jump.step_output_interval()
+                for _ in range(steps.steps_per_output):
+                    steps.step()
+            
+            assert np.allclose(jump.state, steps.state, rtol=1e-9, atol=1e-12)
+            assert np.isclose(jump.t, steps.t)
+
+    def test_steady_state_detection(self):
+        """Test that a settled response is detected and gain updates reset it."""
+        sim = SimulationRunner(setpoint=1.0)  # equilibrium inside saturation limits
+        assert not sim.at_steady_state()
+        
+        sim.state = sim._x_ss_unit * sim.setpoint
+        assert sim.at_steady_state()
+        assert np.allclose(sim.A_cl @ sim.state + sim.B_ref * sim.setpoint, 0.0, atol=1e-9)
+        
+        sim.idle = True
+        sim.update_gains(200.0, 50.0, 75.0)
+        assert not sim.idle
+
+
+    def test_handle_stdin_line(self):
+        """Test that gain-update lines are applied and malformed lines ignored."""
+        sim = SimulationRunner()
+        
+        sim._handle_stdin_line('{"Kp": 200.0, "Ki": 50.0, "Kd": 75.0}\n')
+        assert (sim.Kp, sim.Ki, sim.Kd) == (200.0, 50.0, 75.0)
+        
+        sim._handle_stdin_line('{"Kp": 1.0, "Ki":\n')
+        sim._handle_stdin_line('\n')
+        assert (sim.Kp, sim.Ki, sim.Kd) == (200.0, 50.0, 75.0)
+        
+        # Valid JSON that is not an object is ignored too
+        for line in ('123\n', 'null\n', '"KpKiKd"\n', '["Kp", "Ki", "Kd"]\n'):
+            sim._handle_stdin_line(line)
+        assert (sim.Kp, sim.Ki, sim.Kd) == (200.0, 50.0, 75.0)
+
+
+    @pytest.mark.skipif(sys.platform == 'win32', reason="select-based stdin polling is Unix-only")
+    def test_check_stdin_from_devnull(self, monkeypatch):
+        """Test that stdin redirected from /dev/null (not pollable by epoll) is handled."""
+        sim = SimulationRunner()
+        gains = (sim.Kp, sim.Ki, sim.Kd)
+        
+        with open(os.devnull) as devnull:
+            monkeypatch.setattr(sys, 'stdin', devnull)
+            sim.check_stdin()
+            sim.check_stdin()
+        
+        assert (sim.Kp, sim.Ki, sim.Kd) == gains
+
+
+    def test_time_does_not_drift(self):
+        """Test that simulation time is exact after many steps."""
+        sim = SimulationRunner()
+        for _ in range(1000):
+            sim.step_output_interval()
+        
+        assert sim._k == 1000 * sim.steps_per_output
+        assert sim.t == sim._k * sim.dt
+        assert sim.format_output().endswith(b'"timestamp":100.0000}\n')
 
 
 if __name__ == '__main__':
@@ -0,0 +1,130 @@
+"""
+Open-/Closed-Loop Simulation Unit Tests
+
+Validates the discretised LTI simulations against direct ODE integration.
+References:
+- numerical_state_space_and_simulation_specification.md (Section 6)
+"""
+
+import unittest
+import numpy as np
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from scipy.integrate import solve_ivp
+
+from models.full_state_space_model import FullStateSpaceModel
+from controllers.pid_controller import PIDController
+from simulation.open_loop_simulation import OpenLoopSimulation
+from simulation.closed_loop_simulation import ClosedLoopSimulation
+from simulation.disturbance_simulation import DisturbanceSimulation
+from simulation._closed_loop_builder import build_closed_loop
+
+
+class TestSimulationRuns(unittest.TestCase):
+    """
+    Unit tests for OpenLoopSimulation and ClosedLoopSimulation.
+    """
+
+    def setUp(self):
+        """
+        Set up test fixtures.
+        """
+        self.model = FullStateSpaceModel()
+
+    def test_open_loop_matches_ode(self):
+        """
+        Test that the ZOH open-loop step response matches solve_ivp.
+        """
+        sim = OpenLoopSimulation(self.model)
+        t, X = sim.run_step_response(12.0, 0.5)
+
+        sol = solve_ivp(lambda t, x: self.model.A @ x + self.model.B[:, 0] * 12.0,
+                        (0.0, t[-1]), np.zeros(4), method='LSODA',
+                        rtol=1e-10, atol=1e-10)
+
+        self.assertEqual(X.shape, (len(t), 4))
+        np.testing.assert_allclose(X[-1], sol.y[:, -1], rtol=1e-6, atol=1e-8)
+
+        print("✓ Open-loop step response matches ODE solution")
+
+    def test_closed_loop_metrics(self):
+        """
+        Test closed-loop step response shapes and metric extraction.
+        """
+        sim = ClosedLoopSimulation(self.model, PIDController())
+        t, X, U = sim.run_setpoint_step(500.0, 20.0)
+        metrics = sim.compute_performance_metrics()
+
+        self.assertEqual(X.shape, (len(t), 4))
+        self.assertEqual(U.shape, t.shape)
+        self.assertLess(abs(X[-1, 3] - 500.0), 0.01 * 500.0)
+        self.assertTrue(np.isfinite(metrics['settling_time']))
+        self.assertGreaterEqual(metrics['overshoot'], 0.0)
+
+        print(f"✓ Closed-loop metrics: {metrics}")
+
+    def test_builder_is_shared_and_exact(self):
+        """
+        Test that repeated builds share one result and Ad matches expm.
+        """
+        from scipy.linalg import expm
+
+        m = self.model
+        cl1 = build_closed_loop(m.A, m.B, m.C, 115.2, 34.56, 49.92, 1e-3)
+        cl2 = build_closed_loop(m.A.copy(), m.B, m.C, 115.2, 34.56, 49.92, 1e-3)
+
+        self.assertIs(cl1, cl2)
+        self.assertFalse(cl1.Ad.flags.writeable)
+        np.testing.assert_allclose(cl1.Ad, expm(cl1.A_cl * 1e-3), rtol=1e-10, atol=1e-12)
+        np.testing.assert_allclose(cl1.A_cl @ cl1.x_ss_per_setpoint + cl1.B_ref,
+                                   0.0, atol=1e-9)
+
+        print("✓ Closed-loop builder is cached and exact")
+
+    def test_builder_without_integral(self):
+        """
+        Test the builder when A_cl is singular (Ki = 0, repeated zero pole).
+        """
+        from scipy.linalg import expm
+
+        m = self.model
+        cl = build_closed_loop(m.A, m.B, m.C, 115.2, 0.0, 49.92, 1e-3)
+
+        self.assertIsNone(cl.x_ss_per_setpoint)
+        np.testing.assert_allclose(cl.Ad, expm(cl.A_cl * 1e-3), rtol=1e-10, atol=1e-12)
+
+        print("✓ Closed-loop builder handles Ki = 0")
+
+    def test_disturbance_recovery(self):
+        """
+        Test that a 10% pressure drop is applied and rejected.
+        """
+        sim = DisturbanceSimulation(self.model, PIDController())
+        t, X, U = sim.run_disturbance_test(500.0, 0.1, 20.0, 40.0)
+        k = int(round(20.0 / 1e-3))
+
+        self.assertAlmostEqual(X[k - 1, 3] - X[k, 3], 50.0, delta=1.0)
+        self.assertLess(abs(X[-1, 3] - 500.0), 0.01 * 500.0)
+
+        print("✓ Pressure disturbance rejected")
+
+    def test_disturbance_at_start_and_out_of_range(self):
+        """
+        Test that a disturbance at t = 0 is applied and one after t_final is rejected.
+        """
+        sim = DisturbanceSimulation(self.model, PIDController())
+        x0 = np.array([0.0, 0.0, 0.0, 500.0])
+        t, X, U = sim.run_disturbance_test(500.0, 0.1, 0.0, 1.0, initial_state=x0)
+
+        self.assertAlmostEqual(X[0, 3], 450.0)
+
+        with self.assertRaises(ValueError):
+            sim.run_disturbance_test(500.0, 0.1, 2.0, 1.0)
+
+        print("✓ Disturbance time edge cases handled")
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
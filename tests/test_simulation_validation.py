@@ -12,17 +12,14 @@ import sys
 sys.path.insert(0, '../src')
 
 
+@unittest.skip("not yet implemented")
 class TestSimulationValidation(unittest.TestCase):
     """
     Validation tests for simulation results.
-    """
     
-    def setUp(self):
-        """
-        Set up test fixtures.
-        """
-        # TODO: Run simulations and store results
-        pass
+    Placeholders recording the documented expected values; skipped as a
+    class until the comparisons are implemented.
+    """
     
     def test_closed_loop_poles(self):
         """
@@ -7,28 +7,56 @@ References:
 - docs/industrial_pressure_control_system_design.md (Section 2.7)
 """
 
-import unittest
 import numpy as np
+import pytest
 import sys
 import os
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
 
-from models.full_state_space_model import FullStateSpaceModel
 from config.system_parameters import params
+from models.full_state_space_model import FullStateSpaceModel
+
+
+# Expected inertias (Section 2.7): J_ref = J_valve/(η*N^2), J_total = Jm + J_ref
+EXPECTED_J_REF = params.J_valve / (params.eta * params.N**2)
+EXPECTED_J_TOTAL = params.J_m + EXPECTED_J_REF
+
+# Expected matrices (Section 4) with corrected parameters, e.g.
+# A[0,0] = -R/L = -240, A[0,1] = -Ke/L = -160, A[1,0] = Kt/J_total ≈ 32.648,
+# A[3,2] = Kp_pressure/(N*τp) = 7.5, A[3,3] = -1/τp = -2.0, B[0,0] = 1/L = 200
+EXPECTED_MATRICES = {
+    "A": np.array([
+        [-params.R / params.L, -params.Ke / params.L, 0.0, 0.0],
+        [params.Kt / EXPECTED_J_TOTAL, 0.0, 0.0, 0.0],
+        [0.0, 1.0, 0.0, 0.0],
+        [0.0, 0.0, params.Kp_pressure / (params.N * params.tau_p), -1.0 / params.tau_p],
+    ]),
+    "B": np.array([[1.0 / params.L], [0.0], [0.0], [0.0]]),
+    "C": np.array([[0.0, 0.0, 0.0, params.Ks]]),
+    "D": np.zeros((1, 1)),  # zero feedthrough
+}
+
+# Flat views for the derivative check: dX/dt = A X + B U on 1-D arrays
+EXPECTED_A = EXPECTED_MATRICES["A"]
+EXPECTED_B_FLAT = EXPECTED_MATRICES["B"][:, 0]
 
+# One case per matrix element, structural zeros included
+MATRIX_ENTRIES = [
+    pytest.param(name, idx, float(M[idx]), id=f"{name}[{idx[0]},{idx[1]}]")
+    for name, M in EXPECTED_MATRICES.items()
+    for idx in np.ndindex(M.shape)
+]
 
-class TestStateSpaceModel(unittest.TestCase):
+
+class TestStateSpaceModel:
     """
     Unit tests for FullStateSpaceModel class.
-    """
     
-    def setUp(self):
-        """
-        Set up test fixtures.
-        """
-        self.model = FullStateSpaceModel()
+    The model comes from the session-scoped plant_model fixture in
+    conftest.py; the tests only read it.
+    """
     
-    def test_total_inertia_computation(self):
+    def test_total_inertia_computation(self, plant_model):
         """
         Test total inertia computation.
         
@@ -39,109 +67,29 @@ class TestStateSpaceModel(unittest.TestCase):
         J_ref = 6.125 / (0.85 * 40^2) = 0.004503676
         J_total = 0.02 + 0.004503676 = 0.024503676 kg·m²
         """
-        # Compute expected values
-        expected_J_ref = params.J_valve / (params.eta * params.N**2)
-        expected_J_total = params.J_m + expected_J_ref
-        
         tolerance = 1e-6
         
-        self.assertAlmostEqual(self.model.J_ref, expected_J_ref, delta=tolerance,
-                              msg=f"J_ref mismatch: got {self.model.J_ref}, expected {expected_J_ref}")
-        self.assertAlmostEqual(self.model.J_total, expected_J_total, delta=tolerance,
-                              msg=f"J_total mismatch: got {self.model.J_total}, expected {expected_J_total}")
-        
-        print(f"✓ J_ref = {self.model.J_ref:.9f} kg·m²")
-        print(f"✓ J_total = {self.model.J_total:.9f} kg·m²")
+        assert plant_model.J_ref == pytest.approx(EXPECTED_J_REF, abs=tolerance), \
+            f"J_ref mismatch: got {plant_model.J_ref}, expected {EXPECTED_J_REF}"
+        assert plant_model.J_total == pytest.approx(EXPECTED_J_TOTAL, abs=tolerance), \
+            f"J_total mismatch: got {plant_model.J_total}, expected {EXPECTED_J_TOTAL}"
     
-    def test_A_matrix_structure(self):
+    @pytest.mark.parametrize("name", list(EXPECTED_MATRICES))
+    def test_matrix_dimensions(self, plant_model, name):
         """
-        Test A matrix structure and dimensions.
-        
-        Expected: 4x4 matrix with structure defined in Section 4
+        Test A (4x4), B (4x1), C (1x4) and D (1x1) dimensions.
         """
-        self.assertEqual(self.model.A.shape, (4, 4), "A matrix should be 4x4")
-        
-        # Test specific elements with corrected parameters
-        # A[0,0] = -R/L = -1.2/0.005 = -240
-        expected_A00 = -params.R / params.L
-        self.assertAlmostEqual(self.model.A[0, 0], expected_A00, places=6)
-        
-        # A[0,1] = -Ke/L = -0.8/0.005 = -160
-        expected_A01 = -params.Ke / params.L
-        self.assertAlmostEqual(self.model.A[0, 1], expected_A01, places=6)
-        
-        # A[1,0] = Kt/J_total = 0.8/0.024503676 ≈ 32.648
-        expected_A10 = params.Kt / self.model.J_total
-        self.assertAlmostEqual(self.model.A[1, 0], expected_A10, places=6)
-        
-        # A[2,1] = 1.0
-        self.assertAlmostEqual(self.model.A[2, 1], 1.0, places=6)
-        
-        # A[3,2] = Kp_pressure/(N*τp) = 150/(40*0.5) = 7.5
-        expected_A32 = params.Kp_pressure / (params.N * params.tau_p)
-        self.assertAlmostEqual(self.model.A[3, 2], expected_A32, places=6)
-        
-        # A[3,3] = -1/τp = -1/0.5 = -2.0
-        expected_A33 = -1.0 / params.tau_p
-        self.assertAlmostEqual(self.model.A[3, 3], expected_A33, places=6)
-        
-        print("✓ A matrix structure validated")
-        print(f"  A[0,0] = -R/L = {self.model.A[0,0]:.6f}")
-        print(f"  A[0,1] = -Ke/L = {self.model.A[0,1]:.6f}")
-        print(f"  A[1,0] = Kt/J_total = {self.model.A[1,0]:.6f}")
-        print(f"  A[3,2] = Kp/(N*τp) = {self.model.A[3,2]:.6f}")
-        print(f"  A[3,3] = -1/τp = {self.model.A[3,3]:.6f}")
+        assert getattr(plant_model, name).shape == EXPECTED_MATRICES[name].shape, \
+            f"{name} matrix should be {EXPECTED_MATRICES[name].shape}"
     
-    def test_B_matrix_structure(self):
+    @pytest.mark.parametrize("name,idx,expected", MATRIX_ENTRIES)
+    def test_matrix_entry(self, plant_model, name, idx, expected):
         """
-        Test B matrix structure and dimensions.
-        
-        Expected: 4x1 vector [1/L, 0, 0, 0]^T
+        Test one element of A, B, C or D against Section 4.
         """
-        self.assertEqual(self.model.B.shape, (4, 1), "B matrix should be 4x1")
-        
-        # B[0,0] = 1/L = 1/0.005 = 200
-        expected_B00 = 1.0 / params.L
-        self.assertAlmostEqual(self.model.B[0, 0], expected_B00, places=6)
-        
-        # Rest should be zero
-        self.assertAlmostEqual(self.model.B[1, 0], 0.0, places=6)
-        self.assertAlmostEqual(self.model.B[2, 0], 0.0, places=6)
-        self.assertAlmostEqual(self.model.B[3, 0], 0.0, places=6)
-        
-        print("✓ B matrix structure validated")
-        print(f"  B[0,0] = 1/L = {self.model.B[0,0]:.6f}")
-    
-    def test_C_matrix_structure(self):
-        """
-        Test C matrix structure and dimensions.
-        
-        Expected: 1x4 vector [0, 0, 0, Ks]
-        """
-        self.assertEqual(self.model.C.shape, (1, 4), "C matrix should be 1x4")
-        
-        # First three elements should be zero
-        self.assertAlmostEqual(self.model.C[0, 0], 0.0, places=6)
-        self.assertAlmostEqual(self.model.C[0, 1], 0.0, places=6)
-        self.assertAlmostEqual(self.model.C[0, 2], 0.0, places=6)
-        
-        # C[0,3] = Ks
-        self.assertAlmostEqual(self.model.C[0, 3], params.Ks, places=6)
-        
-        print("✓ C matrix structure validated")
-    
-    def test_D_matrix_structure(self):
-        """
-        Test D matrix (feedthrough).
-        
-        Expected: D = 0
-        """
-        self.assertEqual(self.model.D.shape, (1, 1), "D should be 1x1")
-        self.assertAlmostEqual(self.model.D[0, 0], 0.0, places=6)
-        
-        print("✓ D matrix validated (zero feedthrough)")
+        assert getattr(plant_model, name)[idx] == pytest.approx(expected, abs=1e-9)
     
-    def test_state_derivative_computation(self):
+    def test_state_derivative_computation(self, plant_model):
         """
         Test state derivative computation.
         
@@ -153,19 +101,31 @@ class TestStateSpaceModel(unittest.TestCase):
         t = 0.0
         
         # Compute derivative
-        dX_dt = self.model.state_derivative(t, X, U)
+        dX_dt = plant_model.state_derivative(t, X, U)
         
-        # Manually compute expected
-        X_col = X.reshape(-1, 1)
-        U_col = np.array([[U]])
-        expected_dX_dt = (self.model.A @ X_col + self.model.B @ U_col).flatten()
+        # Manually compute expected (from the Section 4 matrices, 1-D products)
+        expected_dX_dt = EXPECTED_A @ X + EXPECTED_B_FLAT * U
         
         # Compare
         np.testing.assert_array_almost_equal(dX_dt, expected_dX_dt, decimal=6)
+    
+    def test_state_derivative_tracks_matrix_edits(self):
+        """
+        Test that in-place edits to A and B (structural zeros included)
+        are used by state_derivative.
+        """
+        model = FullStateSpaceModel()
+        model.A[2, 1] = 2.5
+        model.A[1, 3] = -0.5
+        model.B[3, 0] = 1.0
         
-        print("✓ State derivative computation validated")
+        X = np.array([1.0, 2.0, 3.0, 100.0])
+        U = 10.0
+        
+        np.testing.assert_allclose(model.state_derivative(0.0, X, U),
+                                   model.A @ X + model.B[:, 0] * U, rtol=1e-12)
     
-    def test_output_computation(self):
+    def test_output_computation(self, plant_model):
         """
         Test output computation.
         
@@ -175,15 +135,25 @@ class TestStateSpaceModel(unittest.TestCase):
         X = np.array([1.0, 2.0, 3.0, 100.0])  # [i, ω, θm, P]
         
         # Compute output
-        Y = self.model.output(X)
+        Y = plant_model.output(X)
         
         # Expected: Y = Ks * P = 0.01 * 100 = 1.0
         expected_Y = params.Ks * X[3]
         
-        self.assertAlmostEqual(Y, expected_Y, places=6)
+        assert Y == pytest.approx(expected_Y, abs=1e-6)
+    
+    def test_output_tracks_matrix_edits(self):
+        """
+        Test that output() uses the model's current C and D.
+        """
+        model = FullStateSpaceModel()
+        model.C[0, 0] = 0.5
+        model.D[0, 0] = 2.0
+        
+        X = np.array([1.0, 2.0, 3.0, 100.0])
         
-        print("✓ Output computation validated")
+        assert model.output(X, 3.0) == pytest.approx((model.C @ X)[0] + 2.0 * 3.0)
 
 
 if __name__ == '__main__':
-    unittest.main(verbosity=2)
+    pytest.main([__file__, '-v'])
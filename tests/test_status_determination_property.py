@@ -8,16 +8,18 @@ This test verifies that the status determination logic correctly
 classifies errors as STABLE or WARNING based on the ±25 bar threshold.
 """
 
+import numpy as np
 import pytest
 from hypothesis import given, strategies as st
 
 
 # Constants
 ERROR_THRESHOLD = 25.0  # bar
+_STATUSES = (("STABLE", "green"), ("WARNING", "red"))  # within / beyond threshold
 
 
 # Helper functions for status determination
-def determine_status(error):
+def determine_status(error, _abs=abs, _threshold=ERROR_THRESHOLD, _statuses=_STATUSES):
     """
     Determine system status based on pressure error.
     
@@ -30,38 +32,51 @@ def determine_status(error):
     
     Args:
         error: Pressure error (setpoint - pressure) in bar
+        _abs, _threshold, _statuses: Bound at definition time so the call
+            reads locals instead of globals; not meant to be passed
     
     Returns:
         Tuple of (status_text, status_color)
         - status_text: "STABLE" or "WARNING"
         - status_color: "green" or "red"
     """
-    abs_error = abs(error)
+    # Index 0 when |error| <= threshold, 1 when it exceeds it
+    return _statuses[_abs(error) > _threshold]
+
+
+def determine_status_batch(errors):
+    """
+    Determine system status for an array of pressure errors.
     
-    if abs_error <= ERROR_THRESHOLD:
-        return ("STABLE", "green")
-    else:
-        return ("WARNING", "red")
+    Args:
+        errors: Pressure errors (setpoint - pressure) in bar, array
+    
+    Returns:
+        Tuple of (status_text, status_color) string arrays
+    """
+    stable = np.abs(errors) <= ERROR_THRESHOLD
+    return np.where(stable, "STABLE", "WARNING"), np.where(stable, "green", "red")
 
 
-# Hypothesis strategy for generating error values
-@st.composite
-def error_values_strategy(draw):
+# Hypothesis strategy for generating batches of error values
+def error_batches_strategy():
     """
-    Generate random error values.
+    Generate arrays of random error values.
     
     Range: -100 to 100 bar (reasonable error range)
     Allows for edge cases at boundaries
     Excludes NaN and infinity
+    One example checks a whole batch, so the per-example framework cost
+    is amortised over up to 1024 values.
     """
-    error = draw(st.floats(min_value=-100.0, max_value=100.0,
-                           allow_nan=False, allow_infinity=False))
-    return error
+    return st.lists(st.floats(min_value=-100.0, max_value=100.0,
+                              allow_nan=False, allow_infinity=False),
+                    min_size=1, max_size=1024).map(np.asarray)
 
 
 # Property Test
-@given(error=error_values_strategy())
-def test_status_determination_property(error):
+@given(errors=error_batches_strategy())
+def test_status_determination_property(errors):
     """
     **Validates: Requirements 5.2, 5.3**
     
@@ -77,23 +92,27 @@ def test_status_determination_property(error):
     3. Color is green for STABLE, red for WARNING
     4. Threshold is applied symmetrically (positive and negative errors)
     """
-    # Determine status
-    status_text, status_color = determine_status(error)
-    
-    # Calculate absolute error
-    abs_error = abs(error)
-    
-    # Verify status determination logic
-    if abs_error <= ERROR_THRESHOLD:
-        assert status_text == "STABLE", \
-            f"Error {error} (|{abs_error}|) should be STABLE, got {status_text}"
-        assert status_color == "green", \
-            f"STABLE status should be green, got {status_color}"
-    else:
-        assert status_text == "WARNING", \
-            f"Error {error} (|{abs_error}|) should be WARNING, got {status_text}"
-        assert status_color == "red", \
-            f"WARNING status should be red, got {status_color}"
+    # Determine status for the whole batch
+    status_text, status_color = determine_status_batch(errors)
+    
+    # Verify status determination logic against the two-sided interval
+    # -25 <= error <= 25, independent of the abs() used by the helpers
+    within = (errors >= -ERROR_THRESHOLD) & (errors <= ERROR_THRESHOLD)
+    stable = status_text == "STABLE"
+    assert np.array_equal(stable, within), \
+        f"Misclassified errors: {errors[stable != within]}"
+    assert np.array_equal(status_text == "WARNING", ~within), \
+        f"Unexpected status text: {set(status_text.tolist())}"
+    assert np.array_equal(status_color == "green", stable), \
+        "STABLE status should be green"
+    assert np.array_equal(status_color == "red", ~stable), \
+        "WARNING status should be red"
+    
+    # Scalar path on a small evenly spaced subset
+    for error, text, color in zip(errors[::64].tolist(), status_text[::64].tolist(),
+                                  status_color[::64].tolist()):
+        assert determine_status(error) == (text, color), \
+            f"Scalar/batch mismatch: {determine_status(error)} != {(text, color)} (error={error})"
 
 
 # Edge case tests
@@ -125,13 +144,15 @@ def test_status_determination_boundary_cases():
         (-100.0, "WARNING", "red", "Maximum negative error"),
     ]
     
-    for error, expected_status, expected_color, description in test_cases:
-        status_text, status_color = determine_status(error)
-        
-        assert status_text == expected_status, \
-            f"{description}: expected {expected_status}, got {status_text} (error={error})"
-        assert status_color == expected_color, \
-            f"{description}: expected {expected_color}, got {status_color} (error={error})"
+    # Table as parallel arrays, checked in one comparison
+    errors = np.array([case[0] for case in test_cases])
+    expected_status = np.array([case[1] for case in test_cases])
+    expected_color = np.array([case[2] for case in test_cases])
+    
+    status_text, status_color = determine_status_batch(errors)
+    mismatch = (status_text != expected_status) | (status_color != expected_color)
+    assert not mismatch.any(), \
+        f"Status mismatch: {[case[3] for case, bad in zip(test_cases, mismatch) if bad]}"
 
 
 def test_status_determination_symmetry():
@@ -142,20 +163,16 @@ def test_status_determination_symmetry():
     1. Same magnitude errors give same status regardless of sign
     2. Threshold applies equally to positive and negative errors
     """
-    test_errors = [0.0, 10.0, 20.0, 25.0, 30.0, 50.0, 75.0, 100.0]
+    test_errors = np.array([0.0, 10.0, 20.0, 25.0, 30.0, 50.0, 75.0, 100.0])
     
-    for error_magnitude in test_errors:
-        # Test positive error
-        status_pos, color_pos = determine_status(error_magnitude)
-        
-        # Test negative error
-        status_neg, color_neg = determine_status(-error_magnitude)
-        
-        # Verify symmetry
-        assert status_pos == status_neg, \
-            f"Status should be symmetric: +{error_magnitude} gave {status_pos}, -{error_magnitude} gave {status_neg}"
-        assert color_pos == color_neg, \
-            f"Color should be symmetric: +{error_magnitude} gave {color_pos}, -{error_magnitude} gave {color_neg}"
+    # Positive and negative errors of the same magnitudes
+    status_pos, color_pos = determine_status_batch(test_errors)
+    status_neg, color_neg = determine_status_batch(-test_errors)
+    
+    # Verify symmetry
+    asymmetric = (status_pos != status_neg) | (color_pos != color_neg)
+    assert not asymmetric.any(), \
+        f"Status should be symmetric, differs for magnitudes {test_errors[asymmetric]}"
 
 
 def test_status_determination_threshold_precision():
@@ -181,10 +198,13 @@ def test_status_determination_threshold_precision():
         (-24.9999, "STABLE"),
     ]
     
-    for error, expected_status in test_cases:
-        status_text, _ = determine_status(error)
-        assert status_text == expected_status, \
-            f"Error {error} should be {expected_status}, got {status_text}"
+    errors = np.array([case[0] for case in test_cases])
+    expected_status = np.array([case[1] for case in test_cases])
+    
+    status_text, _ = determine_status_batch(errors)
+    mismatch = status_text != expected_status
+    assert not mismatch.any(), \
+        f"Misclassified errors: {errors[mismatch]}"
 
 
 def test_status_determination_with_calculated_errors():
@@ -214,15 +234,16 @@ def test_status_determination_with_calculated_errors():
         (501.0, "STABLE", "1 bar above setpoint"),
     ]
     
-    for pressure, expected_status, description in test_cases:
-        # Calculate error (same as in error calculation test)
-        error = setpoint - pressure
-        
-        # Determine status
-        status_text, _ = determine_status(error)
-        
-        assert status_text == expected_status, \
-            f"{description}: pressure={pressure}, error={error}, expected {expected_status}, got {status_text}"
+    pressures = np.array([case[0] for case in test_cases])
+    expected_status = np.array([case[1] for case in test_cases])
+    
+    # Calculate errors (same as in error calculation test), then statuses
+    errors = setpoint - pressures
+    status_text, _ = determine_status_batch(errors)
+    
+    mismatch = status_text != expected_status
+    assert not mismatch.any(), \
+        f"Status mismatch: {[case[2] for case, bad in zip(test_cases, mismatch) if bad]}"
 
 
 def test_status_determination_color_mapping():
@@ -249,6 +270,11 @@ def test_status_determination_color_mapping():
                 f"WARNING status should have red color, got {status_color} (error={error})"
         else:
             pytest.fail(f"Unexpected status text: {status_text} (error={error})")
+    
+    # The array helper used by the table tests agrees with the scalar one
+    batch_text, batch_color = determine_status_batch(np.array(test_errors, dtype=float))
+    assert batch_text.tolist() == [determine_status(e)[0] for e in test_errors]
+    assert batch_color.tolist() == [determine_status(e)[1] for e in test_errors]
 
 
 def test_status_determination_requirements_compliance():
@@ -262,22 +288,20 @@ def test_status_determination_requirements_compliance():
     THE Dashboard SHALL display "WARNING" status in red
     """
     # Requirement 5.2: |error| <= 25 bar -> STABLE (green)
-    stable_errors = [0.0, 10.0, 20.0, 25.0, -10.0, -20.0, -25.0]
-    for error in stable_errors:
-        status_text, status_color = determine_status(error)
-        assert status_text == "STABLE", \
-            f"Requirement 5.2 violation: |{error}| <= 25 should be STABLE, got {status_text}"
-        assert status_color == "green", \
-            f"Requirement 5.2 violation: STABLE should be green, got {status_color}"
+    stable_errors = np.array([0.0, 10.0, 20.0, 25.0, -10.0, -20.0, -25.0])
+    status_text, status_color = determine_status_batch(stable_errors)
+    assert (status_text == "STABLE").all(), \
+        f"Requirement 5.2 violation: not STABLE for {stable_errors[status_text != 'STABLE']}"
+    assert (status_color == "green").all(), \
+        "Requirement 5.2 violation: STABLE should be green"
     
     # Requirement 5.3: |error| > 25 bar -> WARNING (red)
-    warning_errors = [25.01, 30.0, 50.0, 100.0, -25.01, -30.0, -50.0, -100.0]
-    for error in warning_errors:
-        status_text, status_color = determine_status(error)
-        assert status_text == "WARNING", \
-            f"Requirement 5.3 violation: |{error}| > 25 should be WARNING, got {status_text}"
-        assert status_color == "red", \
-            f"Requirement 5.3 violation: WARNING should be red, got {status_color}"
+    warning_errors = np.array([25.01, 30.0, 50.0, 100.0, -25.01, -30.0, -50.0, -100.0])
+    status_text, status_color = determine_status_batch(warning_errors)
+    assert (status_text == "WARNING").all(), \
+        f"Requirement 5.3 violation: not WARNING for {warning_errors[status_text != 'WARNING']}"
+    assert (status_color == "red").all(), \
+        "Requirement 5.3 violation: WARNING should be red"
 
 
 if __name__ == "__main__":
@@ -0,0 +1,64 @@
+"""
+Valve Model Unit Tests
+
+Validates valve mechanical parameters against documentation.
+References:
+- docs/industrial_pressure_control_system_design.md (Section 1.1, 1.2)
+- docs/numerical_state_space_and_simulation_specification.md (Section 1.1)
+"""
+
+import io
+import unittest
+import sys
+import os
+from contextlib import redirect_stdout
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from models.valve_model import ValveModel, J_VALVE, TAU_LOAD_TOTAL
+from config.system_parameters import params
+
+
+class TestValveModel(unittest.TestCase):
+    """
+    Unit tests for ValveModel class.
+    """
+    
+    def setUp(self):
+        """
+        Set up test fixtures.
+        """
+        self.valve = ValveModel()
+    
+    def test_computed_parameters(self):
+        """
+        Test J_valve = 6.125 kg·m², τg = 343.35 Nm and τ_load = 463.35 Nm.
+        """
+        self.assertAlmostEqual(self.valve.compute_inertia(), 6.125, places=9)
+        self.assertAlmostEqual(self.valve.compute_gravitational_torque(), 343.35, places=9)
+        self.assertAlmostEqual(self.valve.compute_total_load_torque(), 463.35, places=9)
+        
+        print("✓ Valve parameters match documentation")
+    
+    def test_constants_match_parameter_authority(self):
+        """
+        Test that the module constants agree with config.system_parameters.
+        """
+        self.assertAlmostEqual(J_VALVE, params.J_valve, places=12)
+        self.assertAlmostEqual(TAU_LOAD_TOTAL, params.tau_load_total, places=12)
+        
+        print("✓ Valve constants match parameter authority")
+    
+    def test_validate_parameters_silent(self):
+        """
+        Test that validate_parameters(verbose=False) checks without printing.
+        """
+        out = io.StringIO()
+        with redirect_stdout(out):
+            self.valve.validate_parameters(verbose=False)
+        self.assertEqual(out.getvalue(), "")
+        
+        print("✓ Silent validation prints nothing")
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)